@@ -1,7 +1,25 @@
 import numpy as np
+import numba as nb
+import inspect
 import time
-from typing import Tuple, List, Optional, Union
+from contextlib import contextmanager
+from math import prod
+from typing import Any, Callable, Dict, Tuple, List, Optional, Union
 import speedystats
+from speedystats.parallel import kernel_threads
+from speedystats.routing import (
+    KERNEL_MAP,
+    HAS_Q_PARAM,
+    INTERPOLATION_RANGES,
+    get_max_dims,
+    get_keep_axes,
+    get_contiguous_statistic,
+)
+from speedystats.numba.contiguous import (
+    contiguous_shape,
+    get_contiguous,
+    get_contiguous_tasks,
+)
 from dataclasses import dataclass
 from tabulate import tabulate
 from argparse import ArgumentParser
@@ -129,6 +147,338 @@ def run_benchmarks(method: str) -> List[BenchmarkResult]:
     return results
 
 
+@dataclass
+class OverheadResult:
+    method: str
+    num_elements: int
+    layout: str
+    axis: Union[int, Tuple[int, ...]]
+    total_time: float
+    dispatch_time: float
+    reshape_time: float
+    startup_time: float
+    kernel_time: float
+
+
+def get_overhead_shape(num_elements: int) -> Tuple[int, int, int]:
+    """A roughly cubic 3D shape with (about) num_elements elements"""
+    side = max(round(num_elements ** (1 / 3)), 1)
+    return side, side, max(num_elements // (side * side), 1)
+
+
+def get_param_kwargs(method: str, q: Optional[float] = None) -> Dict[str, Any]:
+    """Keyword arguments giving a method its scalar parameter, if it has one.
+
+    Quantiles and percentiles get q, or the median if q is None. Other
+    parameters (like the proportion of trim_mean) keep their default.
+    """
+    if not HAS_Q_PARAM.get(method, False):
+        return {}
+    if method in INTERPOLATION_RANGES:
+        return {"q": INTERPOLATION_RANGES[method] / 2 if q is None else q}
+    param = list(inspect.signature(getattr(speedystats, method)).parameters.values())
+    return {param[3].name: param[3].default}
+
+
+@nb.njit(parallel=True, nogil=True)
+def _empty_region(out: np.ndarray) -> None:
+    for i in nb.prange(out.size):
+        out[i] = i
+
+
+def _best_time(func: Callable[[], object], n_repeats: int) -> float:
+    """Fastest of n_repeats calls, which is the least noisy estimate of the cost"""
+    func()
+    times = []
+    for _ in range(n_repeats):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def benchmark_overhead(
+    data: np.ndarray,
+    method: str,
+    axis: Union[int, Tuple[int, ...]],
+    q: Optional[float] = None,
+    n_repeats: int = 5,
+) -> Optional[Tuple[float, float, float, float, float]]:
+    """Split the time of a speedystats call into its stages.
+
+    Each stage is timed on its own, the same way _call_speedystat runs it:
+    the reshape (a copy when the reduced axes can't be flattened in place),
+    the start up of a parallel region on the threads the call uses, and the
+    kernel itself. Dispatch is whatever the end-to-end call spends beyond
+    these (argument handling, routing and the thread context). Methods taking
+    q get it from get_param_kwargs.
+
+    Returns:
+        (total, dispatch, reshape, startup, kernel) times in seconds, or None
+        if the call doesn't reach a kernel (e.g. it goes to numpy)
+    """
+    keep_axes = get_keep_axes(axis, data.ndim)
+    if not keep_axes or any(k >= get_max_dims() for k in keep_axes):
+        return None
+    speedystat_func = getattr(speedystats, method)
+    q_kwargs = get_param_kwargs(method, q)
+    q_args = tuple(q_kwargs.values())
+
+    # Stages of the contiguous path (where the reshape is always a free view)
+    statistic = get_contiguous_statistic(method)
+    shape = None if statistic is None else contiguous_shape(data, keep_axes)
+    if shape is not None:
+        num_tasks = get_contiguous_tasks(shape)
+        reshape = lambda: data
+        kernel = lambda prepared: get_contiguous(prepared, shape, statistic)
+
+    # Stages of the generated kernels
+    else:
+        num_tasks = prod(data.shape[k] for k in keep_axes)
+        new_shape = data.shape[: keep_axes[-1] + 1]
+        if data.ndim > keep_axes[-1] + 1:
+            new_shape += (-1,)
+        reshape = lambda: np.reshape(data, new_shape)
+        func = KERNEL_MAP[method][keep_axes]
+        kernel = lambda prepared: func(prepared, *q_args)
+
+    # Threads the call runs on (as chosen by kernel_threads)
+    with kernel_threads(num_tasks, data.size):
+        num_threads = nb.get_num_threads()
+
+    prepared = reshape()
+    region = np.empty(num_threads)
+    total = _best_time(lambda: speedystat_func(data, axis=axis, **q_kwargs), n_repeats)
+    reshape_time = _best_time(reshape, n_repeats)
+    with speedystats.threads(num_threads):
+        startup = _best_time(lambda: _empty_region(region), n_repeats)
+        kernel_time = _best_time(lambda: kernel(prepared), n_repeats)
+
+    # The kernel time includes the start up of its parallel region
+    compute = max(kernel_time - startup, 0.0)
+    dispatch = max(total - reshape_time - kernel_time, 0.0)
+    return total, dispatch, reshape_time, startup, compute
+
+
+def run_overhead_benchmarks(
+    methods: List[str],
+    max_elements: int = 10**9,
+    q: Optional[float] = None,
+    n_repeats: int = 5,
+) -> List[OverheadResult]:
+    """Break down the time of each method, across array sizes from 10 elements up.
+
+    Each size is reduced on a C-ordered and an F-ordered array (where
+    flattening the reduced axes needs a copy), along the first axis, the last
+    axis and the last two axes.
+    """
+    sizes = [10**k for k in range(1, 10) if 10**k <= max_elements]
+    axes_to_test = [0, 2, (1, 2)]
+
+    results = []
+    for num_elements in sizes:
+        shape = get_overhead_shape(num_elements)
+        print(f"Benchmarking overhead on {shape} ({prod(shape)} elements)")
+        data = np.random.randn(*shape)
+        for layout in ["C", "F"]:
+            if layout == "F":
+                data = np.asfortranarray(data)
+            for method in methods:
+                for axis in axes_to_test:
+                    times = benchmark_overhead(data, method, axis, q, n_repeats)
+                    if times is None:
+                        continue
+                    results.append(
+                        OverheadResult(method, data.size, layout, axis, *times)
+                    )
+        del data
+
+    return results
+
+
+def display_overhead_results(results: List[OverheadResult]):
+    """Display the stages of each call in a formatted table (times in us)"""
+    table_data = [
+        [
+            r.method,
+            r.num_elements,
+            r.layout,
+            str(r.axis),
+            f"{r.total_time*1e6:.1f}",
+            f"{r.dispatch_time*1e6:.1f}",
+            f"{r.reshape_time*1e6:.1f}",
+            f"{r.startup_time*1e6:.1f}",
+            f"{r.kernel_time*1e6:.1f}",
+        ]
+        for r in results
+    ]
+
+    headers = [
+        "Method",
+        "Elements",
+        "Layout",
+        "Axis",
+        "Total (us)",
+        "Dispatch (us)",
+        "Reshape (us)",
+        "Startup (us)",
+        "Kernel (us)",
+    ]
+    print(tabulate(table_data, headers=headers, tablefmt="grid"))
+
+
+@dataclass
+class ScalingResult:
+    method: str
+    array_name: str
+    axis: Union[int, Tuple[int, ...]]
+    num_elements: int
+    num_threads: int
+    time: float
+    speedup: float
+    efficiency: float
+
+
+def get_thread_counts(max_threads: Optional[int] = None) -> List[int]:
+    """1, 2, 4, ... up to (and including) the size of numba's thread pool"""
+    max_threads = max_threads or nb.config.NUMBA_NUM_THREADS
+    counts = [1]
+    while counts[-1] * 2 < max_threads:
+        counts.append(counts[-1] * 2)
+    if max_threads > 1:
+        counts.append(max_threads)
+    return counts
+
+
+@contextmanager
+def uncapped_threads():
+    """Let small calls use every thread requested (kernel_threads normally caps
+    them by the amount of work), so the scaling of small calls can be measured"""
+    previous = speedystats.parallel.MIN_ELEMENTS_PER_THREAD
+    speedystats.parallel.MIN_ELEMENTS_PER_THREAD = 1
+    try:
+        yield
+    finally:
+        speedystats.parallel.MIN_ELEMENTS_PER_THREAD = previous
+
+
+def run_scaling_benchmarks(
+    methods: List[str],
+    max_threads: Optional[int] = None,
+    q: Optional[float] = None,
+    n_repeats: int = 5,
+) -> List[ScalingResult]:
+    """Time each method on each array config and axis at 1, 2, 4, ... threads.
+
+    The speedup at t threads is T(1) / T(t), and the strong-scaling efficiency
+    is the speedup divided by t (1.0 is perfect scaling). Methods taking q get
+    it from get_param_kwargs.
+    """
+    thread_counts = get_thread_counts(max_threads)
+    configs = [c for c in get_array_configs() if len(c.shape) == 2]
+    configs += [c for c in get_array_configs() if len(c.shape) == 3]
+    axes_to_test = {2: [0, 1], 3: [0, 2, (1, 2)]}
+
+    results = []
+    for i, config in enumerate(configs, 1):
+        print(f"Benchmarking scaling on {config.name} ({i}/{len(configs)})")
+        data = np.random.randn(*config.shape)
+        for method in methods:
+            speedystat_func = getattr(speedystats, method)
+            kwargs = get_param_kwargs(method, q)
+            for axis in axes_to_test[data.ndim]:
+                times = {}
+                with uncapped_threads():
+                    for num_threads in thread_counts:
+                        times[num_threads] = _best_time(
+                            lambda: speedystat_func(
+                                data, axis=axis, num_threads=num_threads, **kwargs
+                            ),
+                            n_repeats,
+                        )
+                for num_threads, t in times.items():
+                    speedup = times[1] / t
+                    results.append(
+                        ScalingResult(
+                            method=method,
+                            array_name=config.name,
+                            axis=axis,
+                            num_elements=data.size,
+                            num_threads=num_threads,
+                            time=t,
+                            speedup=speedup,
+                            efficiency=speedup / num_threads,
+                        )
+                    )
+        del data
+
+    return results
+
+
+def suggest_min_elements_per_thread(
+    results: List[ScalingResult], min_efficiency: float = 0.5
+) -> Optional[int]:
+    """Fewest elements per thread above which every call kept min_efficiency.
+
+    This is a suggestion for speedystats.parallel.MIN_ELEMENTS_PER_THREAD on
+    the machine the results come from (None if no call ran on several threads).
+    """
+    points = sorted(
+        (
+            (r.num_elements // r.num_threads, r.efficiency)
+            for r in results
+            if r.num_threads > 1
+        ),
+        reverse=True,
+    )
+    suggestion = None
+    for elements_per_thread, efficiency in points:
+        if efficiency < min_efficiency:
+            break
+        suggestion = elements_per_thread
+    if suggestion is None and points:
+        suggestion = points[0][0]
+    return suggestion
+
+
+def display_scaling_results(results: List[ScalingResult]):
+    """Display the speedup and efficiency at each thread count"""
+    table_data = [
+        [
+            r.method,
+            r.array_name,
+            str(r.axis),
+            r.num_threads,
+            r.num_elements // r.num_threads,
+            f"{r.time*1000:.3f}",
+            f"{r.speedup:.2f}x",
+            f"{r.efficiency:.0%}",
+        ]
+        for r in results
+    ]
+
+    headers = [
+        "Method",
+        "Array",
+        "Axis",
+        "Threads",
+        "Elements/thread",
+        "Time (ms)",
+        "Speedup",
+        "Efficiency",
+    ]
+    print(tabulate(table_data, headers=headers, tablefmt="grid"))
+
+    # Where parallel overhead dominates (efficiency below 50%)
+    suggestion = suggest_min_elements_per_thread(results)
+    if suggestion is not None:
+        print(
+            f"Every call with at least {suggestion} elements per thread kept 50% "
+            f"efficiency (speedystats uses MIN_ELEMENTS_PER_THREAD = "
+            f"{speedystats.parallel.MIN_ELEMENTS_PER_THREAD})"
+        )
+
+
 def display_results(results: List[BenchmarkResult]):
     """Display benchmark results in a formatted table"""
     table_data = [
@@ -156,7 +506,45 @@ def display_results(results: List[BenchmarkResult]):
 
 if __name__ == "__main__":
     parser = ArgumentParser()
-    parser.add_argument("method", default="mean", type=str, help="Method to benchmark")
+    parser.add_argument(
+        "method", default="mean", type=str, nargs="+", help="Method(s) to benchmark"
+    )
+    parser.add_argument(
+        "--overhead",
+        action="store_true",
+        help="Break each call down into dispatch, reshape, thread start up and kernel",
+    )
+    parser.add_argument(
+        "--max-elements",
+        default=10**9,
+        type=float,
+        help="Largest array to break down (--overhead)",
+    )
+    parser.add_argument(
+        "--scaling",
+        action="store_true",
+        help="Time each case at 1, 2, 4, ... threads and report the efficiency",
+    )
+    parser.add_argument(
+        "--max-threads",
+        default=None,
+        type=int,
+        help="Most threads to scale to (--scaling, default: numba's thread pool)",
+    )
+    parser.add_argument(
+        "--q",
+        default=None,
+        type=float,
+        help="q for quantile / percentile methods (default: the median)",
+    )
     args = parser.parse_args()
-    results = run_benchmarks(args.method)
-    display_results(results)
+    if args.overhead:
+        results = run_overhead_benchmarks(args.method, int(args.max_elements), args.q)
+        display_overhead_results(results)
+    elif args.scaling:
+        results = run_scaling_benchmarks(args.method, args.max_threads, args.q)
+        display_scaling_results(results)
+    else:
+        for method in args.method:
+            results = run_benchmarks(method)
+            display_results(results)
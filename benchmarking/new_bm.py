@@ -2,8 +2,14 @@ import numpy as np
 from typing import List, Tuple, Dict, Optional
 from dataclasses import dataclass
 from itertools import combinations, product
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
 import json
+import resource
+import sys
+import threading
 import time
+import tracemalloc
 from pathlib import Path
 import pandas as pd
 from sklearn.ensemble import RandomForestRegressor
@@ -27,6 +33,84 @@ class BenchmarkResult:
     speedystat_time: float
     speedup: float
     method: str
+    array_nbytes: int
+    # Memory used by a call beyond its input (see measure_memory), if measured
+    numpy_peak_rss: Optional[int] = None
+    speedystat_peak_rss: Optional[int] = None
+    numpy_traced_peak: Optional[int] = None
+    speedystat_traced_peak: Optional[int] = None
+    memory_ratio: Optional[float] = None
+
+
+def _current_rss() -> int:
+    """Resident set size of this process in bytes (0 where /proc isn't available)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * resource.getpagesize()
+    except OSError:
+        return 0
+
+
+def _max_rss() -> int:
+    """Peak resident set size of this process so far, in bytes."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _measure_call(
+    library: str, method: str, shape: Tuple[int, ...], axes: Tuple[int, ...]
+) -> Dict[str, int]:
+    """Memory used by one call, beyond its input (runs in a fresh process).
+
+    The peak RSS is sampled from /proc every 0.5ms on a background thread (the
+    kernels release the GIL) and checked against the process's maxrss, so it
+    includes the kernels' own allocations. tracemalloc only sees the
+    allocations numpy reports (its arrays, including temporaries), but sees
+    them exactly.
+    """
+    module = np if library == "numpy" else speedystats
+    func = getattr(module, method)
+
+    # Compile (or load) the kernels on a small array first, so that only the
+    # memory of the call itself is measured
+    func(np.random.randn(*[5] * len(shape)), axis=axes)
+    data = np.random.randn(*shape)
+
+    baseline = _current_rss()
+    peak = baseline
+    max_rss_before = _max_rss()
+    done = threading.Event()
+
+    def sample():
+        nonlocal peak
+        while not done.is_set():
+            peak = max(peak, _current_rss())
+            time.sleep(0.0005)
+
+    sampler = threading.Thread(target=sample)
+    sampler.start()
+    tracemalloc.start()
+    try:
+        func(data, axis=axes)
+        _, traced_peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        done.set()
+        sampler.join()
+
+    max_rss_after = _max_rss()
+    if max_rss_after > max_rss_before:
+        peak = max(peak, max_rss_after)
+    return {"peak_rss": max(peak - baseline, 0), "traced_peak": traced_peak}
+
+
+def measure_memory(
+    library: str, method: str, shape: Tuple[int, ...], axes: Tuple[int, ...]
+) -> Dict[str, int]:
+    """Measure the memory of one call in a fresh process, so earlier peaks don't hide it."""
+    with ProcessPoolExecutor(1, mp_context=get_context("spawn")) as pool:
+        return pool.submit(_measure_call, library, method, shape, axes).result()
 
 
 class SmartBenchmarker:
@@ -48,6 +132,7 @@ class SmartBenchmarker:
         n_repeats: int = 5,
         methods: Optional[List[str]] = None,
         results_dir: str = "benchmark_results",
+        measure_memory: bool = False,
     ):
         self.max_dims = max_dims
         self.max_gb = max_gb
@@ -58,6 +143,7 @@ class SmartBenchmarker:
         self.methods = methods or ["mean", "median", "std"]
         self.results_dir = Path(results_dir)
         self.results_dir.mkdir(exist_ok=True)
+        self.measure_memory = measure_memory
 
         self.bytes_per_element = 8
         self.max_bytes = self.max_gb * 1024**3
@@ -141,6 +227,22 @@ class SmartBenchmarker:
                 _ = speedystat_func(data, axis=axes)
                 speedystat_times.append(time.perf_counter() - start)
 
+            memory = {}
+            if self.measure_memory:
+                numpy_memory = measure_memory("numpy", method, shape, axes)
+                speedystat_memory = measure_memory("speedystats", method, shape, axes)
+                memory = {
+                    "numpy_peak_rss": numpy_memory["peak_rss"],
+                    "speedystat_peak_rss": speedystat_memory["peak_rss"],
+                    "numpy_traced_peak": numpy_memory["traced_peak"],
+                    "speedystat_traced_peak": speedystat_memory["traced_peak"],
+                    "memory_ratio": (
+                        speedystat_memory["peak_rss"] / numpy_memory["peak_rss"]
+                        if numpy_memory["peak_rss"] > 0
+                        else None
+                    ),
+                }
+
             return BenchmarkResult(
                 shape=shape,
                 axes=axes,
@@ -153,6 +255,7 @@ class SmartBenchmarker:
                 speedup=np.mean(numpy_times) / np.mean(speedystat_times),
                 method=method,
                 array_nbytes=np.prod(shape) * self.bytes_per_element,
+                **memory,
             )
 
         except Exception as e:
@@ -163,7 +266,7 @@ class SmartBenchmarker:
 
     def run_benchmarks(self) -> List[BenchmarkResult]:
         """Run benchmarks sequentially to ensure accurate Numba timing."""
-        shapes = self.generate_shape_samples()
+        shapes = self.generate_shapes()
         axes_combinations = {
             shape: self.generate_axes_combinations(len(shape)) for shape in shapes
         }
@@ -260,11 +363,12 @@ class SmartBenchmarker:
             "feature_importance": dict(zip(feature_names, model.feature_importances_)),
             "benchmark_metadata": {
                 "max_dims": self.max_dims,
-                "min_size": self.min_size,
-                "max_size": self.max_size,
-                "n_samples": self.n_samples,
+                "max_gb": self.max_gb,
+                "shape_log_base": self.shape_log_base,
+                "shape_power_range": self.shape_power_range,
                 "n_repeats": self.n_repeats,
                 "methods": self.methods,
+                "measure_memory": self.measure_memory,
             },
         }
 
@@ -289,6 +393,26 @@ def analyze_results(results_dir: str):
     print(f"Average speedup: {results['speedup'].mean():.2f}x")
     print(f"Median speedup: {results['speedup'].median():.2f}x")
 
+    # Memory used beyond the input, as a fraction of the input size
+    if (
+        results.get("speedystat_peak_rss") is not None
+        and results["speedystat_peak_rss"].notna().any()
+    ):
+        print("\nMemory overhead (peak RSS beyond the input / input size):")
+        for method in results["method"].unique():
+            method_results = results[results["method"] == method]
+            numpy_overhead = (
+                method_results["numpy_peak_rss"] / method_results["array_nbytes"]
+            )
+            speedystat_overhead = (
+                method_results["speedystat_peak_rss"] / method_results["array_nbytes"]
+            )
+            print(
+                f"{method}: numpy {numpy_overhead.median():.2f}x, "
+                f"speedystats {speedystat_overhead.median():.2f}x "
+                f"(max {speedystat_overhead.max():.2f}x)"
+            )
+
     # Print feature importance
     print("\nFeature Importance:")
     for feature, importance in sorted(
@@ -314,7 +438,7 @@ def analyze_results(results_dir: str):
 
 
 if __name__ == "__main__":
-    # Example usage
+    # Example usage (--memory also measures the memory of every call)
     benchmarker = SmartBenchmarker(
         max_dims=3,
         max_gb=16,
@@ -323,6 +447,7 @@ if __name__ == "__main__":
         shape_power_step=1,
         n_repeats=5,
         methods=["mean", "median", "std"],
+        measure_memory="--memory" in sys.argv,
     )
 
     benchmarker.run_complete_benchmark()
@@ -0,0 +1,354 @@
+"""Performance regression suite with stored baselines.
+
+Runs a fixed matrix of cases (method x shape x axis x dtype x layout), and
+writes the timings to a JSON file tagged with the machine and library versions
+that produced them. Results are compared against a baseline from the same
+machine (e.g. the release currently deployed), and the script exits non-zero
+if any case is slower by more than a threshold.
+
+Usage:
+    python benchmarking/regression.py run --output baseline.json
+    python benchmarking/regression.py run --baseline baseline.json
+    python benchmarking/regression.py compare current.json baseline.json
+"""
+
+import numpy as np
+import numba as nb
+import json
+import os
+import platform
+import sys
+import time
+from argparse import ArgumentParser
+from dataclasses import dataclass, asdict
+from datetime import datetime, timezone
+from itertools import product
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+import speedystats
+
+# Fixed benchmark matrix (changing it invalidates stored baselines)
+METHODS = ["sum", "mean", "std", "nanmean", "median", "nanmedian", "max"]
+SHAPES = [(100, 100), (1000, 1000), (4000, 4000), (100, 100, 100), (200, 200, 200)]
+AXES = {2: [0, 1], 3: [0, 2, (1, 2)]}
+DTYPES = ["float64", "float32"]
+LAYOUTS = ["C", "F"]
+
+# Smaller matrix for quick checks (e.g. before every commit)
+QUICK_SHAPES = [(100, 100), (1000, 1000), (100, 100, 100)]
+
+# Number of bootstrap resamples for the confidence intervals
+NUM_BOOTSTRAP = 2000
+
+RESULTS_FORMAT = 1
+
+
+@dataclass
+class CaseResult:
+    method: str
+    shape: Tuple[int, ...]
+    axis: Union[int, Tuple[int, ...]]
+    dtype: str
+    layout: str
+    times: List[float]
+    median: float
+    ci_low: float
+    ci_high: float
+
+    @property
+    def key(self) -> str:
+        return case_key(self.method, self.shape, self.axis, self.dtype, self.layout)
+
+
+@dataclass
+class Comparison:
+    key: str
+    baseline_median: float
+    current_median: float
+    ratio: float
+    ratio_low: float
+    ratio_high: float
+    regressed: bool
+    improved: bool
+
+
+def case_key(
+    method: str,
+    shape: Tuple[int, ...],
+    axis: Union[int, Tuple[int, ...]],
+    dtype: str,
+    layout: str,
+) -> str:
+    """Identifier of a case, which is stable across runs"""
+    shape = "x".join(str(n) for n in shape)
+    return f"{method}/{shape}/axis={axis}/{dtype}/{layout}"
+
+
+def get_machine_tag() -> Dict[str, object]:
+    """Description of the machine and software a run was made on"""
+    return {
+        "hostname": platform.node(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "num_threads": nb.get_num_threads(),
+        "threading_layer": nb.config.THREADING_LAYER,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "numba": nb.__version__,
+        "speedystats": speedystats.__version__,
+    }
+
+
+def get_cases(quick: bool = False) -> List[Tuple]:
+    """All (method, shape, axis, dtype, layout) cases of the matrix"""
+    shapes = QUICK_SHAPES if quick else SHAPES
+    cases = []
+    for shape in shapes:
+        for axis, dtype, layout, method in product(
+            AXES[len(shape)], DTYPES, LAYOUTS, METHODS
+        ):
+            cases.append((method, shape, axis, dtype, layout))
+    return cases
+
+
+def bootstrap_median(
+    times: np.ndarray,
+    confidence: float = 0.95,
+    rng: Optional[np.random.Generator] = None,
+) -> Tuple[float, float]:
+    """Bootstrap confidence interval of the median of times"""
+    rng = np.random.default_rng(0) if rng is None else rng
+    samples = rng.choice(times, size=(NUM_BOOTSTRAP, times.size), replace=True)
+    medians = np.median(samples, axis=1)
+    alpha = (1 - confidence) / 2
+    return float(np.quantile(medians, alpha)), float(np.quantile(medians, 1 - alpha))
+
+
+def bootstrap_ratio(
+    current: np.ndarray,
+    baseline: np.ndarray,
+    confidence: float = 0.95,
+    rng: Optional[np.random.Generator] = None,
+) -> Tuple[float, float]:
+    """Bootstrap confidence interval of median(current) / median(baseline)"""
+    rng = np.random.default_rng(0) if rng is None else rng
+    current = rng.choice(current, size=(NUM_BOOTSTRAP, current.size), replace=True)
+    baseline = rng.choice(baseline, size=(NUM_BOOTSTRAP, baseline.size), replace=True)
+    ratios = np.median(current, axis=1) / np.median(baseline, axis=1)
+    alpha = (1 - confidence) / 2
+    return float(np.quantile(ratios, alpha)), float(np.quantile(ratios, 1 - alpha))
+
+
+def benchmark_case(
+    method: str,
+    shape: Tuple[int, ...],
+    axis: Union[int, Tuple[int, ...]],
+    dtype: str,
+    layout: str,
+    n_repeats: int = 20,
+    min_time: float = 1e-3,
+) -> CaseResult:
+    """Time one case, with enough calls per repeat to take at least min_time"""
+    rng = np.random.default_rng(42)
+    data = rng.standard_normal(shape).astype(dtype)
+    if layout == "F":
+        data = np.asfortranarray(data)
+    func = getattr(speedystats, method)
+
+    # Warm up (compiling the kernel) and pick the number of calls per repeat
+    func(data, axis=axis)
+    start = time.perf_counter()
+    func(data, axis=axis)
+    single = time.perf_counter() - start
+    number = max(int(min_time / max(single, 1e-9)), 1)
+
+    times = []
+    for _ in range(n_repeats):
+        start = time.perf_counter()
+        for _ in range(number):
+            func(data, axis=axis)
+        times.append((time.perf_counter() - start) / number)
+
+    ci_low, ci_high = bootstrap_median(np.array(times))
+    return CaseResult(
+        method=method,
+        shape=shape,
+        axis=axis,
+        dtype=dtype,
+        layout=layout,
+        times=times,
+        median=float(np.median(times)),
+        ci_low=ci_low,
+        ci_high=ci_high,
+    )
+
+
+def run_suite(quick: bool = False, n_repeats: int = 20) -> List[CaseResult]:
+    """Run every case of the matrix"""
+    cases = get_cases(quick)
+    results = []
+    for i, case in enumerate(cases, 1):
+        result = benchmark_case(*case, n_repeats=n_repeats)
+        print(f"[{i}/{len(cases)}] {result.key}: {result.median*1e6:.1f} us")
+        results.append(result)
+    return results
+
+
+def save_results(path: Union[str, Path], results: List[CaseResult]) -> None:
+    """Write results to a JSON file, tagged with the machine they ran on"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "format": RESULTS_FORMAT,
+        "created": datetime.now(timezone.utc).isoformat(),
+        "machine": get_machine_tag(),
+        "results": [asdict(r) for r in results],
+    }
+    with open(path, "w") as f:
+        json.dump(payload, f, indent=2)
+
+
+def load_results(path: Union[str, Path]) -> Tuple[Dict, Dict[str, CaseResult]]:
+    """Read a JSON file of results, returning its machine tag and results by key"""
+    with open(path) as f:
+        payload = json.load(f)
+    if payload.get("format") != RESULTS_FORMAT:
+        raise ValueError(f"{path} has an unsupported results format")
+    results = {}
+    for r in payload["results"]:
+        r["shape"] = tuple(r["shape"])
+        if isinstance(r["axis"], list):
+            r["axis"] = tuple(r["axis"])
+        result = CaseResult(**r)
+        results[result.key] = result
+    return payload["machine"], results
+
+
+def compare_results(
+    current: Dict[str, CaseResult],
+    baseline: Dict[str, CaseResult],
+    threshold: float = 0.1,
+    confidence: float = 0.95,
+) -> List[Comparison]:
+    """Compare the cases present in both runs.
+
+    A case has regressed when the whole confidence interval of the ratio of its
+    median times (current / baseline) lies above 1 + threshold, so noisy cases
+    aren't flagged on the strength of a single slow repeat. Improvements are
+    flagged symmetrically.
+    """
+    rng = np.random.default_rng(0)
+    comparisons = []
+    for key in sorted(current.keys() & baseline.keys()):
+        now, then = current[key], baseline[key]
+        ratio_low, ratio_high = bootstrap_ratio(
+            np.array(now.times), np.array(then.times), confidence, rng
+        )
+        comparisons.append(
+            Comparison(
+                key=key,
+                baseline_median=then.median,
+                current_median=now.median,
+                ratio=now.median / then.median,
+                ratio_low=ratio_low,
+                ratio_high=ratio_high,
+                regressed=ratio_low > 1 + threshold,
+                improved=ratio_high < 1 / (1 + threshold),
+            )
+        )
+    return comparisons
+
+
+def report(
+    comparisons: List[Comparison],
+    current_machine: Dict,
+    baseline_machine: Dict,
+    num_current: int,
+    num_baseline: int,
+) -> bool:
+    """Print a comparison, returning whether any case regressed"""
+    # Timings are only comparable on the same hardware and thread count
+    for field in ["machine", "processor", "cpu_count", "num_threads"]:
+        if current_machine.get(field) != baseline_machine.get(field):
+            print(
+                f"WARNING: {field} differs from the baseline "
+                f"({current_machine.get(field)} vs {baseline_machine.get(field)})"
+            )
+    if len(comparisons) < max(num_current, num_baseline):
+        print(
+            f"WARNING: only {len(comparisons)} cases are in both runs "
+            f"({num_current} current, {num_baseline} baseline)"
+        )
+
+    regressions = [c for c in comparisons if c.regressed]
+    improvements = [c for c in comparisons if c.improved]
+    for title, cases in [("Regressions", regressions), ("Improvements", improvements)]:
+        if not cases:
+            continue
+        print(f"\n{title}:")
+        for c in sorted(cases, key=lambda c: c.ratio, reverse=True):
+            print(
+                f"  {c.key}: {c.baseline_median*1e6:.1f} -> "
+                f"{c.current_median*1e6:.1f} us ({c.ratio:.2f}x, "
+                f"CI {c.ratio_low:.2f}-{c.ratio_high:.2f})"
+            )
+    print(
+        f"\n{len(regressions)} regressions and {len(improvements)} improvements "
+        f"in {len(comparisons)} cases "
+        f"(speedystats {baseline_machine.get('speedystats')} -> "
+        f"{current_machine.get('speedystats')})"
+    )
+    return bool(regressions)
+
+
+def default_output() -> Path:
+    """Machine-tagged results path, e.g. regression_results/node1-20240101T120000.json"""
+    stamp = datetime.now().strftime("%Y%m%dT%H%M%S")
+    return Path("regression_results") / f"{platform.node()}-{stamp}.json"
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Run the benchmark matrix")
+    run_parser.add_argument("--output", type=str, default=None, help="Results file")
+    run_parser.add_argument("--baseline", type=str, default=None, help="Compare to")
+    run_parser.add_argument("--quick", action="store_true", help="Small matrix")
+    run_parser.add_argument("--repeats", type=int, default=20, help="Repeats per case")
+
+    compare_parser = subparsers.add_parser("compare", help="Compare two results")
+    compare_parser.add_argument("current", type=str, help="Results file")
+    compare_parser.add_argument("baseline", type=str, help="Baseline results file")
+
+    for subparser in [run_parser, compare_parser]:
+        subparser.add_argument(
+            "--threshold",
+            type=float,
+            default=0.1,
+            help="Slowdown (as a fraction) that counts as a regression",
+        )
+        subparser.add_argument(
+            "--confidence", type=float, default=0.95, help="Confidence level"
+        )
+    args = parser.parse_args()
+
+    if args.command == "run":
+        results = run_suite(args.quick, args.repeats)
+        output = args.output or default_output()
+        save_results(output, results)
+        print(f"Saved {len(results)} results to {output}")
+        if args.baseline is None:
+            sys.exit(0)
+        current_machine, current = load_results(output)
+        baseline_machine, baseline = load_results(args.baseline)
+    else:
+        current_machine, current = load_results(args.current)
+        baseline_machine, baseline = load_results(args.baseline)
+
+    comparisons = compare_results(current, baseline, args.threshold, args.confidence)
+    regressed = report(
+        comparisons, current_machine, baseline_machine, len(current), len(baseline)
+    )
+    sys.exit(1 if regressed else 0)
@@ -3,19 +3,66 @@
 __version__ = "0.0.0"
 
 
-from .speedystats import sum
-from .speedystats import nansum
-from .speedystats import ptp
-from .speedystats import percentile
-from .speedystats import nanpercentile
-from .speedystats import quantile
-from .speedystats import nanquantile
-from .speedystats import median
-from .speedystats import nanmedian
-from .speedystats import average
-from .speedystats import mean
-from .speedystats import nanmean
-from .speedystats import std
-from .speedystats import nanstd
-from .speedystats import var
-from .speedystats import nanvar
+from .speedystats import sum, asum
+from .speedystats import nansum, anansum
+from .speedystats import ptp, aptp
+from .speedystats import percentile, apercentile
+from .speedystats import nanpercentile, ananpercentile
+from .speedystats import quantile, aquantile
+from .speedystats import nanquantile, ananquantile
+from .speedystats import median, amedian
+from .speedystats import nanmedian, ananmedian
+from .speedystats import average, aaverage
+from .speedystats import mean, amean
+from .speedystats import nanmean, ananmean
+from .speedystats import std, astd
+from .speedystats import nanstd, ananstd
+from .speedystats import var, avar
+from .speedystats import nanvar, ananvar
+from .speedystats import min, amin
+from .speedystats import nanmin, ananmin
+from .speedystats import max, amax
+from .speedystats import nanmax, ananmax
+from .speedystats import trim_mean, atrim_mean
+from .speedystats import nantrim_mean, anantrim_mean
+from .speedystats import winsorized_mean, awinsorized_mean
+from .speedystats import nanwinsorized_mean, ananwinsorized_mean
+from .speedystats import median_abs_deviation, amedian_abs_deviation
+from .speedystats import nanmedian_abs_deviation, ananmedian_abs_deviation
+from .speedystats import iqr, aiqr
+from .speedystats import naniqr, ananiqr
+from .cumulative import cumsum
+from .cumulative import nancumsum
+from .cumulative import cumprod
+from .cumulative import nancumprod
+from .cumulative import cummax
+from .cumulative import cummin
+from .cumulative import acumsum
+from .cumulative import anancumsum
+from .cumulative import acumprod
+from .cumulative import anancumprod
+from .cumulative import acummax
+from .cumulative import acummin
+from .parallel import get_num_threads
+from .parallel import set_num_threads
+from .parallel import threads
+from .processes import SharedArray
+from .processes import shutdown_processes
+from .asynchronous import set_async_workers
+from .batching import batch
+from .planning import plan
+from .planning import Plan
+from .calibration import calibrate
+from .calibration import clear_calibration
+from .instrumentation import enable_stats
+from .instrumentation import stats
+from .instrumentation import reset_stats
+from .instrumentation import add_hook
+from .instrumentation import remove_hook
+from .copies import CopyWarning
+from .copies import set_copy_policy
+from .copies import copy_policy
+from .quartiles import quartiles
+from .quartiles import nanquartiles
+from .quartiles import aquartiles
+from .quartiles import ananquartiles
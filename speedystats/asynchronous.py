@@ -0,0 +1,55 @@
+"""Asyncio support: every function has an async "a" variant (amean, anansum...).
+
+The async variants run their synchronous counterpart on a dedicated thread
+pool, so awaiting them doesn't block the event loop. The kernels release the
+GIL (they're compiled with nogil=True), so the event loop and other Python
+threads keep running while they do.
+"""
+
+from typing import Callable
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import functools
+import numba as nb
+
+# Numba's default "workqueue" threading layer can't launch parallel kernels from
+# several threads at once, so by default async calls run one at a time (each on
+# all of numba's threads). With the "tbb" or "omp" layers, more can overlap.
+_num_workers = 1
+_executor = None
+
+
+def get_async_executor() -> ThreadPoolExecutor:
+    """The thread pool that runs the async variants."""
+    global _executor
+    if _executor is None:
+        # Start numba's threads from this thread: if the threading layer is first
+        # launched from a pool thread, the interpreter hangs on exit
+        nb.get_num_threads()
+        _executor = ThreadPoolExecutor(_num_workers, thread_name_prefix="speedystats")
+    return _executor
+
+
+def set_async_workers(num_workers: int) -> None:
+    """Set the number of async calls that can run at the same time.
+
+    Only raise this above 1 with a threadsafe numba threading layer (e.g. set
+    NUMBA_THREADING_LAYER=tbb or omp), since workqueue aborts on concurrent use.
+
+    Args:
+        num_workers: Number of threads in the async thread pool
+    """
+    global _executor, _num_workers
+    if num_workers < 1:
+        raise ValueError(f"num_workers must be at least 1, received: {num_workers}")
+    if _executor is not None:
+        _executor.shutdown(wait=False)
+        _executor = None
+    _num_workers = num_workers
+
+
+async def run_async(func: Callable, *args, **kwargs):
+    """Await func(*args, **kwargs) running on the async thread pool."""
+    loop = asyncio.get_running_loop()
+    call = functools.partial(func, *args, **kwargs)
+    return await loop.run_in_executor(get_async_executor(), call)
@@ -0,0 +1,56 @@
+from typing import Union, Iterable, Optional, Sequence
+import numpy as np
+from . import speedystats
+from .routing import METHOD_MAP
+
+# Reductions that can be batched (the kernel variants, like sum_kahan, are
+# reached through the arguments of their public method instead)
+BATCH_METHODS = tuple(m for m in METHOD_MAP if hasattr(speedystats, m))
+
+
+def batch(
+    method: str,
+    arrays: Union[np.ndarray, Sequence[np.ndarray]],
+    axis: Optional[Union[int, Iterable[int]]] = None,
+    keepdims: bool = False,
+    **kwargs,
+) -> np.ndarray:
+    """Reduce each of many equally-shaped arrays with a single call.
+
+    The arrays are stacked along a new leading axis, which is kept, so the
+    dispatch and the kernel launch are paid once and the kernel parallelizes
+    across arrays. This is much faster than a python loop for small arrays.
+
+    Args:
+        method: Name of the reduction (e.g. "mean", "nanmedian")
+        arrays: Sequence of arrays with the same shape (or one stacked array,
+            whose first axis indexes the arrays)
+        axis: Axis or axes of each array to reduce (default: all of them)
+        keepdims: Whether to keep the reduced axes of each array
+        **kwargs: Other arguments of the reduction (e.g. q, where, num_threads)
+
+    Returns:
+        np.ndarray: The result for each array, stacked along the first axis
+
+    Example:
+        means = speedystats.batch("mean", [x0, x1, x2], axis=1)
+    """
+    if method not in BATCH_METHODS:
+        raise ValueError(f"method must be one of {BATCH_METHODS}, received: {method!r}")
+    if not isinstance(arrays, np.ndarray):
+        arrays = np.stack(arrays)
+    ndim = arrays.ndim - 1
+
+    if axis is None:
+        axis = tuple(range(ndim))
+    elif isinstance(axis, int):
+        axis = (axis,)
+    for a in axis:
+        if not -ndim <= a < ndim:
+            raise ValueError(
+                f"axis {a} is out of bounds for arrays of dimension {ndim}"
+            )
+    batch_axis = tuple(a % ndim + 1 for a in axis)
+
+    func = getattr(speedystats, method)
+    return func(arrays, axis=batch_axis, keepdims=keepdims, **kwargs)
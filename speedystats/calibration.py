@@ -0,0 +1,237 @@
+"""Per-machine calibration of when to hand reductions to numpy.
+
+For small arrays numpy can beat the numba kernels (which pay for dispatch and
+for starting threads), and where the crossover lies depends on the CPU. The
+calibrate function times both on this machine over a grid of output counts and
+reduced lengths, and stores which is faster in each cell as a small JSON table
+in the user cache directory. The dispatcher loads the table once, and looking
+a call up costs a couple of integer operations.
+
+The grid is indexed by the base 4 logarithms of the number of outputs and of
+the number of elements reduced into each output, with a separate grid for
+reductions that include the last axis (reducing along contiguous memory).
+Cells too large to time are filled from the nearest timed cell.
+"""
+
+from typing import Dict, List, Optional, Tuple, Union
+from math import prod
+from pathlib import Path
+import json
+import os
+import platform
+import sys
+import time
+import numpy as np
+from .routing import METHOD_MAP, HAS_Q_PARAM
+
+CALIBRATION_FORMAT = 1
+
+# Size of the calibration grid (in powers of 4 of the outputs and reduced lengths)
+GRID_SIZE = 10
+
+# Once numpy is this many times slower than the kernels in a cell, it isn't
+# timed in larger cells (some numpy functions, e.g. nanpercentile, loop over
+# the outputs in python and would take minutes)
+DOMINANCE_RATIO = 10
+
+# Parameter the quantile methods are timed with
+CALIBRATION_Q = {"quantile": 0.5, "percentile": 50.0}
+
+# Decision table by method (None if there isn't one), loaded on first use
+_table = None
+_loaded = False
+
+
+def get_cache_dir() -> Path:
+    """Directory speedystats stores per-user data in (SPEEDYSTATS_CACHE_DIR overrides it)."""
+    if "SPEEDYSTATS_CACHE_DIR" in os.environ:
+        return Path(os.environ["SPEEDYSTATS_CACHE_DIR"])
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA", Path.home() / "AppData" / "Local")
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Caches"
+    else:
+        base = os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")
+    return Path(base) / "speedystats"
+
+
+def get_calibration_path() -> Path:
+    """Path of this machine's calibration (named by host, for shared home directories)."""
+    return get_cache_dir() / f"calibration-{platform.node()}.json"
+
+
+def load_calibration(path: Optional[Union[str, Path]] = None) -> bool:
+    """(Re)load the calibration used by the dispatcher.
+
+    Calibrations made by another version of speedystats are ignored, since its
+    kernels may perform differently.
+
+    Returns:
+        bool: Whether a calibration was loaded
+    """
+    global _table, _loaded
+    from . import __version__
+
+    _table = None
+    _loaded = True
+    path = get_calibration_path() if path is None else Path(path)
+    try:
+        with open(path) as f:
+            payload = json.load(f)
+    except (OSError, ValueError):
+        return False
+    if (
+        payload.get("format") != CALIBRATION_FORMAT
+        or payload.get("speedystats") != __version__
+    ):
+        return False
+    _table = {
+        method: tuple(tuple(tuple(bool(v) for v in row) for row in g) for g in grids)
+        for method, grids in payload["methods"].items()
+    }
+    return True
+
+
+def clear_calibration() -> None:
+    """Delete this machine's calibration, so every call goes to the numba kernels."""
+    global _table, _loaded
+    get_calibration_path().unlink(missing_ok=True)
+    _table = None
+    _loaded = True
+
+
+def use_numpy(method: str, shape: Tuple[int], keep_axes: Tuple[int]) -> bool:
+    """Whether the calibration says numpy is faster for this reduction."""
+    if not _loaded:
+        load_calibration()
+    if _table is None:
+        return False
+    grids = _table.get(method)
+    if grids is None:
+        return False
+    num_outputs = prod(shape[k] for k in keep_axes)
+    if num_outputs == 0:
+        return False
+    num_reduced = prod(shape) // num_outputs
+    grid = grids[keep_axes[-1] != len(shape) - 1]
+    i = min(num_outputs.bit_length() // 2, GRID_SIZE - 1)
+    j = min(num_reduced.bit_length() // 2, GRID_SIZE - 1)
+    return grid[i][j]
+
+
+def _best_time(func, n_repeats: int) -> float:
+    func()
+    times = []
+    for _ in range(n_repeats):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def _fill_grid(timed: Dict[Tuple[int, int], bool]) -> List[List[bool]]:
+    """Complete a grid from its timed cells, using the nearest timed cell."""
+    grid = []
+    for i in range(GRID_SIZE):
+        row = []
+        for j in range(GRID_SIZE):
+            nearest = min(timed, key=lambda c: (abs(c[0] - i) + abs(c[1] - j), c))
+            row.append(timed[nearest])
+        grid.append(row)
+    return grid
+
+
+def calibrate(
+    methods: Optional[List[str]] = None,
+    max_elements: int = 2**20,
+    n_repeats: int = 3,
+    path: Optional[Union[str, Path]] = None,
+) -> Path:
+    """Time numpy against the numba kernels on this machine, and route by the result.
+
+    This takes from a few seconds to a minute (depending on the methods), and
+    only needs to run once per machine (and again after upgrading speedystats,
+    or to calibrate for a different number of threads). Every later call of a
+    calibrated method, in any process, goes to numpy where it was faster.
+
+    Args:
+        methods: Methods to calibrate (default: every method numpy also has)
+        max_elements: Size of the largest array timed
+        n_repeats: Number of timings of each case (the fastest is used)
+        path: Where to store the calibration (default: the user cache directory)
+
+    Returns:
+        Path: The calibration file
+
+    Example:
+        speedystats.calibrate()
+    """
+    global _table, _loaded
+    from . import speedystats, __version__
+    from .parallel import get_num_threads
+
+    if methods is None:
+        methods = [m for m in METHOD_MAP if hasattr(np, m)]
+    for method in methods:
+        if method not in METHOD_MAP or not hasattr(np, method):
+            raise ValueError(f"{method} has no numpy equivalent to calibrate against")
+
+    # Time the numba kernels rather than the current calibration
+    _table = None
+    _loaded = True
+
+    rng = np.random.default_rng(42)
+    tables = {}
+    for method in methods:
+        numpy_func = getattr(np, method)
+        speedystat_func = getattr(speedystats, method)
+        kwargs = {}
+        if HAS_Q_PARAM[method]:
+            kwargs["q"] = CALIBRATION_Q[method.removeprefix("nan")]
+
+        grids = []
+        for trailing in [False, True]:
+            timed = {}
+            dominated = []
+            for i in range(GRID_SIZE):
+                for j in range(GRID_SIZE):
+                    num_outputs, num_reduced = 4**i, 4**j
+                    if num_outputs * num_reduced > max_elements:
+                        continue
+                    if any(i >= i0 and j >= j0 for i0, j0 in dominated):
+                        timed[(i, j)] = False
+                        continue
+                    if trailing:
+                        data = rng.standard_normal((num_outputs, num_reduced))
+                        axis = 1
+                    else:
+                        data = rng.standard_normal((num_reduced, num_outputs))
+                        axis = 0
+                    numpy_time = _best_time(
+                        lambda: numpy_func(data, axis=axis, **kwargs), n_repeats
+                    )
+                    numba_time = _best_time(
+                        lambda: speedystat_func(data, axis=axis, **kwargs), n_repeats
+                    )
+                    timed[(i, j)] = numpy_time < numba_time
+                    if numpy_time > DOMINANCE_RATIO * numba_time:
+                        dominated.append((i, j))
+            grids.append(_fill_grid(timed))
+        tables[method] = grids
+
+    path = get_calibration_path() if path is None else Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "format": CALIBRATION_FORMAT,
+        "speedystats": __version__,
+        "hostname": platform.node(),
+        "num_threads": get_num_threads(),
+        "methods": {
+            method: [[[int(v) for v in row] for row in grid] for grid in grids]
+            for method, grids in tables.items()
+        },
+    }
+    with open(path, "w") as f:
+        json.dump(payload, f)
+    load_calibration(path)
+    return path
@@ -0,0 +1,116 @@
+"""Detection of the copies made when the input is reshaped for the kernels.
+
+The generated kernels need the reduced axes after the last kept axis flattened
+into one, and methods numpy doesn't have need the kept and reduced axes
+flattened into two. np.reshape does this for free when the axes being merged
+are laid out one after the other in memory, and otherwise silently copies the
+whole input, which for large views can exhaust memory.
+
+Copies are predicted from the strides before reshaping, so the "raise" policy
+stops a call before it allocates anything. The policy is "ignore" by default,
+or the value of the SPEEDYSTATS_COPY_POLICY environment variable.
+"""
+
+from typing import Iterable, Sequence
+from contextlib import contextmanager
+import os
+import warnings
+import numpy as np
+
+COPY_POLICIES = ("ignore", "warn", "raise")
+
+# What to do when reshaping an input copies it
+POLICY = os.environ.get("SPEEDYSTATS_COPY_POLICY", "ignore")
+if POLICY not in COPY_POLICIES:
+    raise ValueError(
+        f"SPEEDYSTATS_COPY_POLICY must be one of {COPY_POLICIES}, received: {POLICY}"
+    )
+
+
+class CopyWarning(UserWarning):
+    """Warning that an input was copied to reshape it for the kernels."""
+
+
+def set_copy_policy(policy: str) -> None:
+    """Set what happens when reshaping an input for the kernels copies it.
+
+    Args:
+        policy: "ignore" (the default), "warn" (a CopyWarning) or "raise"
+            (a ValueError, before anything is copied)
+    """
+    global POLICY
+    if policy not in COPY_POLICIES:
+        raise ValueError(f"policy must be one of {COPY_POLICIES}, received: {policy}")
+    POLICY = policy
+
+
+@contextmanager
+def copy_policy(policy: str):
+    """Context manager setting the copy policy within a block.
+
+    Example:
+        with speedystats.copy_policy("raise"):
+            out = speedystats.median(view, axis=0)
+    """
+    previous = POLICY
+    set_copy_policy(policy)
+    try:
+        yield
+    finally:
+        set_copy_policy(previous)
+
+
+def _is_view(shape: Sequence[int], strides: Sequence[int]) -> bool:
+    """Whether axes with these shape and strides can be merged without a copy."""
+    dims = [(n, s) for n, s in zip(shape, strides) if n != 1]
+    for (_, outer), (n, inner) in zip(dims[:-1], dims[1:]):
+        if outer != inner * n:
+            return False
+    return True
+
+
+def check_copy(
+    data: np.ndarray,
+    groups: Iterable[range],
+    method: str,
+    record=None,
+    stacklevel: int = 5,
+    name: str = "its input",
+) -> int:
+    """Apply the copy policy to merging each group of consecutive axes of data.
+
+    Args:
+        data: Array about to be reshaped
+        groups: Ranges of consecutive axes that the reshape merges
+        method: Name of the method (for the message)
+        record: CallRecord of the call, if it's being instrumented
+        stacklevel: Stack level of the caller's call site (for the warning)
+        name: What data is (for the message)
+
+    Returns:
+        int: Number of bytes the reshape copies (0 if it makes a view)
+    """
+    if data.size == 0:
+        return 0
+    for group in groups:
+        shape = [data.shape[a] for a in group]
+        strides = [data.strides[a] for a in group]
+        if not _is_view(shape, strides):
+            break
+    else:
+        return 0
+
+    nbytes = data.nbytes
+    if record is not None:
+        record.copied = True
+        record.copied_bytes += nbytes
+    message = (
+        f"{method} copies {name} ({nbytes} bytes, shape {data.shape}, strides "
+        f"{data.strides}) to flatten the reduced axes; reducing a C-contiguous "
+        f"array, or one whose reduced axes are last and contiguous, avoids this"
+    )
+    if POLICY == "raise":
+        raise ValueError(message)
+    if POLICY == "warn":
+        warnings.warn(message, CopyWarning, stacklevel=stacklevel)
+    return nbytes
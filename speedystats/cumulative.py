@@ -0,0 +1,189 @@
+from typing import Optional
+import numpy as np
+from .numba import scan
+from .parallel import kernel_threads
+from .asynchronous import run_async
+
+SCAN_OPS = {
+    "cumsum": (scan.SUM, False),
+    "nancumsum": (scan.SUM, True),
+    "cumprod": (scan.PROD, False),
+    "nancumprod": (scan.PROD, True),
+    "cummax": (scan.MAX, False),
+    "cummin": (scan.MIN, False),
+}
+
+
+def _scan_dtype(dtype: np.dtype, op: int) -> np.dtype:
+    """Output dtype of a scan, following numpy's promotion for cumsum / cumprod."""
+    if op in (scan.SUM, scan.PROD):
+        if dtype.kind in "bi" and dtype.itemsize < 8:
+            return np.dtype(np.int64)
+        if dtype.kind == "u" and dtype.itemsize < 8:
+            return np.dtype(np.uint64)
+    return dtype
+
+
+def _call_cumulative(
+    data: np.ndarray,
+    method: str,
+    axis: Optional[int] = None,
+    out: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+) -> np.ndarray:
+    if method not in SCAN_OPS:
+        raise ValueError(f"No fast implementation available for {method}")
+    op, skipna = SCAN_OPS[method]
+    data = np.asarray(data)
+
+    # Like numpy, scanning with axis=None scans the flattened array
+    if axis is None:
+        data = np.ravel(data)
+        axis = 0
+    if not -data.ndim <= axis < data.ndim:
+        raise ValueError(
+            f"axis {axis} is out of bounds for array of dimension {data.ndim}"
+        )
+    axis = axis % data.ndim
+    skipna = skipna and data.dtype.kind in "fc"
+
+    if out is None:
+        out = np.empty(data.shape, dtype=_scan_dtype(data.dtype, op))
+    elif out.shape != data.shape:
+        raise ValueError(f"out has shape {out.shape}, expected {data.shape}")
+    if data.size == 0:
+        return out
+
+    # Scans run on a (pre, n, post) view of the data (see speedystats.numba.scan)
+    num_pre = int(np.prod(data.shape[:axis]))
+    num_post = int(np.prod(data.shape[axis + 1 :]))
+    scan_shape = (num_pre, data.shape[axis], num_post)
+    data = np.reshape(data, scan_shape)
+
+    # Write straight into out when it can be viewed with the scan shape
+    copy_back = not out.flags.c_contiguous
+    if copy_back:
+        target = np.empty(scan_shape, dtype=out.dtype)
+    else:
+        target = np.reshape(out, scan_shape)
+
+    if num_pre == 1 and num_post == 1 and scan_shape[1] >= scan.MIN_BLOCKED_SCAN:
+        num_tasks = -(-scan_shape[1] // scan.SCAN_BLOCK)
+        with kernel_threads(num_tasks, data.size, num_threads):
+            scan.scan_1d(data[0, :, 0], target[0, :, 0], op, skipna)
+    else:
+        num_tasks = num_pre * -(-num_post // scan.POST_BLOCK)
+        with kernel_threads(num_tasks, data.size, num_threads):
+            scan.scan_3d(data, target, op, skipna)
+
+    if copy_back:
+        out[...] = np.reshape(target, out.shape)
+    return out
+
+
+def cumsum(
+    data: np.ndarray,
+    axis: Optional[int] = None,
+    out: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+) -> np.ndarray:
+    return _call_cumulative(data, "cumsum", axis, out, num_threads)
+
+
+async def acumsum(
+    data: np.ndarray,
+    axis: Optional[int] = None,
+    out: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+) -> np.ndarray:
+    return await run_async(cumsum, data, axis, out, num_threads)
+
+
+def nancumsum(
+    data: np.ndarray,
+    axis: Optional[int] = None,
+    out: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+) -> np.ndarray:
+    return _call_cumulative(data, "nancumsum", axis, out, num_threads)
+
+
+async def anancumsum(
+    data: np.ndarray,
+    axis: Optional[int] = None,
+    out: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+) -> np.ndarray:
+    return await run_async(nancumsum, data, axis, out, num_threads)
+
+
+def cumprod(
+    data: np.ndarray,
+    axis: Optional[int] = None,
+    out: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+) -> np.ndarray:
+    return _call_cumulative(data, "cumprod", axis, out, num_threads)
+
+
+async def acumprod(
+    data: np.ndarray,
+    axis: Optional[int] = None,
+    out: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+) -> np.ndarray:
+    return await run_async(cumprod, data, axis, out, num_threads)
+
+
+def nancumprod(
+    data: np.ndarray,
+    axis: Optional[int] = None,
+    out: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+) -> np.ndarray:
+    return _call_cumulative(data, "nancumprod", axis, out, num_threads)
+
+
+async def anancumprod(
+    data: np.ndarray,
+    axis: Optional[int] = None,
+    out: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+) -> np.ndarray:
+    return await run_async(nancumprod, data, axis, out, num_threads)
+
+
+def cummax(
+    data: np.ndarray,
+    axis: Optional[int] = None,
+    out: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+) -> np.ndarray:
+    return _call_cumulative(data, "cummax", axis, out, num_threads)
+
+
+async def acummax(
+    data: np.ndarray,
+    axis: Optional[int] = None,
+    out: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+) -> np.ndarray:
+    return await run_async(cummax, data, axis, out, num_threads)
+
+
+def cummin(
+    data: np.ndarray,
+    axis: Optional[int] = None,
+    out: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+) -> np.ndarray:
+    return _call_cumulative(data, "cummin", axis, out, num_threads)
+
+
+async def acummin(
+    data: np.ndarray,
+    axis: Optional[int] = None,
+    out: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+) -> np.ndarray:
+    return await run_async(cummin, data, axis, out, num_threads)
@@ -0,0 +1,162 @@
+"""Opt-in instrumentation of the calls that go through the dispatcher.
+
+When enabled, every call records the path it took (the generated numba
+kernels, the contiguous kernels, numpy, ...), its duration, the bytes of input
+it processed and the bytes copied by reshaping the input. The records are
+aggregated by (method, kept axes, dtype) in a registry read with stats, and
+passed to any hooks added with add_hook (e.g. to export them to a metrics
+system). When disabled (the default), calls only check a module flag.
+
+Plans (see speedystats.plan) skip the dispatcher, so their calls aren't recorded.
+"""
+
+from typing import Callable, Dict, List, Optional, Tuple
+from dataclasses import dataclass, field, replace
+from threading import Lock
+import time
+import numpy as np
+
+# Whether calls are recorded (enabled by enable_stats or by adding a hook)
+ENABLED = False
+
+_stats_enabled = False
+_hooks: List[Callable[["CallRecord"], None]] = []
+_registry: Dict[Tuple[str, Tuple[int], str], "CallStats"] = {}
+_lock = Lock()
+
+
+@dataclass
+class CallRecord:
+    """A single call: passed to hooks once it returns.
+
+    path is where the call went: "numba" (the generated kernels), "contiguous"
+    (the row / column kernels), "numpy", "flattened" (the numba kernels on a
+    transposed copy, for methods numpy doesn't have), "counting" (the counting
+    kernels for small integers), "sparse", "masked" or "processes". copied is
+    whether reshaping the input made a copy of it (of copied_bytes bytes, see
+    speedystats.copies).
+    """
+
+    method: str
+    keep_axes: Optional[Tuple[int]]
+    dtype: str
+    shape: Tuple[int]
+    nbytes: int
+    path: str = "numba"
+    copied: bool = False
+    copied_bytes: int = 0
+    time: float = 0.0
+    start: float = field(default=0.0, repr=False)
+
+
+@dataclass
+class CallStats:
+    """Aggregated calls of a method on one set of kept axes and dtype."""
+
+    calls: int = 0
+    total_time: float = 0.0
+    nbytes: int = 0
+    fallbacks: int = 0
+    copies: int = 0
+    copied_bytes: int = 0
+    paths: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def mean_time(self) -> float:
+        return self.total_time / self.calls if self.calls else 0.0
+
+
+def _update_enabled() -> None:
+    global ENABLED
+    ENABLED = _stats_enabled or bool(_hooks)
+
+
+def enable_stats(enabled: bool = True) -> None:
+    """Turn the call statistics registry on (or off).
+
+    Example:
+        speedystats.enable_stats()
+        run_pipeline()
+        for (method, keep_axes, dtype), s in speedystats.stats().items():
+            print(method, keep_axes, dtype, s.calls, s.mean_time, s.fallbacks)
+    """
+    global _stats_enabled
+    _stats_enabled = enabled
+    _update_enabled()
+
+
+def stats() -> Dict[Tuple[str, Tuple[int], str], CallStats]:
+    """Snapshot of the call statistics, by (method, kept axes, dtype).
+
+    Full reductions have no kept axes (), and calls with invalid axes have None.
+    """
+    with _lock:
+        return {
+            key: replace(value, paths=dict(value.paths))
+            for key, value in _registry.items()
+        }
+
+
+def reset_stats() -> None:
+    """Clear the call statistics."""
+    with _lock:
+        _registry.clear()
+
+
+def add_hook(callback: Callable[[CallRecord], None]) -> None:
+    """Call callback with the CallRecord of every call, after it returns.
+
+    Hooks run on the calling thread, so they should be quick (e.g. increment a
+    counter or put the record on a queue).
+    """
+    _hooks.append(callback)
+    _update_enabled()
+
+
+def remove_hook(callback: Callable[[CallRecord], None]) -> None:
+    """Stop calling a hook added with add_hook."""
+    _hooks.remove(callback)
+    _update_enabled()
+
+
+def start_call(data, method: str, axis, is_sparse: bool) -> CallRecord:
+    """Start the record of a call (only used when ENABLED)."""
+    from .routing import get_keep_axes
+
+    ndim = getattr(data, "ndim", np.ndim(data))
+    try:
+        keep_axes = () if axis is None else get_keep_axes(axis, ndim)
+    except (TypeError, ValueError):
+        keep_axes = None
+    if is_sparse:
+        nbytes = data.data.nbytes
+    else:
+        nbytes = getattr(data, "nbytes", 0)
+    return CallRecord(
+        method=method,
+        keep_axes=keep_axes,
+        dtype=str(getattr(data, "dtype", "")),
+        shape=tuple(getattr(data, "shape", ())),
+        nbytes=nbytes,
+        start=time.perf_counter(),
+    )
+
+
+def finish_call(record: CallRecord) -> None:
+    """Record a call that returned, and pass it to the hooks."""
+    record.time = time.perf_counter() - record.start
+    if _stats_enabled:
+        key = (record.method, record.keep_axes, record.dtype)
+        with _lock:
+            entry = _registry.get(key)
+            if entry is None:
+                entry = _registry[key] = CallStats()
+            entry.calls += 1
+            entry.total_time += record.time
+            entry.nbytes += record.nbytes
+            entry.fallbacks += record.path == "numpy"
+            entry.copies += record.copied
+            entry.copied_bytes += record.copied_bytes
+            entry.paths[record.path] = entry.paths.get(record.path, 0) + 1
+    for hook in list(_hooks):
+        hook(record)
@@ -0,0 +1,106 @@
+from typing import Union, Iterable, Optional
+from math import prod
+import numpy as np
+from .numba import kernels, masked
+from .numba.contiguous import contiguous_shape
+from .parallel import kernel_threads
+from .routing import get_keep_axes
+from . import copies
+
+
+def get_masked_statistic(method: str, q: Optional[float] = None):
+    """Statistic code, NaN skipping, summation code, scalar parameter and
+    interpolation code of a method.
+
+    Accuracy variants (e.g. "nansum_kahan") use the matching summation,
+    interpolation variants (e.g. "percentile_interpolated", whose q is a
+    (q, method code) pair) the matching interpolation, and quantiles are
+    converted to the [0, 1] range.
+    """
+    interpolation = kernels.LINEAR
+    if method.endswith("_interpolated"):
+        method = method[: -len("_interpolated")]
+        q, interpolation = q
+    base, summation = method, "fast"
+    for mode in masked.MASKED_SUMMATIONS:
+        if method.endswith(f"_{mode}"):
+            base, summation = method[: -len(mode) - 1], mode
+    skipna = base.startswith("nan") and base[3:] in masked.MASKED_STATISTICS
+    if skipna:
+        base = base[3:]
+    if base not in masked.MASKED_STATISTICS:
+        raise ValueError(f"{method} doesn't support where= masks")
+    if base == "median":
+        q = 0.5
+    elif base == "percentile":
+        q = q / 100
+    return (
+        masked.MASKED_STATISTICS[base],
+        skipna,
+        masked.MASKED_SUMMATIONS[summation],
+        0.0 if q is None else float(q),
+        interpolation,
+    )
+
+
+def call_masked(
+    data: np.ndarray,
+    method: str,
+    axis: Optional[Union[int, Iterable[int]]] = None,
+    keepdims: bool = False,
+    q: Optional[float] = None,
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    record=None,
+) -> np.ndarray:
+    """Reduce data over the values where the mask is True.
+
+    The mask is where (broadcast against data) combined with the mask of data if
+    it is a numpy masked array. Like numpy, empty reductions give 0 for sums and
+    NaN otherwise, but the result is always a plain numpy array. The copy policy
+    applies to reshaping both the data and the mask (see speedystats.copies).
+    """
+    if isinstance(data, np.ma.MaskedArray):
+        unmasked = ~np.ma.getmaskarray(data)
+        where = unmasked if where is None else unmasked & where
+        data = data.data
+    data = np.asarray(data)
+    where = np.broadcast_to(np.asarray(where, dtype=bool), data.shape)
+    statistic, skipna, summation, q, interpolation = get_masked_statistic(method, q)
+    skipna = skipna and data.dtype.kind in "fc"
+
+    keep_axes = () if axis is None else get_keep_axes(axis, data.ndim)
+    reduce_axes = tuple(a for a in range(data.ndim) if a not in keep_axes)
+    keep_shape = tuple(data.shape[k] for k in keep_axes)
+
+    # The (outer, kept, inner) view is free for contiguous data with consecutive
+    # kept axes, otherwise the kept axes are moved to the front
+    shape = contiguous_shape(data, keep_axes) if keep_axes else None
+    if shape is None:
+        num_outputs = prod(keep_shape)
+        shape = (1, num_outputs, data.size // num_outputs if num_outputs else 0)
+        data = np.transpose(data, keep_axes + reduce_axes)
+        where = np.transpose(where, keep_axes + reduce_axes)
+        groups = [range(len(keep_axes)), range(len(keep_axes), data.ndim)]
+    else:
+        first, last = keep_axes[0], keep_axes[-1]
+        groups = [range(first), range(first, last + 1), range(last + 1, data.ndim)]
+    if record is not None or copies.POLICY != "ignore":
+        copies.check_copy(data, groups, method, record, stacklevel=6)
+        copies.check_copy(
+            where, groups, method, record, stacklevel=6, name="its where= mask"
+        )
+    data = np.reshape(data, shape)
+    where = np.reshape(where, shape)
+
+    with kernel_threads(shape[1], data.size, num_threads):
+        out = masked.reduce_masked(
+            data, where, statistic, skipna, summation, q, interpolation
+        )
+
+    out = np.reshape(out, keep_shape)
+    if keepdims:
+        out = np.expand_dims(out, reduce_axes)
+    elif not keep_shape:
+        out = out[()]
+    return out
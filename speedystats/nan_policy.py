@@ -0,0 +1,84 @@
+"""The nan_policy option of the methods that have a nan variant.
+
+"propagate" (the default) is the plain method, whose result is NaN for slices
+containing NaNs. "raise" raises a ValueError if the input contains NaNs, which
+is checked before reducing anything. "omit" gives the result of the nan variant.
+
+The nan kernels of reductions along axes skip NaNs at little cost (the
+contiguous kernels mask them, and the selection kernels drop them while
+gathering each slice), so "omit" calls them directly. Full reductions of sums
+and moments go to numpy, whose nan functions copy the input to replace the NaNs
+and are several times slower, so "omit" first scans the input for NaNs (in
+parallel) and uses the plain function when there are none.
+"""
+
+from typing import Iterable, Optional, Union
+import numpy as np
+from .routing import METHOD_MAP, get_keep_axes
+from .numba import kernels
+from .sparse import is_sparse
+
+NAN_POLICIES = ("propagate", "omit", "raise")
+
+# Methods whose full reductions are worth scanning for NaNs with "omit"
+PRESCAN_METHODS = ("sum", "mean", "var", "std")
+
+
+def contains_nan(data, where: Optional[np.ndarray] = None) -> bool:
+    """Whether the values a reduction would use include a NaN."""
+    if is_sparse(data):
+        return bool(np.isnan(data.data).any())
+    if data.dtype.kind not in "fc":
+        return False
+    if isinstance(data, np.ma.MaskedArray) or where is not None:
+        isnan = np.isnan(data)
+        if where is not None:
+            isnan &= where
+        return bool(isnan.any())
+    if data.dtype.kind == "f" and data.flags.c_contiguous:
+        return kernels.contains_nan(np.ravel(data))
+    return bool(np.isnan(data).any())
+
+
+def get_nan_policy_method(
+    data,
+    method: str,
+    axis: Optional[Union[int, Iterable[int]]],
+    where: Optional[np.ndarray],
+    nan_policy: str,
+) -> str:
+    """Get the method computing a reduction with a nan_policy.
+
+    Args:
+        data: Array being reduced
+        method: Name of the method (without the nan prefix)
+        axis: Axis or axes being reduced
+        where: Mask of the values being reduced
+        nan_policy: "propagate", "omit" or "raise"
+
+    Returns:
+        str: Name of the method to call (the method itself or its nan variant)
+    """
+    if nan_policy not in NAN_POLICIES:
+        raise ValueError(
+            f"nan_policy must be one of {NAN_POLICIES}, received: {nan_policy!r}"
+        )
+    nan_method = f"nan{method}"
+    if nan_method not in METHOD_MAP:
+        raise ValueError(f"nan_policy isn't available for {method}")
+    if nan_policy == "propagate":
+        return method
+    if nan_policy == "raise":
+        if contains_nan(data, where):
+            raise ValueError(
+                f"The input of {method} contains NaNs (nan_policy='raise')"
+            )
+        return method
+
+    # Integers can't be NaN (and are reduced by their own kernels)
+    if not is_sparse(data) and data.dtype.kind not in "fc":
+        return method
+    full_reduction = axis is None or not get_keep_axes(axis, data.ndim)
+    if full_reduction and method in PRESCAN_METHODS and not contains_nan(data, where):
+        return method
+    return nan_method
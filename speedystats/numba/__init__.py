@@ -2,17 +2,52 @@
 
 from .sum import get_sum
 from .nansum import get_nansum
+from .sum_pairwise import get_sum_pairwise
+from .sum_kahan import get_sum_kahan
+from .nansum_pairwise import get_nansum_pairwise
+from .nansum_kahan import get_nansum_kahan
 from .ptp import get_ptp
 from .percentile import get_percentile
 from .nanpercentile import get_nanpercentile
+from .percentile_interpolated import get_percentile_interpolated
+from .nanpercentile_interpolated import get_nanpercentile_interpolated
+from .percentile_counting import get_percentile_counting
 from .quantile import get_quantile
 from .nanquantile import get_nanquantile
+from .quantile_interpolated import get_quantile_interpolated
+from .nanquantile_interpolated import get_nanquantile_interpolated
+from .quantile_counting import get_quantile_counting
 from .median import get_median
 from .nanmedian import get_nanmedian
+from .median_counting import get_median_counting
 from .average import get_average
 from .mean import get_mean
 from .nanmean import get_nanmean
+from .mean_pairwise import get_mean_pairwise
+from .mean_kahan import get_mean_kahan
+from .nanmean_pairwise import get_nanmean_pairwise
+from .nanmean_kahan import get_nanmean_kahan
 from .std import get_std
 from .nanstd import get_nanstd
+from .std_pairwise import get_std_pairwise
+from .std_kahan import get_std_kahan
+from .nanstd_pairwise import get_nanstd_pairwise
+from .nanstd_kahan import get_nanstd_kahan
 from .var import get_var
 from .nanvar import get_nanvar
+from .var_pairwise import get_var_pairwise
+from .var_kahan import get_var_kahan
+from .nanvar_pairwise import get_nanvar_pairwise
+from .nanvar_kahan import get_nanvar_kahan
+from .min import get_min
+from .nanmin import get_nanmin
+from .max import get_max
+from .nanmax import get_nanmax
+from .trim_mean import get_trim_mean
+from .nantrim_mean import get_nantrim_mean
+from .winsorized_mean import get_winsorized_mean
+from .nanwinsorized_mean import get_nanwinsorized_mean
+from .median_abs_deviation import get_median_abs_deviation
+from .nanmedian_abs_deviation import get_nanmedian_abs_deviation
+from .iqr import get_iqr
+from .naniqr import get_naniqr
@@ -0,0 +1,489 @@
+"""Reductions of C-contiguous data whose kept axes are consecutive.
+
+Such data can be viewed (for free) as an (outer, kept, inner) array, where outer
+and inner are the flattened reduced axes before and after the kept ones. The
+generated kernels reduce it one output at a time with a strided gather, which
+touches one element per cache line when the kept axes come last. Instead:
+
+When the inner runs are long (including the common case of keeping the leading
+axes), each output is a set of contiguous rows, reduced with a hand-written
+loop using several independent accumulators (so it auto-vectorizes).
+
+When the inner runs are short (including the case of keeping the trailing
+axes), the data is treated as a (outer, kept * inner) array of columns. The
+column kernels walk memory row by row and accumulate a block of columns at once,
+then each group of inner columns is combined into its output. The rows are split
+into a fixed number of chunks (independent of the number of threads, so results
+are reproducible) whose partial results are combined in order at the end.
+
+The extrema (min, max and ptp) have kernels of their own whose results keep the
+dtype of the data, like numpy's, so integers beyond 2**53 aren't rounded.
+"""
+
+from typing import Optional, Tuple
+from math import prod
+import numba as nb
+import numpy as np
+
+SUM = 0
+MEAN = 1
+VAR = 2
+STD = 3
+MIN = 4
+MAX = 5
+PTP = 6
+
+# Statistic code and whether NaNs are skipped, by statistic name
+STATISTICS = {
+    "sum": (SUM, False),
+    "mean": (MEAN, False),
+    "var": (VAR, False),
+    "std": (STD, False),
+    "min": (MIN, False),
+    "max": (MAX, False),
+    "ptp": (PTP, False),
+    "nansum": (SUM, True),
+    "nanmean": (MEAN, True),
+    "nanvar": (VAR, True),
+    "nanstd": (STD, True),
+}
+
+# Fastmath flags for kernels that skip NaNs: everything but "nnan" and "ninf",
+# so the NaN checks aren't optimized away but the sums can still be reordered
+NAN_FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+# Shortest inner run worth reducing as a contiguous row (shorter runs are
+# reduced as columns)
+MIN_ROW_LENGTH = 64
+
+# Number of columns accumulated together by each task in the column kernels
+COLUMN_BLOCK = 256
+
+# Number of parallel tasks to aim for when splitting the rows of a column reduction
+COLUMN_TASKS = 64
+
+# Fewest rows worth giving to a task in a column reduction
+MIN_CHUNK_ROWS = 1024
+
+
+@nb.njit(fastmath=True, nogil=True, cache=True)
+def _row_sum(row: np.ndarray, center: float, squared: bool) -> float:
+    """Sum of a contiguous row (or of its squared deviations from center)."""
+    n = row.shape[0]
+    s0 = 0.0
+    s1 = 0.0
+    s2 = 0.0
+    s3 = 0.0
+    i = 0
+    if squared:
+        while i + 4 <= n:
+            d0 = row[i] - center
+            d1 = row[i + 1] - center
+            d2 = row[i + 2] - center
+            d3 = row[i + 3] - center
+            s0 += d0 * d0
+            s1 += d1 * d1
+            s2 += d2 * d2
+            s3 += d3 * d3
+            i += 4
+        while i < n:
+            d0 = row[i] - center
+            s0 += d0 * d0
+            i += 1
+    else:
+        while i + 4 <= n:
+            s0 += row[i]
+            s1 += row[i + 1]
+            s2 += row[i + 2]
+            s3 += row[i + 3]
+            i += 4
+        while i < n:
+            s0 += row[i]
+            i += 1
+    return (s0 + s1) + (s2 + s3)
+
+
+@nb.njit(fastmath=NAN_FASTMATH, nogil=True, cache=True)
+def _row_nansum(row: np.ndarray, center: float, squared: bool):
+    """Like _row_sum, skipping NaNs. Returns the sum and the number of non-NaNs."""
+    n = row.shape[0]
+    s0 = 0.0
+    s1 = 0.0
+    s2 = 0.0
+    s3 = 0.0
+    count = 0
+    i = 0
+    while i + 4 <= n:
+        d0 = row[i] - center
+        d1 = row[i + 1] - center
+        d2 = row[i + 2] - center
+        d3 = row[i + 3] - center
+        if squared:
+            d0 *= d0
+            d1 *= d1
+            d2 *= d2
+            d3 *= d3
+        # Selects rather than branches, so the loop still vectorizes
+        s0 += 0.0 if np.isnan(d0) else d0
+        s1 += 0.0 if np.isnan(d1) else d1
+        s2 += 0.0 if np.isnan(d2) else d2
+        s3 += 0.0 if np.isnan(d3) else d3
+        count += (d0 == d0) + (d1 == d1) + (d2 == d2) + (d3 == d3)
+        i += 4
+    while i < n:
+        d0 = row[i] - center
+        if squared:
+            d0 *= d0
+        if not np.isnan(d0):
+            s0 += d0
+            count += 1
+        i += 1
+    return (s0 + s1) + (s2 + s3), count
+
+
+@nb.njit(nogil=True, cache=True)
+def _row_total(row: np.ndarray, center: float, squared: bool, skipna: bool):
+    if skipna:
+        return _row_nansum(row, center, squared)
+    return _row_sum(row, center, squared), row.shape[0]
+
+
+@nb.njit(nogil=True, cache=True)
+def _min(a, b):
+    """Smaller of a and b, or NaN if either is NaN (like np.minimum)."""
+    return a if a != a or a <= b else b
+
+
+@nb.njit(nogil=True, cache=True)
+def _max(a, b):
+    """Larger of a and b, or NaN if either is NaN (like np.maximum)."""
+    return a if a != a or a >= b else b
+
+
+@nb.njit(fastmath=NAN_FASTMATH, nogil=True, cache=True)
+def _row_min(row: np.ndarray):
+    n = row.shape[0]
+    m0 = row[0]
+    m1 = row[0]
+    m2 = row[0]
+    m3 = row[0]
+    i = 0
+    while i + 4 <= n:
+        m0 = _min(m0, row[i])
+        m1 = _min(m1, row[i + 1])
+        m2 = _min(m2, row[i + 2])
+        m3 = _min(m3, row[i + 3])
+        i += 4
+    while i < n:
+        m0 = _min(m0, row[i])
+        i += 1
+    return _min(_min(m0, m1), _min(m2, m3))
+
+
+@nb.njit(fastmath=NAN_FASTMATH, nogil=True, cache=True)
+def _row_max(row: np.ndarray):
+    n = row.shape[0]
+    m0 = row[0]
+    m1 = row[0]
+    m2 = row[0]
+    m3 = row[0]
+    i = 0
+    while i + 4 <= n:
+        m0 = _max(m0, row[i])
+        m1 = _max(m1, row[i + 1])
+        m2 = _max(m2, row[i + 2])
+        m3 = _max(m3, row[i + 3])
+        i += 4
+    while i < n:
+        m0 = _max(m0, row[i])
+        i += 1
+    return _max(_max(m0, m1), _max(m2, m3))
+
+
+@nb.njit(parallel=True, fastmath=NAN_FASTMATH, nogil=True, cache=True)
+def extrema_rows(data: np.ndarray, statistic: int) -> np.ndarray:
+    """Like reduce_rows for MIN, MAX and PTP, keeping the dtype of data."""
+    num_outer, num_outputs, _ = data.shape
+    output = np.empty(num_outputs, dtype=data.dtype)
+    for m in nb.prange(num_outputs):
+        low = data[0, m, 0]
+        high = low
+        if statistic != MAX:
+            low = _row_min(data[0, m])
+            for a in range(1, num_outer):
+                low = _min(low, _row_min(data[a, m]))
+        if statistic != MIN:
+            high = _row_max(data[0, m])
+            for a in range(1, num_outer):
+                high = _max(high, _row_max(data[a, m]))
+        if statistic == MIN:
+            output[m] = low
+        elif statistic == MAX:
+            output[m] = high
+        else:
+            output[m] = high - low
+    return output
+
+
+@nb.njit(parallel=True, fastmath=NAN_FASTMATH, nogil=True, cache=True)
+def reduce_rows(data: np.ndarray, statistic: int, skipna: bool) -> np.ndarray:
+    """Reduce an (outer, kept, inner) C-contiguous array over its outer and inner axes."""
+    num_outer, num_outputs, _ = data.shape
+    output = np.empty(num_outputs)
+    for m in nb.prange(num_outputs):
+        total = 0.0
+        count = 0
+        for a in range(num_outer):
+            row_total, row_count = _row_total(data[a, m], 0.0, False, skipna)
+            total += row_total
+            count += row_count
+        if statistic == SUM:
+            output[m] = total
+            continue
+        if count == 0:
+            output[m] = np.nan
+            continue
+        center = total / count
+        if statistic == MEAN:
+            output[m] = center
+            continue
+        squares = 0.0
+        for a in range(num_outer):
+            squares += _row_total(data[a, m], center, True, skipna)[0]
+        if statistic == VAR:
+            output[m] = squares / count
+        else:
+            output[m] = np.sqrt(squares / count)
+    return output
+
+
+def column_chunks(num_rows: int, num_columns: int) -> Tuple[int, int]:
+    """Number of row chunks and column blocks used by the column kernels."""
+    num_blocks = -(-num_columns // COLUMN_BLOCK)
+    num_chunks = max(1, COLUMN_TASKS // num_blocks)
+    num_chunks = max(1, min(num_chunks, num_rows // MIN_CHUNK_ROWS))
+    return num_chunks, num_blocks
+
+
+@nb.njit(parallel=True, fastmath=NAN_FASTMATH, nogil=True, cache=True)
+def _column_pass(
+    data: np.ndarray,
+    center: np.ndarray,
+    statistic: int,
+    skipna: bool,
+    num_chunks: int,
+    num_blocks: int,
+):
+    """Reduce the columns of a C-contiguous 2D array, walking it row by row.
+
+    statistic is SUM or VAR (the sum of squared deviations from center). Each
+    task accumulates a block of columns over a chunk of rows, then the per-chunk
+    partials are combined in a fixed order. Returns the reduced columns and the
+    number of values (non-NaNs if skipna) in each column.
+    """
+    num_rows, num_columns = data.shape
+    rows_per_chunk = -(-num_rows // num_chunks)
+    partials = np.empty((num_chunks, num_columns))
+    partial_counts = np.zeros((num_chunks, num_columns), dtype=np.int64)
+    for task in nb.prange(num_chunks * num_blocks):
+        chunk = task // num_blocks
+        start = (task % num_blocks) * COLUMN_BLOCK
+        stop = min(start + COLUMN_BLOCK, num_columns)
+        first_row = chunk * rows_per_chunk
+        last_row = min(first_row + rows_per_chunk, num_rows)
+        acc = partials[chunk, start:stop]
+        counts = partial_counts[chunk, start:stop]
+        if skipna:
+            acc[:] = 0.0
+            for r in range(first_row, last_row):
+                row = data[r, start:stop]
+                for k in range(stop - start):
+                    d = row[k] - center[start + k] if statistic == VAR else row[k]
+                    if not np.isnan(d):
+                        acc[k] += d * d if statistic == VAR else d
+                        counts[k] += 1
+        elif statistic == VAR:
+            acc[:] = 0.0
+            for r in range(first_row, last_row):
+                row = data[r, start:stop]
+                for k in range(stop - start):
+                    d = row[k] - center[start + k]
+                    acc[k] += d * d
+        else:
+            acc[:] = 0.0
+            for r in range(first_row, last_row):
+                row = data[r, start:stop]
+                for k in range(stop - start):
+                    acc[k] += row[k]
+
+    output = partials[0].copy()
+    count = partial_counts[0].copy()
+    for chunk in range(1, num_chunks):
+        output += partials[chunk]
+        count += partial_counts[chunk]
+    if not skipna:
+        count[:] = num_rows
+    return output, count
+
+
+@nb.njit(parallel=True, fastmath=NAN_FASTMATH, nogil=True, cache=True)
+def _column_extremum(
+    data: np.ndarray, statistic: int, num_chunks: int, num_blocks: int
+) -> np.ndarray:
+    """Like _column_pass for MIN and MAX, keeping the dtype of data."""
+    num_rows, num_columns = data.shape
+    rows_per_chunk = -(-num_rows // num_chunks)
+    partials = np.empty((num_chunks, num_columns), dtype=data.dtype)
+    for task in nb.prange(num_chunks * num_blocks):
+        chunk = task // num_blocks
+        start = (task % num_blocks) * COLUMN_BLOCK
+        stop = min(start + COLUMN_BLOCK, num_columns)
+        first_row = chunk * rows_per_chunk
+        last_row = min(first_row + rows_per_chunk, num_rows)
+        acc = partials[chunk, start:stop]
+        acc[:] = data[first_row, start:stop]
+        for r in range(first_row + 1, last_row):
+            row = data[r, start:stop]
+            for k in range(stop - start):
+                if statistic == MIN:
+                    acc[k] = _min(acc[k], row[k])
+                else:
+                    acc[k] = _max(acc[k], row[k])
+
+    output = partials[0].copy()
+    for chunk in range(1, num_chunks):
+        for k in range(num_columns):
+            if statistic == MIN:
+                output[k] = _min(output[k], partials[chunk, k])
+            else:
+                output[k] = _max(output[k], partials[chunk, k])
+    return output
+
+
+@nb.njit(nogil=True, cache=True)
+def _combine_groups(values: np.ndarray, group: int, statistic: int) -> np.ndarray:
+    """Combine each run of group consecutive columns into one output."""
+    if group == 1:
+        return values
+    num_outputs = values.shape[0] // group
+    output = np.empty(num_outputs, dtype=values.dtype)
+    for m in range(num_outputs):
+        value = values[m * group]
+        for j in range(m * group + 1, (m + 1) * group):
+            if statistic == MIN:
+                value = _min(value, values[j])
+            elif statistic == MAX:
+                value = _max(value, values[j])
+            else:
+                value += values[j]
+        output[m] = value
+    return output
+
+
+@nb.njit(nogil=True, cache=True)
+def extrema_columns(
+    data: np.ndarray, statistic: int, group: int, num_chunks: int, num_blocks: int
+) -> np.ndarray:
+    """Like reduce_columns for MIN, MAX and PTP, keeping the dtype of data."""
+    if statistic == MIN or statistic == MAX:
+        values = _column_extremum(data, statistic, num_chunks, num_blocks)
+        return _combine_groups(values, group, statistic)
+    high = _column_extremum(data, MAX, num_chunks, num_blocks)
+    low = _column_extremum(data, MIN, num_chunks, num_blocks)
+    return _combine_groups(high, group, MAX) - _combine_groups(low, group, MIN)
+
+
+@nb.njit(nogil=True, cache=True)
+def reduce_columns(
+    data: np.ndarray,
+    statistic: int,
+    skipna: bool,
+    group: int,
+    num_chunks: int,
+    num_blocks: int,
+) -> np.ndarray:
+    """Reduce a (outer, kept * inner) C-contiguous array over its rows and each
+    run of group (= inner) consecutive columns."""
+    no_center = np.empty(0)
+    total, count = _column_pass(data, no_center, SUM, skipna, num_chunks, num_blocks)
+    total = _combine_groups(total, group, SUM)
+    if statistic == SUM:
+        return total
+    count = _combine_groups(count, group, SUM)
+    center = total / count
+    if statistic == MEAN:
+        return center
+    squares = _column_pass(
+        data, np.repeat(center, group), VAR, skipna, num_chunks, num_blocks
+    )[0]
+    variance = _combine_groups(squares, group, SUM) / count
+    if statistic == VAR:
+        return variance
+    return np.sqrt(variance)
+
+
+def contiguous_shape(
+    data: np.ndarray, keep_axes: Tuple[int]
+) -> Optional[Tuple[int, int, int]]:
+    """The (outer, kept, inner) shape of data, or None if it has no such view."""
+    if not data.flags.c_contiguous:
+        return None
+    return view_shape(data.shape, keep_axes)
+
+
+def view_shape(
+    shape: Tuple[int], keep_axes: Tuple[int]
+) -> Optional[Tuple[int, int, int]]:
+    """The (outer, kept, inner) shape of C-contiguous data with the given shape."""
+    if prod(shape) == 0:
+        return None
+    first, last = keep_axes[0], keep_axes[-1]
+    if keep_axes != tuple(range(first, last + 1)):
+        return None
+    num_outer = prod(shape[:first])
+    num_kept = prod(shape[first : last + 1])
+    num_inner = prod(shape[last + 1 :])
+    return num_outer, num_kept, num_inner
+
+
+def _reduce_by_rows(shape: Tuple[int, int, int]) -> bool:
+    num_outer, _, num_inner = shape
+    return num_outer == 1 or num_inner >= MIN_ROW_LENGTH
+
+
+def get_contiguous_tasks(shape: Tuple[int, int, int]) -> int:
+    """Size of the parallel iteration space of a contiguous reduction."""
+    num_outer, num_kept, num_inner = shape
+    if _reduce_by_rows(shape):
+        return num_kept
+    num_chunks, num_blocks = column_chunks(num_outer, num_kept * num_inner)
+    return num_chunks * num_blocks
+
+
+def get_contiguous(
+    data: np.ndarray, shape: Tuple[int, int, int], statistic: str
+) -> np.ndarray:
+    """Reduce C-contiguous data with the row or column kernels.
+
+    Args:
+        data: C-contiguous data to reduce
+        shape: (outer, kept, inner) shape of data, from contiguous_shape
+        statistic: Name of the statistic (a key of STATISTICS)
+
+    Returns:
+        np.ndarray: The reduced data, flattened over the kept axes
+    """
+    code, skipna = STATISTICS[statistic]
+    skipna = skipna and data.dtype.kind in "fc"
+    extremum = code in (MIN, MAX, PTP)
+    if _reduce_by_rows(shape):
+        rows = np.reshape(data, shape)
+        if extremum:
+            return extrema_rows(rows, code)
+        return reduce_rows(rows, code, skipna)
+    num_outer, num_kept, num_inner = shape
+    columns = np.reshape(data, (num_outer, num_kept * num_inner))
+    num_chunks, num_blocks = column_chunks(*columns.shape)
+    if extremum:
+        return extrema_columns(columns, code, num_inner, num_chunks, num_blocks)
+    return reduce_columns(columns, code, skipna, num_inner, num_chunks, num_blocks)
@@ -0,0 +1,34 @@
+"""Per-slice extrema for the generated min and max kernels.
+
+Inside a parallel kernel numba rewrites np.min and np.max into parfor
+reductions that compare with < and >, so a NaN is kept or dropped depending on
+where it is in the slice. Calling them from a separate (non-parallel) function
+keeps numpy's semantics: the result is NaN if the slice contains a NaN.
+"""
+
+import numba as nb
+import numpy as np
+
+
+@nb.njit(nogil=True, cache=True)
+def min(data: np.ndarray):
+    """Minimum of a slice (NaN if it contains a NaN)."""
+    return np.min(data)
+
+
+@nb.njit(nogil=True, cache=True)
+def max(data: np.ndarray):
+    """Maximum of a slice (NaN if it contains a NaN)."""
+    return np.max(data)
+
+
+@nb.njit(nogil=True, cache=True)
+def nanmin(data: np.ndarray):
+    """Minimum of a slice, ignoring NaNs."""
+    return np.nanmin(data)
+
+
+@nb.njit(nogil=True, cache=True)
+def nanmax(data: np.ndarray):
+    """Maximum of a slice, ignoring NaNs."""
+    return np.nanmax(data)
@@ -0,0 +1,810 @@
+"""Hand-written per-slice kernels for statistics that numpy doesn't provide.
+
+The generated modules in this package call these functions on each slice of the
+data (exactly like they call ``np.mean`` etc.), so every kernel here takes an
+array of any dimensionality and returns a scalar.
+"""
+
+import numba as nb
+import numpy as np
+
+
+@nb.njit(nogil=True, cache=True)
+def _gather(data: np.ndarray, skipna: bool):
+    """Copy a slice into a flat float64 buffer, optionally dropping NaNs.
+
+    Returns the buffer and the number of valid elements at the start of it. If
+    NaNs aren't skipped, the count is -1 when the slice contains any NaN so the
+    caller can propagate it (selection on NaNs isn't well defined).
+    """
+    buffer = np.empty(data.size, dtype=np.float64)
+    n = 0
+    has_nan = False
+    for value in data.flat:
+        if np.isnan(value):
+            has_nan = True
+            if skipna:
+                continue
+            break
+        buffer[n] = value
+        n += 1
+    if has_nan and not skipna:
+        n = -1
+    return buffer, n
+
+
+@nb.njit(nogil=True, cache=True)
+def _select(a: np.ndarray, lo: int, hi: int, k: int) -> None:
+    """Partially sort a[lo:hi+1] in place so that a[k] is in its sorted position.
+
+    After the call, a[lo:k] <= a[k] <= a[k+1:hi+1] (an nth_element quickselect).
+    """
+    while hi > lo:
+        mid = (lo + hi) // 2
+        # Median-of-three pivot keeps already sorted slices from going quadratic
+        if a[mid] < a[lo]:
+            a[mid], a[lo] = a[lo], a[mid]
+        if a[hi] < a[lo]:
+            a[hi], a[lo] = a[lo], a[hi]
+        if a[hi] < a[mid]:
+            a[hi], a[mid] = a[mid], a[hi]
+        pivot = a[mid]
+        i = lo
+        j = hi
+        while i <= j:
+            while a[i] < pivot:
+                i += 1
+            while a[j] > pivot:
+                j -= 1
+            if i <= j:
+                a[i], a[j] = a[j], a[i]
+                i += 1
+                j -= 1
+        if k <= j:
+            hi = j
+        elif k >= i:
+            lo = i
+        else:
+            return
+
+
+@nb.njit(nogil=True, cache=True)
+def _median_inplace(a: np.ndarray, n: int) -> float:
+    """Median of the first n elements of a, reordering them in the process.
+
+    NaN if there are none, or if n is -1 (a slice containing NaNs, see _gather).
+    """
+    if n <= 0:
+        return np.nan
+    half = n // 2
+    _select(a, 0, n - 1, half)
+    if n % 2 == 1:
+        return a[half]
+    # After selection, the lower middle value is the max of the lower half
+    lower = a[0]
+    for i in range(1, half):
+        if a[i] > lower:
+            lower = a[i]
+    return 0.5 * (lower + a[half])
+
+
+@nb.njit(nogil=True, cache=True)
+def _trimmed_bounds(a: np.ndarray, n: int, proportion: float):
+    """Select the order statistics bounding the central part of a[:n].
+
+    Uses two selections instead of a full sort. Returns the number of elements
+    cut from each tail (or -1 if nothing would be left after trimming).
+    """
+    cut = int(proportion * n)
+    if n - 2 * cut <= 0:
+        return -1
+    _select(a, 0, n - 1, cut)
+    _select(a, cut, n - 1, n - cut - 1)
+    return cut
+
+
+@nb.njit(nogil=True, cache=True)
+def _trim_mean(a: np.ndarray, n: int, proportion: float) -> float:
+    if n < 0:
+        return np.nan
+    cut = _trimmed_bounds(a, n, proportion)
+    if cut < 0:
+        return np.nan
+    total = 0.0
+    for i in range(cut, n - cut):
+        total += a[i]
+    return total / (n - 2 * cut)
+
+
+@nb.njit(nogil=True, cache=True)
+def _winsorized_mean(a: np.ndarray, n: int, proportion: float) -> float:
+    if n < 0:
+        return np.nan
+    cut = _trimmed_bounds(a, n, proportion)
+    if cut < 0:
+        return np.nan
+    total = cut * (a[cut] + a[n - cut - 1])
+    for i in range(cut, n - cut):
+        total += a[i]
+    return total / n
+
+
+@nb.njit(nogil=True, cache=True)
+def _median_abs_deviation(a: np.ndarray, n: int) -> float:
+    if n < 0:
+        return np.nan
+    center = _median_inplace(a, n)
+    for i in range(n):
+        a[i] = abs(a[i] - center)
+    return _median_inplace(a, n)
+
+
+@nb.njit(nogil=True, cache=True)
+def _lerp(below: float, above: float, t: float) -> float:
+    """Linear interpolation, arranged like numpy's (so results match exactly)."""
+    diff = above - below
+    if t >= 0.5:
+        return above - diff * (1 - t)
+    return below + diff * t
+
+
+@nb.njit(nogil=True, cache=True)
+def _min_of(a: np.ndarray, lo: int, hi: int) -> float:
+    """Smallest of a[lo:hi]."""
+    smallest = a[lo]
+    for i in range(lo + 1, hi):
+        if a[i] < smallest:
+            smallest = a[i]
+    return smallest
+
+
+@nb.njit(nogil=True, cache=True)
+def _quartiles_inplace(a: np.ndarray, n: int, out: np.ndarray) -> None:
+    """25th, 50th and 75th percentiles of a[:n] (like np.percentile) into out.
+
+    The median is selected first, which partitions a[:n] into halves, and each
+    quartile is then selected within its half, so the three selections touch
+    about twice as many elements as one selection (instead of three times).
+    The element after each selected one (for the interpolation) is the
+    smallest of the part of its half above it.
+    """
+    if n <= 0:
+        out[:] = np.nan
+        return
+    last = n - 1
+
+    # Median
+    mid = last // 2
+    _select(a, 0, last, mid)
+    above_mid = a[mid] if mid == last else _min_of(a, mid + 1, n)
+    out[1] = _lerp(a[mid], above_mid, 0.5 * last - mid)
+
+    # Lower quartile, within a[:mid] (or the median itself)
+    position = 0.25 * last
+    k = int(position)
+    if k == mid:
+        out[0] = _lerp(a[mid], above_mid, position - k)
+    else:
+        _select(a, 0, mid - 1, k)
+        above = a[mid] if k + 1 == mid else _min_of(a, k + 1, mid)
+        out[0] = _lerp(a[k], above, position - k)
+
+    # Upper quartile, within a[mid + 1:n] (or the median itself)
+    position = 0.75 * last
+    k = int(position)
+    if k == mid:
+        out[2] = _lerp(a[mid], above_mid, position - k)
+    else:
+        _select(a, mid + 1, last, k)
+        above = a[k] if k == last else _min_of(a, k + 1, n)
+        out[2] = _lerp(a[k], above, position - k)
+
+
+@nb.njit(nogil=True, cache=True)
+def _iqr(a: np.ndarray, n: int) -> float:
+    quartiles = np.empty(3)
+    _quartiles_inplace(a, n, quartiles)
+    return quartiles[2] - quartiles[0]
+
+
+@nb.njit(nogil=True, cache=True)
+def trim_mean(data: np.ndarray, proportion: float) -> float:
+    """Mean after cutting ``proportion`` of the values from each tail."""
+    a, n = _gather(data, False)
+    return _trim_mean(a, n, proportion)
+
+
+@nb.njit(nogil=True, cache=True)
+def nantrim_mean(data: np.ndarray, proportion: float) -> float:
+    """Mean after cutting ``proportion`` of the values from each tail, ignoring NaNs."""
+    a, n = _gather(data, True)
+    return _trim_mean(a, n, proportion)
+
+
+@nb.njit(nogil=True, cache=True)
+def winsorized_mean(data: np.ndarray, proportion: float) -> float:
+    """Mean after clipping ``proportion`` of the values in each tail to the cut values."""
+    a, n = _gather(data, False)
+    return _winsorized_mean(a, n, proportion)
+
+
+@nb.njit(nogil=True, cache=True)
+def nanwinsorized_mean(data: np.ndarray, proportion: float) -> float:
+    """Winsorized mean ignoring NaNs."""
+    a, n = _gather(data, True)
+    return _winsorized_mean(a, n, proportion)
+
+
+@nb.njit(nogil=True, cache=True)
+def median(data: np.ndarray) -> float:
+    """Median (NaN if the slice contains a NaN, which np.median doesn't check)."""
+    a, n = _gather(data, False)
+    return _median_inplace(a, n)
+
+
+@nb.njit(nogil=True, cache=True)
+def nanmedian(data: np.ndarray) -> float:
+    """Median ignoring NaNs."""
+    a, n = _gather(data, True)
+    return _median_inplace(a, n)
+
+
+@nb.njit(nogil=True, cache=True)
+def median_abs_deviation(data: np.ndarray) -> float:
+    """Median of the absolute deviations from the median (unscaled)."""
+    a, n = _gather(data, False)
+    return _median_abs_deviation(a, n)
+
+
+@nb.njit(nogil=True, cache=True)
+def nanmedian_abs_deviation(data: np.ndarray) -> float:
+    """Median of the absolute deviations from the median (unscaled), ignoring NaNs."""
+    a, n = _gather(data, True)
+    return _median_abs_deviation(a, n)
+
+
+@nb.njit(nogil=True, cache=True)
+def iqr(data: np.ndarray) -> float:
+    """Interquartile range (75th minus 25th percentile)."""
+    a, n = _gather(data, False)
+    return _iqr(a, n)
+
+
+@nb.njit(nogil=True, cache=True)
+def naniqr(data: np.ndarray) -> float:
+    """Interquartile range (75th minus 25th percentile), ignoring NaNs."""
+    a, n = _gather(data, True)
+    return _iqr(a, n)
+
+
+@nb.njit(parallel=True, nogil=True, cache=True)
+def quartile_rows(data: np.ndarray, skipna: bool) -> np.ndarray:
+    """Quartiles of each data[:, k, :] of an (outer, kept, inner) array, as (3, kept)."""
+    num_kept = data.shape[1]
+    output = np.empty((3, num_kept))
+    for k in nb.prange(num_kept):
+        a, n = _gather(data[:, k, :], skipna)
+        _quartiles_inplace(a, n, output[:, k])
+    return output
+
+
+# Interpolation methods of np.quantile (method=), by the code the kernels take
+INVERTED_CDF = 0
+AVERAGED_INVERTED_CDF = 1
+CLOSEST_OBSERVATION = 2
+INTERPOLATED_INVERTED_CDF = 3
+HAZEN = 4
+WEIBULL = 5
+LINEAR = 6
+MEDIAN_UNBIASED = 7
+NORMAL_UNBIASED = 8
+LOWER = 9
+HIGHER = 10
+MIDPOINT = 11
+NEAREST = 12
+
+INTERPOLATION_METHODS = {
+    "inverted_cdf": INVERTED_CDF,
+    "averaged_inverted_cdf": AVERAGED_INVERTED_CDF,
+    "closest_observation": CLOSEST_OBSERVATION,
+    "interpolated_inverted_cdf": INTERPOLATED_INVERTED_CDF,
+    "hazen": HAZEN,
+    "weibull": WEIBULL,
+    "linear": LINEAR,
+    "median_unbiased": MEDIAN_UNBIASED,
+    "normal_unbiased": NORMAL_UNBIASED,
+    "lower": LOWER,
+    "higher": HIGHER,
+    "midpoint": MIDPOINT,
+    "nearest": NEAREST,
+}
+
+
+@nb.njit(nogil=True, cache=True)
+def _order_statistic(n: int, q: float, mode: int) -> int:
+    """Index of the quantile for the discrete methods (-1 for the others)."""
+    if mode == LOWER:
+        return int(np.floor((n - 1) * q))
+    if mode == HIGHER:
+        return int(np.ceil((n - 1) * q))
+    if mode == NEAREST:
+        return int(np.rint((n - 1) * q))
+    if mode == INVERTED_CDF or mode == CLOSEST_OBSERVATION:
+        index = n * q - 1
+        if mode == CLOSEST_OBSERVATION:
+            # Ties go to the even order statistic (odd, counting from 0)
+            index -= 0.5
+        previous = np.floor(index)
+        if index == previous and (mode == INVERTED_CDF or previous % 2 == 1):
+            return max(int(previous), 0)
+        return max(int(previous) + 1, 0)
+    return -1
+
+
+@nb.njit(nogil=True, cache=True)
+def _virtual_index(n: int, q: float, mode: int) -> float:
+    """Fractional index of the quantile for the interpolating methods."""
+    if mode == LINEAR:
+        return (n - 1) * q
+    if mode == AVERAGED_INVERTED_CDF:
+        return n * q - 1
+    if mode == MIDPOINT:
+        return 0.5 * (np.floor((n - 1) * q) + np.ceil((n - 1) * q))
+    if mode == INTERPOLATED_INVERTED_CDF:
+        alpha, beta = 0.0, 1.0
+    elif mode == HAZEN:
+        alpha, beta = 0.5, 0.5
+    elif mode == WEIBULL:
+        alpha, beta = 0.0, 0.0
+    elif mode == MEDIAN_UNBIASED:
+        alpha, beta = 1 / 3.0, 1 / 3.0
+    else:
+        alpha, beta = 3 / 8.0, 3 / 8.0
+    return n * q + (alpha + q * (1 - alpha - beta)) - 1
+
+
+@nb.njit(nogil=True, cache=True)
+def _quantile_inplace(a: np.ndarray, n: int, q: float, mode: int) -> float:
+    """Quantile q of a[:n] with one of numpy's interpolation methods.
+
+    The discrete methods select a single order statistic. The others select the
+    one below the quantile and take the smallest value above it (which is the
+    next order statistic) for the interpolation.
+    """
+    if n <= 0:
+        return np.nan
+    k = _order_statistic(n, q, mode)
+    if k >= 0:
+        _select(a, 0, n - 1, k)
+        return a[k]
+
+    index = _virtual_index(n, q, mode)
+    previous = np.floor(index)
+    t = index - previous
+    if mode == AVERAGED_INVERTED_CDF:
+        t = 0.5 if t == 0 else 1.0
+    elif mode == MIDPOINT:
+        t = 0.0 if t == 0 else 0.5
+
+    # Quantiles outside the order statistics are clamped to the extremes
+    if index >= n - 1 or index < 0:
+        k = n - 1 if index >= n - 1 else 0
+        _select(a, 0, n - 1, k)
+        return _lerp(a[k], a[k], t)
+    k = int(previous)
+    _select(a, 0, n - 1, k)
+    return _lerp(a[k], _min_of(a, k + 1, n), t)
+
+
+@nb.njit(nogil=True, cache=True)
+def quantile_interpolated(data: np.ndarray, params) -> float:
+    """Quantile with another interpolation (params is (q, method code))."""
+    q, mode = params
+    a, n = _gather(data, False)
+    return _quantile_inplace(a, n, q, mode)
+
+
+@nb.njit(nogil=True, cache=True)
+def nanquantile_interpolated(data: np.ndarray, params) -> float:
+    """Quantile with another interpolation, ignoring NaNs."""
+    q, mode = params
+    a, n = _gather(data, True)
+    return _quantile_inplace(a, n, q, mode)
+
+
+@nb.njit(nogil=True, cache=True)
+def percentile_interpolated(data: np.ndarray, params) -> float:
+    """Percentile with another interpolation (params is (q, method code))."""
+    q, mode = params
+    a, n = _gather(data, False)
+    return _quantile_inplace(a, n, q / 100, mode)
+
+
+@nb.njit(nogil=True, cache=True)
+def nanpercentile_interpolated(data: np.ndarray, params) -> float:
+    """Percentile with another interpolation, ignoring NaNs."""
+    q, mode = params
+    a, n = _gather(data, True)
+    return _quantile_inplace(a, n, q / 100, mode)
+
+
+# Bits of an integer counted in each pass of the counting kernels
+COUNTING_BITS = 8
+COUNTING_BINS = 2**COUNTING_BITS
+
+# Shortest slice (per pass, so per byte of the dtype) the counting kernels are
+# used for: below it, clearing and scanning the bins costs more than selecting
+COUNTING_MIN_LENGTH = 48
+
+
+@nb.njit(nogil=True, cache=True)
+def _count_digits(data: np.ndarray, low: int, shift: int, prefix: int) -> np.ndarray:
+    """Histogram of the digit at shift of the values whose higher digits are prefix."""
+    counts = np.zeros(COUNTING_BINS, dtype=np.int64)
+    for value in data.flat:
+        key = np.int64(value) - low
+        if key >> (shift + COUNTING_BITS) == prefix:
+            counts[(key >> shift) & (COUNTING_BINS - 1)] += 1
+    return counts
+
+
+@nb.njit(nogil=True, cache=True)
+def _counting_select(data: np.ndarray, k: int, low: int, bits: int):
+    """k-th smallest value of an integer slice, by counting.
+
+    Each pass counts one digit of the values (offset by low, the smallest value
+    of the dtype) that match the digits found so far, and the counts give the
+    digit of the k-th value, so the slice is read in place (bits / 8 times).
+
+    Returns the value, its rank among the values in its bin of the last pass,
+    and the counts of the last pass.
+    """
+    prefix = 0
+    shift = bits
+    counts = np.zeros(COUNTING_BINS, dtype=np.int64)
+    while shift > 0:
+        shift -= COUNTING_BITS
+        counts = _count_digits(data, low, shift, prefix)
+        digit = 0
+        while counts[digit] <= k:
+            k -= counts[digit]
+            digit += 1
+        prefix = (prefix << COUNTING_BITS) | digit
+    return prefix + low, k, counts
+
+
+@nb.njit(nogil=True, cache=True)
+def _counting_next(
+    data: np.ndarray,
+    k: int,
+    low: int,
+    bits: int,
+    value: int,
+    rank: int,
+    counts: np.ndarray,
+) -> int:
+    """Value after the k-th smallest (from the results of _counting_select)."""
+    digit = (value - low) & (COUNTING_BINS - 1)
+    if rank + 1 < counts[digit]:
+        return value
+
+    # The next value is in a later bin of the last pass, or else has other
+    # higher digits (and is found by another selection)
+    for next_digit in range(digit + 1, COUNTING_BINS):
+        if counts[next_digit] > 0:
+            return value - digit + next_digit
+    return _counting_select(data, k + 1, low, bits)[0]
+
+
+@nb.njit(nogil=True, cache=True)
+def _counting_quantile(data: np.ndarray, q: float) -> float:
+    """Quantile q (with linear interpolation) of an 8 or 16 bit integer slice."""
+    n = data.size
+    if n == 0:
+        return np.nan
+    info = np.iinfo(data.dtype)
+    position = q * (n - 1)
+    k = int(position)
+    t = position - k
+    below, rank, counts = _counting_select(data, k, info.min, info.bits)
+    if t == 0:
+        return float(below)
+    above = _counting_next(data, k, info.min, info.bits, below, rank, counts)
+    return _lerp(float(below), float(above), t)
+
+
+@nb.njit(nogil=True, cache=True)
+def median_counting(data: np.ndarray) -> float:
+    """Median of a small integer slice, by counting."""
+    return _counting_quantile(data, 0.5)
+
+
+@nb.njit(nogil=True, cache=True)
+def quantile_counting(data: np.ndarray, q: float) -> float:
+    """Quantile of a small integer slice, by counting."""
+    if not 0 <= q <= 1:
+        raise ValueError("Quantiles must be in the range [0, 1]")
+    return _counting_quantile(data, q)
+
+
+@nb.njit(nogil=True, cache=True)
+def percentile_counting(data: np.ndarray, q: float) -> float:
+    """Percentile of a small integer slice, by counting."""
+    if not 0 <= q <= 100:
+        raise ValueError("Percentiles must be in the range [0, 100]")
+    return _counting_quantile(data, q / 100)
+
+
+# Number of values summed with independent accumulators before a pairwise step
+# (the same block size numpy uses for its pairwise summation)
+PAIRWISE_BLOCK = 128
+
+
+@nb.njit(nogil=True, cache=True)
+def _deviation(value: float, center: float, squared: bool) -> float:
+    deviation = value - center
+    if squared:
+        return deviation * deviation
+    return deviation
+
+
+@nb.njit(nogil=True, cache=True)
+def _kahan_sum(data: np.ndarray, center: float, squared: bool, skipna: bool):
+    """Neumaier-compensated sum of the (optionally squared) deviations from center.
+
+    Returns the sum and the number of values that went into it.
+    """
+    total = 0.0
+    compensation = 0.0
+    count = 0
+    for value in data.flat:
+        if skipna and np.isnan(value):
+            continue
+        x = _deviation(value, center, squared)
+        t = total + x
+        if abs(total) >= abs(x):
+            compensation += (total - t) + x
+        else:
+            compensation += (x - t) + total
+        total = t
+        count += 1
+    # The compensation is meaningless (NaN) once the sum overflows
+    if np.isfinite(total):
+        total += compensation
+    return total, count
+
+
+@nb.njit(nogil=True, cache=True)
+def _pairwise_sum(data: np.ndarray, center: float, squared: bool, skipna: bool):
+    """Pairwise sum of the (optionally squared) deviations from center.
+
+    Values are summed in blocks of PAIRWISE_BLOCK using eight independent
+    accumulators, and block sums are combined as a balanced binary tree using a
+    stack of partial sums (one per tree level), so no copy of the data is made.
+    Returns the sum and the number of values that went into it.
+    """
+    partials = np.zeros(8)
+    stack = np.empty(64)
+    levels = np.empty(64, dtype=np.int64)
+    depth = 0
+    in_block = 0
+    count = 0
+    for value in data.flat:
+        if skipna and np.isnan(value):
+            continue
+        partials[in_block % 8] += _deviation(value, center, squared)
+        in_block += 1
+        count += 1
+        if in_block == PAIRWISE_BLOCK:
+            block_sum = ((partials[0] + partials[1]) + (partials[2] + partials[3])) + (
+                (partials[4] + partials[5]) + (partials[6] + partials[7])
+            )
+            partials[:] = 0.0
+            in_block = 0
+            stack[depth] = block_sum
+            levels[depth] = 0
+            depth += 1
+            # Merge equal-sized subtrees, like carrying in a binary counter
+            while depth >= 2 and levels[depth - 1] == levels[depth - 2]:
+                stack[depth - 2] += stack[depth - 1]
+                levels[depth - 2] += 1
+                depth -= 1
+
+    total = ((partials[0] + partials[1]) + (partials[2] + partials[3])) + (
+        (partials[4] + partials[5]) + (partials[6] + partials[7])
+    )
+    for level in range(depth - 1, -1, -1):
+        total = stack[level] + total
+    return total, count
+
+
+@nb.njit(nogil=True, cache=True)
+def _compensated_sum(
+    data: np.ndarray, center: float, squared: bool, skipna: bool, kahan: bool
+):
+    if kahan:
+        return _kahan_sum(data, center, squared, skipna)
+    return _pairwise_sum(data, center, squared, skipna)
+
+
+@nb.njit(nogil=True, cache=True)
+def _compensated_mean(data: np.ndarray, skipna: bool, kahan: bool) -> float:
+    total, count = _compensated_sum(data, 0.0, False, skipna, kahan)
+    if count == 0:
+        return np.nan
+    return total / count
+
+
+@nb.njit(nogil=True, cache=True)
+def _compensated_var(data: np.ndarray, skipna: bool, kahan: bool) -> float:
+    """Two-pass variance, with both passes using compensated summation."""
+    center = _compensated_mean(data, skipna, kahan)
+    if np.isnan(center):
+        return np.nan
+    total, count = _compensated_sum(data, center, True, skipna, kahan)
+    return total / count
+
+
+@nb.njit(nogil=True, cache=True)
+def sum_pairwise(data: np.ndarray) -> float:
+    return _pairwise_sum(data, 0.0, False, False)[0]
+
+
+@nb.njit(nogil=True, cache=True)
+def nansum_pairwise(data: np.ndarray) -> float:
+    return _pairwise_sum(data, 0.0, False, True)[0]
+
+
+@nb.njit(nogil=True, cache=True)
+def sum_kahan(data: np.ndarray) -> float:
+    return _kahan_sum(data, 0.0, False, False)[0]
+
+
+@nb.njit(nogil=True, cache=True)
+def nansum_kahan(data: np.ndarray) -> float:
+    return _kahan_sum(data, 0.0, False, True)[0]
+
+
+@nb.njit(nogil=True, cache=True)
+def mean_pairwise(data: np.ndarray) -> float:
+    return _compensated_mean(data, False, False)
+
+
+@nb.njit(nogil=True, cache=True)
+def nanmean_pairwise(data: np.ndarray) -> float:
+    return _compensated_mean(data, True, False)
+
+
+@nb.njit(nogil=True, cache=True)
+def mean_kahan(data: np.ndarray) -> float:
+    return _compensated_mean(data, False, True)
+
+
+@nb.njit(nogil=True, cache=True)
+def nanmean_kahan(data: np.ndarray) -> float:
+    return _compensated_mean(data, True, True)
+
+
+@nb.njit(nogil=True, cache=True)
+def var_pairwise(data: np.ndarray) -> float:
+    return _compensated_var(data, False, False)
+
+
+@nb.njit(nogil=True, cache=True)
+def nanvar_pairwise(data: np.ndarray) -> float:
+    return _compensated_var(data, True, False)
+
+
+@nb.njit(nogil=True, cache=True)
+def var_kahan(data: np.ndarray) -> float:
+    return _compensated_var(data, False, True)
+
+
+@nb.njit(nogil=True, cache=True)
+def nanvar_kahan(data: np.ndarray) -> float:
+    return _compensated_var(data, True, True)
+
+
+@nb.njit(nogil=True, cache=True)
+def std_pairwise(data: np.ndarray) -> float:
+    return np.sqrt(_compensated_var(data, False, False))
+
+
+@nb.njit(nogil=True, cache=True)
+def nanstd_pairwise(data: np.ndarray) -> float:
+    return np.sqrt(_compensated_var(data, True, False))
+
+
+@nb.njit(nogil=True, cache=True)
+def std_kahan(data: np.ndarray) -> float:
+    return np.sqrt(_compensated_var(data, False, True))
+
+
+@nb.njit(nogil=True, cache=True)
+def nanstd_kahan(data: np.ndarray) -> float:
+    return np.sqrt(_compensated_var(data, True, True))
+
+
+# Chunks of a parallel pairwise reduction hold a power of two number of blocks,
+# so each full chunk is a complete subtree of the serial pairwise tree
+PAIRWISE_CHUNK = PAIRWISE_BLOCK * 2**10
+
+
+@nb.njit(parallel=True, nogil=True, cache=True)
+def _chunked_pairwise_sum(data: np.ndarray, center: float, squared: bool, skipna: bool):
+    """Pairwise sum of a 1D array, computed over fixed-size chunks in parallel.
+
+    Chunk totals are combined with the same stack of partial sums as the serial
+    kernel, so without NaNs the result is bit-identical to _pairwise_sum, and it
+    never depends on the number of threads.
+    """
+    n = data.size
+    num_chunks = (n + PAIRWISE_CHUNK - 1) // PAIRWISE_CHUNK
+    totals = np.empty(num_chunks)
+    counts = np.empty(num_chunks, dtype=np.int64)
+    for c in nb.prange(num_chunks):
+        start = c * PAIRWISE_CHUNK
+        stop = min(start + PAIRWISE_CHUNK, n)
+        totals[c], counts[c] = _pairwise_sum(data[start:stop], center, squared, skipna)
+
+    stack = np.empty(64)
+    levels = np.empty(64, dtype=np.int64)
+    depth = 0
+    num_full = n // PAIRWISE_CHUNK
+    for c in range(num_full):
+        stack[depth] = totals[c]
+        levels[depth] = 0
+        depth += 1
+        while depth >= 2 and levels[depth - 1] == levels[depth - 2]:
+            stack[depth - 2] += stack[depth - 1]
+            levels[depth - 2] += 1
+            depth -= 1
+
+    # A trailing partial chunk plays the role of the serial kernel's last block
+    total = totals[num_full] if num_full < num_chunks else 0.0
+    for level in range(depth - 1, -1, -1):
+        total = stack[level] + total
+    return total, counts.sum()
+
+
+@nb.njit(nogil=True, cache=True)
+def pairwise_reduction(data: np.ndarray, statistic: str, skipna: bool) -> float:
+    """Full reduction of a 1D array with the parallel pairwise kernel.
+
+    Args:
+        data: 1D array to reduce
+        statistic: one of "sum", "mean", "var" or "std"
+        skipna: whether to ignore NaNs
+    """
+    total, count = _chunked_pairwise_sum(data, 0.0, False, skipna)
+    if statistic == "sum":
+        return total
+    if count == 0:
+        return np.nan
+    center = total / count
+    if statistic == "mean":
+        return center
+    total, count = _chunked_pairwise_sum(data, center, True, skipna)
+    if statistic == "var":
+        return total / count
+    return np.sqrt(total / count)
+
+
+@nb.njit(nogil=True, cache=True)
+def _any_nan(data: np.ndarray) -> bool:
+    # Without a branch to stop at the first NaN the loop vectorizes, which is
+    # faster on the (usual) inputs without NaNs
+    found = False
+    for i in range(data.size):
+        found |= np.isnan(data[i])
+    return found
+
+
+@nb.njit(parallel=True, nogil=True, cache=True)
+def contains_nan(data: np.ndarray) -> bool:
+    """Whether a 1D array contains a NaN, scanning chunks of it in parallel."""
+    num_chunks = -(-data.size // PAIRWISE_CHUNK)
+    found = np.zeros(num_chunks, dtype=np.bool_)
+    for c in nb.prange(num_chunks):
+        found[c] = _any_nan(data[c * PAIRWISE_CHUNK : (c + 1) * PAIRWISE_CHUNK])
+    return found.any()
@@ -0,0 +1,148 @@
+"""Reductions over the unmasked values of data (numpy's ``where=``).
+
+The kernels work on an (outer, kept, inner) view of the data and of the mask
+(see speedystats.numba.contiguous), which is free for C-contiguous data with
+consecutive kept axes. For each output, the unmasked (and, for the nan
+variants, non-NaN) values are gathered into a small buffer while the mask is
+read, so the data is never filled with NaNs or copied as a whole.
+"""
+
+import numba as nb
+import numpy as np
+from . import kernels
+
+SUM = 0
+MEAN = 1
+VAR = 2
+STD = 3
+MIN = 4
+MAX = 5
+PTP = 6
+QUANTILE = 7
+TRIM_MEAN = 8
+WINSORIZED_MEAN = 9
+MEDIAN_ABS_DEVIATION = 10
+IQR = 11
+
+# Summation used by the moment statistics (see the accuracy modes)
+FAST = 0
+PAIRWISE = 1
+KAHAN = 2
+
+# Statistic code of each (non-nan) method
+MASKED_STATISTICS = {
+    "sum": SUM,
+    "mean": MEAN,
+    "average": MEAN,
+    "var": VAR,
+    "std": STD,
+    "min": MIN,
+    "max": MAX,
+    "ptp": PTP,
+    "median": QUANTILE,
+    "quantile": QUANTILE,
+    "percentile": QUANTILE,
+    "trim_mean": TRIM_MEAN,
+    "winsorized_mean": WINSORIZED_MEAN,
+    "median_abs_deviation": MEDIAN_ABS_DEVIATION,
+    "iqr": IQR,
+}
+
+MASKED_SUMMATIONS = {"fast": FAST, "pairwise": PAIRWISE, "kahan": KAHAN}
+
+
+@nb.njit(nogil=True, cache=True)
+def _moment(values: np.ndarray, statistic: int, summation: int) -> float:
+    if summation == FAST:
+        if statistic == SUM:
+            return np.sum(values)
+        if statistic == MEAN:
+            return np.mean(values)
+        if statistic == VAR:
+            return np.var(values)
+        return np.std(values)
+    kahan = summation == KAHAN
+    if statistic == SUM:
+        return kernels._compensated_sum(values, 0.0, False, False, kahan)[0]
+    if statistic == MEAN:
+        return kernels._compensated_mean(values, False, kahan)
+    variance = kernels._compensated_var(values, False, kahan)
+    if statistic == VAR:
+        return variance
+    return np.sqrt(variance)
+
+
+@nb.njit(nogil=True, cache=True)
+def _statistic(
+    buffer: np.ndarray,
+    n: int,
+    statistic: int,
+    summation: int,
+    q: float,
+    interpolation: int,
+) -> float:
+    """Statistic of the first n values of buffer (which may be reordered)."""
+    if n == 0:
+        return 0.0 if statistic == SUM else np.nan
+    values = buffer[:n]
+    if statistic <= STD:
+        return _moment(values, statistic, summation)
+    if statistic == MIN:
+        return np.min(values)
+    if statistic == MAX:
+        return np.max(values)
+    if statistic == PTP:
+        return np.max(values) - np.min(values)
+    if statistic == QUANTILE:
+        if interpolation == kernels.LINEAR:
+            return np.quantile(values, q)
+        return kernels._quantile_inplace(buffer, n, q, interpolation)
+    if statistic == TRIM_MEAN:
+        return kernels._trim_mean(buffer, n, q)
+    if statistic == WINSORIZED_MEAN:
+        return kernels._winsorized_mean(buffer, n, q)
+    if statistic == IQR:
+        return kernels._iqr(buffer, n)
+    return kernels._median_abs_deviation(buffer, n)
+
+
+@nb.njit(parallel=True, nogil=True, cache=True)
+def reduce_masked(
+    data: np.ndarray,
+    mask: np.ndarray,
+    statistic: int,
+    skipna: bool,
+    summation: int,
+    q: float,
+    interpolation: int,
+) -> np.ndarray:
+    """Reduce an (outer, kept, inner) array over the values where mask is True.
+
+    interpolation is the method code of the quantiles (see
+    kernels.INTERPOLATION_METHODS).
+    """
+    num_outer, num_outputs, num_inner = data.shape
+    output = np.empty(num_outputs)
+    for m in nb.prange(num_outputs):
+        buffer = np.empty(num_outer * num_inner)
+        n = 0
+        has_nan = False
+        for a in range(num_outer):
+            for b in range(num_inner):
+                if not mask[a, m, b]:
+                    continue
+                value = data[a, m, b]
+                if value != value:
+                    if skipna:
+                        continue
+                    has_nan = True
+                    break
+                buffer[n] = value
+                n += 1
+            if has_nan:
+                break
+        if has_nan:
+            output[m] = np.nan
+        else:
+            output[m] = _statistic(buffer, n, statistic, summation, q, interpolation)
+    return output
@@ -0,0 +1,407 @@
+from typing import Tuple
+import numba as nb
+import numpy as np
+from . import kernels
+
+
+def get_median_abs_deviation(data: np.ndarray, keep_axes: Tuple[int]) -> np.ndarray:
+    if keep_axes not in KERNELS:
+        raise ValueError(
+            f"Invalid data shape for median_abs_deviation, received: {keep_axes}"
+        )
+    return KERNELS[keep_axes](data)
+
+
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
+def numba_median_abs_deviation_keep0(data: np.ndarray) -> np.ndarray:
+    """Numba speedup for median_abs_deviation reducing all but axes (0,)"""
+    output = np.zeros((data.shape[0]))
+    for n0 in nb.prange(data.shape[0]):
+        output[n0] = kernels.median_abs_deviation(data[n0])
+    return output
+
+
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
+def numba_median_abs_deviation_keep1(data: np.ndarray) -> np.ndarray:
+    """Numba speedup for median_abs_deviation reducing all but axes (1,)"""
+    output = np.zeros((data.shape[1]))
+    for n0 in nb.prange(data.shape[1]):
+        output[n0] = kernels.median_abs_deviation(data[:, n0])
+    return output
+
+
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
+def numba_median_abs_deviation_keep2(data: np.ndarray) -> np.ndarray:
+    """Numba speedup for median_abs_deviation reducing all but axes (2,)"""
+    output = np.zeros((data.shape[2]))
+    for n0 in nb.prange(data.shape[2]):
+        output[n0] = kernels.median_abs_deviation(data[:, :, n0])
+    return output
+
+
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
+def numba_median_abs_deviation_keep3(data: np.ndarray) -> np.ndarray:
+    """Numba speedup for median_abs_deviation reducing all but axes (3,)"""
+    output = np.zeros((data.shape[3]))
+    for n0 in nb.prange(data.shape[3]):
+        output[n0] = kernels.median_abs_deviation(data[:, :, :, n0])
+    return output
+
+
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
+def numba_median_abs_deviation_keep4(data: np.ndarray) -> np.ndarray:
+    """Numba speedup for median_abs_deviation reducing all but axes (4,)"""
+    output = np.zeros((data.shape[4]))
+    for n0 in nb.prange(data.shape[4]):
+        output[n0] = kernels.median_abs_deviation(data[:, :, :, :, n0])
+    return output
+
+
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
+def numba_median_abs_deviation_keep01(data: np.ndarray) -> np.ndarray:
+    """Numba speedup for median_abs_deviation reducing all but axes (0, 1)"""
+    output = np.zeros((data.shape[0], data.shape[1]))
+    for n in nb.prange(data.shape[0] * data.shape[1]):
+        n1 = n % data.shape[1]
+        n0 = n // data.shape[1]
+        output[n0, n1] = kernels.median_abs_deviation(data[n0, n1])
+    return output
+
+
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
+def numba_median_abs_deviation_keep02(data: np.ndarray) -> np.ndarray:
+    """Numba speedup for median_abs_deviation reducing all but axes (0, 2)"""
+    output = np.zeros((data.shape[0], data.shape[2]))
+    for n in nb.prange(data.shape[0] * data.shape[2]):
+        n1 = n % data.shape[2]
+        n0 = n // data.shape[2]
+        output[n0, n1] = kernels.median_abs_deviation(data[n0, :, n1])
+    return output
+
+
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
+def numba_median_abs_deviation_keep03(data: np.ndarray) -> np.ndarray:
+    """Numba speedup for median_abs_deviation reducing all but axes (0, 3)"""
+    output = np.zeros((data.shape[0], data.shape[3]))
+    for n in nb.prange(data.shape[0] * data.shape[3]):
+        n1 = n % data.shape[3]
+        n0 = n // data.shape[3]
+        output[n0, n1] = kernels.median_abs_deviation(data[n0, :, :, n1])
+    return output
+
+
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
+def numba_median_abs_deviation_keep04(data: np.ndarray) -> np.ndarray:
+    """Numba speedup for median_abs_deviation reducing all but axes (0, 4)"""
+    output = np.zeros((data.shape[0], data.shape[4]))
+    for n in nb.prange(data.shape[0] * data.shape[4]):
+        n1 = n % data.shape[4]
+        n0 = n // data.shape[4]
+        output[n0, n1] = kernels.median_abs_deviation(data[n0, :, :, :, n1])
+    return output
+
+
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
+def numba_median_abs_deviation_keep12(data: np.ndarray) -> np.ndarray:
+    """Numba speedup for median_abs_deviation reducing all but axes (1, 2)"""
+    output = np.zeros((data.shape[1], data.shape[2]))
+    for n in nb.prange(data.shape[1] * data.shape[2]):
+        n1 = n % data.shape[2]
+        n0 = n // data.shape[2]
+        output[n0, n1] = kernels.median_abs_deviation(data[:, n0, n1])
+    return output
+
+
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
+def numba_median_abs_deviation_keep13(data: np.ndarray) -> np.ndarray:
+    """Numba speedup for median_abs_deviation reducing all but axes (1, 3)"""
+    output = np.zeros((data.shape[1], data.shape[3]))
+    for n in nb.prange(data.shape[1] * data.shape[3]):
+        n1 = n % data.shape[3]
+        n0 = n // data.shape[3]
+        output[n0, n1] = kernels.median_abs_deviation(data[:, n0, :, n1])
+    return output
+
+
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
+def numba_median_abs_deviation_keep14(data: np.ndarray) -> np.ndarray:
+    """Numba speedup for median_abs_deviation reducing all but axes (1, 4)"""
+    output = np.zeros((data.shape[1], data.shape[4]))
+    for n in nb.prange(data.shape[1] * data.shape[4]):
+        n1 = n % data.shape[4]
+        n0 = n // data.shape[4]
+        output[n0, n1] = kernels.median_abs_deviation(data[:, n0, :, :, n1])
+    return output
+
+
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
+def numba_median_abs_deviation_keep23(data: np.ndarray) -> np.ndarray:
+    """Numba speedup for median_abs_deviation reducing all but axes (2, 3)"""
+    output = np.zeros((data.shape[2], data.shape[3]))
+    for n in nb.prange(data.shape[2] * data.shape[3]):
+        n1 = n % data.shape[3]
+        n0 = n // data.shape[3]
+        output[n0, n1] = kernels.median_abs_deviation(data[:, :, n0, n1])
+    return output
+
+
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
+def numba_median_abs_deviation_keep24(data: np.ndarray) -> np.ndarray:
+    """Numba speedup for median_abs_deviation reducing all but axes (2, 4)"""
+    output = np.zeros((data.shape[2], data.shape[4]))
+    for n in nb.prange(data.shape[2] * data.shape[4]):
+        n1 = n % data.shape[4]
+        n0 = n // data.shape[4]
+        output[n0, n1] = kernels.median_abs_deviation(data[:, :, n0, :, n1])
+    return output
+
+
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
+def numba_median_abs_deviation_keep34(data: np.ndarray) -> np.ndarray:
+    """Numba speedup for median_abs_deviation reducing all but axes (3, 4)"""
+    output = np.zeros((data.shape[3], data.shape[4]))
+    for n in nb.prange(data.shape[3] * data.shape[4]):
+        n1 = n % data.shape[4]
+        n0 = n // data.shape[4]
+        output[n0, n1] = kernels.median_abs_deviation(data[:, :, :, n0, n1])
+    return output
+
+
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
+def numba_median_abs_deviation_keep012(data: np.ndarray) -> np.ndarray:
+    """Numba speedup for median_abs_deviation reducing all but axes (0, 1, 2)"""
+    output = np.zeros((data.shape[0], data.shape[1], data.shape[2]))
+    for n in nb.prange(data.shape[0] * data.shape[1] * data.shape[2]):
+        n2 = n % data.shape[2]
+        rest2 = n // data.shape[2]
+        n1 = rest2 % data.shape[1]
+        n0 = rest2 // data.shape[1]
+        output[n0, n1, n2] = kernels.median_abs_deviation(data[n0, n1, n2])
+    return output
+
+
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
+def numba_median_abs_deviation_keep013(data: np.ndarray) -> np.ndarray:
+    """Numba speedup for median_abs_deviation reducing all but axes (0, 1, 3)"""
+    output = np.zeros((data.shape[0], data.shape[1], data.shape[3]))
+    for n in nb.prange(data.shape[0] * data.shape[1] * data.shape[3]):
+        n2 = n % data.shape[3]
+        rest2 = n // data.shape[3]
+        n1 = rest2 % data.shape[1]
+        n0 = rest2 // data.shape[1]
+        output[n0, n1, n2] = kernels.median_abs_deviation(data[n0, n1, :, n2])
+    return output
+
+
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
+def numba_median_abs_deviation_keep014(data: np.ndarray) -> np.ndarray:
+    """Numba speedup for median_abs_deviation reducing all but axes (0, 1, 4)"""
+    output = np.zeros((data.shape[0], data.shape[1], data.shape[4]))
+    for n in nb.prange(data.shape[0] * data.shape[1] * data.shape[4]):
+        n2 = n % data.shape[4]
+        rest2 = n // data.shape[4]
+        n1 = rest2 % data.shape[1]
+        n0 = rest2 // data.shape[1]
+        output[n0, n1, n2] = kernels.median_abs_deviation(data[n0, n1, :, :, n2])
+    return output
+
+
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
+def numba_median_abs_deviation_keep023(data: np.ndarray) -> np.ndarray:
+    """Numba speedup for median_abs_deviation reducing all but axes (0, 2, 3)"""
+    output = np.zeros((data.shape[0], data.shape[2], data.shape[3]))
+    for n in nb.prange(data.shape[0] * data.shape[2] * data.shape[3]):
+        n2 = n % data.shape[3]
+        rest2 = n // data.shape[3]
+        n1 = rest2 % data.shape[2]
+        n0 = rest2 // data.shape[2]
+        output[n0, n1, n2] = kernels.median_abs_deviation(data[n0, :, n1, n2])
+    return output
+
+
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
+def numba_median_abs_deviation_keep024(data: np.ndarray) -> np.ndarray:
+    """Numba speedup for median_abs_deviation reducing all but axes (0, 2, 4)"""
+    output = np.zeros((data.shape[0], data.shape[2], data.shape[4]))
+    for n in nb.prange(data.shape[0] * data.shape[2] * data.shape[4]):
+        n2 = n % data.shape[4]
+        rest2 = n // data.shape[4]
+        n1 = rest2 % data.shape[2]
+        n0 = rest2 // data.shape[2]
+        output[n0, n1, n2] = kernels.median_abs_deviation(data[n0, :, n1, :, n2])
+    return output
+
+
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
+def numba_median_abs_deviation_keep034(data: np.ndarray) -> np.ndarray:
+    """Numba speedup for median_abs_deviation reducing all but axes (0, 3, 4)"""
+    output = np.zeros((data.shape[0], data.shape[3], data.shape[4]))
+    for n in nb.prange(data.shape[0] * data.shape[3] * data.shape[4]):
+        n2 = n % data.shape[4]
+        rest2 = n // data.shape[4]
+        n1 = rest2 % data.shape[3]
+        n0 = rest2 // data.shape[3]
+        output[n0, n1, n2] = kernels.median_abs_deviation(data[n0, :, :, n1, n2])
+    return output
+
+
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
+def numba_median_abs_deviation_keep123(data: np.ndarray) -> np.ndarray:
+    """Numba speedup for median_abs_deviation reducing all but axes (1, 2, 3)"""
+    output = np.zeros((data.shape[1], data.shape[2], data.shape[3]))
+    for n in nb.prange(data.shape[1] * data.shape[2] * data.shape[3]):
+        n2 = n % data.shape[3]
+        rest2 = n // data.shape[3]
+        n1 = rest2 % data.shape[2]
+        n0 = rest2 // data.shape[2]
+        output[n0, n1, n2] = kernels.median_abs_deviation(data[:, n0, n1, n2])
+    return output
+
+
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
+def numba_median_abs_deviation_keep124(data: np.ndarray) -> np.ndarray:
+    """Numba speedup for median_abs_deviation reducing all but axes (1, 2, 4)"""
+    output = np.zeros((data.shape[1], data.shape[2], data.shape[4]))
+    for n in nb.prange(data.shape[1] * data.shape[2] * data.shape[4]):
+        n2 = n % data.shape[4]
+        rest2 = n // data.shape[4]
+        n1 = rest2 % data.shape[2]
+        n0 = rest2 // data.shape[2]
+        output[n0, n1, n2] = kernels.median_abs_deviation(data[:, n0, n1, :, n2])
+    return output
+
+
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
+def numba_median_abs_deviation_keep134(data: np.ndarray) -> np.ndarray:
+    """Numba speedup for median_abs_deviation reducing all but axes (1, 3, 4)"""
+    output = np.zeros((data.shape[1], data.shape[3], data.shape[4]))
+    for n in nb.prange(data.shape[1] * data.shape[3] * data.shape[4]):
+        n2 = n % data.shape[4]
+        rest2 = n // data.shape[4]
+        n1 = rest2 % data.shape[3]
+        n0 = rest2 // data.shape[3]
+        output[n0, n1, n2] = kernels.median_abs_deviation(data[:, n0, :, n1, n2])
+    return output
+
+
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
+def numba_median_abs_deviation_keep234(data: np.ndarray) -> np.ndarray:
+    """Numba speedup for median_abs_deviation reducing all but axes (2, 3, 4)"""
+    output = np.zeros((data.shape[2], data.shape[3], data.shape[4]))
+    for n in nb.prange(data.shape[2] * data.shape[3] * data.shape[4]):
+        n2 = n % data.shape[4]
+        rest2 = n // data.shape[4]
+        n1 = rest2 % data.shape[3]
+        n0 = rest2 // data.shape[3]
+        output[n0, n1, n2] = kernels.median_abs_deviation(data[:, :, n0, n1, n2])
+    return output
+
+
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
+def numba_median_abs_deviation_keep0123(data: np.ndarray) -> np.ndarray:
+    """Numba speedup for median_abs_deviation reducing all but axes (0, 1, 2, 3)"""
+    output = np.zeros((data.shape[0], data.shape[1], data.shape[2], data.shape[3]))
+    for n in nb.prange(data.shape[0] * data.shape[1] * data.shape[2] * data.shape[3]):
+        n3 = n % data.shape[3]
+        rest3 = n // data.shape[3]
+        n2 = rest3 % data.shape[2]
+        rest2 = rest3 // data.shape[2]
+        n1 = rest2 % data.shape[1]
+        n0 = rest2 // data.shape[1]
+        output[n0, n1, n2, n3] = kernels.median_abs_deviation(data[n0, n1, n2, n3])
+    return output
+
+
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
+def numba_median_abs_deviation_keep0124(data: np.ndarray) -> np.ndarray:
+    """Numba speedup for median_abs_deviation reducing all but axes (0, 1, 2, 4)"""
+    output = np.zeros((data.shape[0], data.shape[1], data.shape[2], data.shape[4]))
+    for n in nb.prange(data.shape[0] * data.shape[1] * data.shape[2] * data.shape[4]):
+        n3 = n % data.shape[4]
+        rest3 = n // data.shape[4]
+        n2 = rest3 % data.shape[2]
+        rest2 = rest3 // data.shape[2]
+        n1 = rest2 % data.shape[1]
+        n0 = rest2 // data.shape[1]
+        output[n0, n1, n2, n3] = kernels.median_abs_deviation(data[n0, n1, n2, :, n3])
+    return output
+
+
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
+def numba_median_abs_deviation_keep0134(data: np.ndarray) -> np.ndarray:
+    """Numba speedup for median_abs_deviation reducing all but axes (0, 1, 3, 4)"""
+    output = np.zeros((data.shape[0], data.shape[1], data.shape[3], data.shape[4]))
+    for n in nb.prange(data.shape[0] * data.shape[1] * data.shape[3] * data.shape[4]):
+        n3 = n % data.shape[4]
+        rest3 = n // data.shape[4]
+        n2 = rest3 % data.shape[3]
+        rest2 = rest3 // data.shape[3]
+        n1 = rest2 % data.shape[1]
+        n0 = rest2 // data.shape[1]
+        output[n0, n1, n2, n3] = kernels.median_abs_deviation(data[n0, n1, :, n2, n3])
+    return output
+
+
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
+def numba_median_abs_deviation_keep0234(data: np.ndarray) -> np.ndarray:
+    """Numba speedup for median_abs_deviation reducing all but axes (0, 2, 3, 4)"""
+    output = np.zeros((data.shape[0], data.shape[2], data.shape[3], data.shape[4]))
+    for n in nb.prange(data.shape[0] * data.shape[2] * data.shape[3] * data.shape[4]):
+        n3 = n % data.shape[4]
+        rest3 = n // data.shape[4]
+        n2 = rest3 % data.shape[3]
+        rest2 = rest3 // data.shape[3]
+        n1 = rest2 % data.shape[2]
+        n0 = rest2 // data.shape[2]
+        output[n0, n1, n2, n3] = kernels.median_abs_deviation(data[n0, :, n1, n2, n3])
+    return output
+
+
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
+def numba_median_abs_deviation_keep1234(data: np.ndarray) -> np.ndarray:
+    """Numba speedup for median_abs_deviation reducing all but axes (1, 2, 3, 4)"""
+    output = np.zeros((data.shape[1], data.shape[2], data.shape[3], data.shape[4]))
+    for n in nb.prange(data.shape[1] * data.shape[2] * data.shape[3] * data.shape[4]):
+        n3 = n % data.shape[4]
+        rest3 = n // data.shape[4]
+        n2 = rest3 % data.shape[3]
+        rest2 = rest3 // data.shape[3]
+        n1 = rest2 % data.shape[2]
+        n0 = rest2 // data.shape[2]
+        output[n0, n1, n2, n3] = kernels.median_abs_deviation(data[:, n0, n1, n2, n3])
+    return output
+
+
+# Kernel for each set of kept axes
+KERNELS = {
+    (0,): numba_median_abs_deviation_keep0,
+    (1,): numba_median_abs_deviation_keep1,
+    (2,): numba_median_abs_deviation_keep2,
+    (3,): numba_median_abs_deviation_keep3,
+    (4,): numba_median_abs_deviation_keep4,
+    (0, 1): numba_median_abs_deviation_keep01,
+    (0, 2): numba_median_abs_deviation_keep02,
+    (0, 3): numba_median_abs_deviation_keep03,
+    (0, 4): numba_median_abs_deviation_keep04,
+    (1, 2): numba_median_abs_deviation_keep12,
+    (1, 3): numba_median_abs_deviation_keep13,
+    (1, 4): numba_median_abs_deviation_keep14,
+    (2, 3): numba_median_abs_deviation_keep23,
+    (2, 4): numba_median_abs_deviation_keep24,
+    (3, 4): numba_median_abs_deviation_keep34,
+    (0, 1, 2): numba_median_abs_deviation_keep012,
+    (0, 1, 3): numba_median_abs_deviation_keep013,
+    (0, 1, 4): numba_median_abs_deviation_keep014,
+    (0, 2, 3): numba_median_abs_deviation_keep023,
+    (0, 2, 4): numba_median_abs_deviation_keep024,
+    (0, 3, 4): numba_median_abs_deviation_keep034,
+    (1, 2, 3): numba_median_abs_deviation_keep123,
+    (1, 2, 4): numba_median_abs_deviation_keep124,
+    (1, 3, 4): numba_median_abs_deviation_keep134,
+    (2, 3, 4): numba_median_abs_deviation_keep234,
+    (0, 1, 2, 3): numba_median_abs_deviation_keep0123,
+    (0, 1, 2, 4): numba_median_abs_deviation_keep0124,
+    (0, 1, 3, 4): numba_median_abs_deviation_keep0134,
+    (0, 2, 3, 4): numba_median_abs_deviation_keep0234,
+    (1, 2, 3, 4): numba_median_abs_deviation_keep1234,
+}
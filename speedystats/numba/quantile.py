@@ -4,379 +4,401 @@ import numpy as np
 
 
 def get_quantile(data: np.ndarray, keep_axes: Tuple[int], q) -> np.ndarray:
-    if keep_axes == (0,):
-        return numba_quantile_keep0(data, q)
-    if keep_axes == (1,):
-        return numba_quantile_keep1(data, q)
-    if keep_axes == (2,):
-        return numba_quantile_keep2(data, q)
-    if keep_axes == (3,):
-        return numba_quantile_keep3(data, q)
-    if keep_axes == (4,):
-        return numba_quantile_keep4(data, q)
-    if keep_axes == (0, 1):
-        return numba_quantile_keep01(data, q)
-    if keep_axes == (0, 2):
-        return numba_quantile_keep02(data, q)
-    if keep_axes == (0, 3):
-        return numba_quantile_keep03(data, q)
-    if keep_axes == (0, 4):
-        return numba_quantile_keep04(data, q)
-    if keep_axes == (1, 2):
-        return numba_quantile_keep12(data, q)
-    if keep_axes == (1, 3):
-        return numba_quantile_keep13(data, q)
-    if keep_axes == (1, 4):
-        return numba_quantile_keep14(data, q)
-    if keep_axes == (2, 3):
-        return numba_quantile_keep23(data, q)
-    if keep_axes == (2, 4):
-        return numba_quantile_keep24(data, q)
-    if keep_axes == (3, 4):
-        return numba_quantile_keep34(data, q)
-    if keep_axes == (0, 1, 2):
-        return numba_quantile_keep012(data, q)
-    if keep_axes == (0, 1, 3):
-        return numba_quantile_keep013(data, q)
-    if keep_axes == (0, 1, 4):
-        return numba_quantile_keep014(data, q)
-    if keep_axes == (0, 2, 3):
-        return numba_quantile_keep023(data, q)
-    if keep_axes == (0, 2, 4):
-        return numba_quantile_keep024(data, q)
-    if keep_axes == (0, 3, 4):
-        return numba_quantile_keep034(data, q)
-    if keep_axes == (1, 2, 3):
-        return numba_quantile_keep123(data, q)
-    if keep_axes == (1, 2, 4):
-        return numba_quantile_keep124(data, q)
-    if keep_axes == (1, 3, 4):
-        return numba_quantile_keep134(data, q)
-    if keep_axes == (2, 3, 4):
-        return numba_quantile_keep234(data, q)
-    if keep_axes == (0, 1, 2, 3):
-        return numba_quantile_keep0123(data, q)
-    if keep_axes == (0, 1, 2, 4):
-        return numba_quantile_keep0124(data, q)
-    if keep_axes == (0, 1, 3, 4):
-        return numba_quantile_keep0134(data, q)
-    if keep_axes == (0, 2, 3, 4):
-        return numba_quantile_keep0234(data, q)
-    if keep_axes == (1, 2, 3, 4):
-        return numba_quantile_keep1234(data, q)
-    raise ValueError(f"Invalid data shape for quantile, received: {keep_axes}")
-
-
-@nb.njit(parallel=True, fastmath=True, cache=True)
+    if keep_axes not in KERNELS:
+        raise ValueError(f"Invalid data shape for quantile, received: {keep_axes}")
+    return KERNELS[keep_axes](data, q)
+
+
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
 def numba_quantile_keep0(data: np.ndarray, q) -> np.ndarray:
     """Numba speedup for quantile reducing all but axes (0,)"""
     output = np.zeros((data.shape[0]))
     for n0 in nb.prange(data.shape[0]):
-        output[n0] = np.quantile(data[n0, q])
+        output[n0] = np.quantile(data[n0], q)
     return output
 
 
-@nb.njit(parallel=True, fastmath=True, cache=True)
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
 def numba_quantile_keep1(data: np.ndarray, q) -> np.ndarray:
     """Numba speedup for quantile reducing all but axes (1,)"""
     output = np.zeros((data.shape[1]))
     for n0 in nb.prange(data.shape[1]):
-        output[n0] = np.quantile(data[:, n0, q])
+        output[n0] = np.quantile(data[:, n0], q)
     return output
 
 
-@nb.njit(parallel=True, fastmath=True, cache=True)
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
 def numba_quantile_keep2(data: np.ndarray, q) -> np.ndarray:
     """Numba speedup for quantile reducing all but axes (2,)"""
     output = np.zeros((data.shape[2]))
     for n0 in nb.prange(data.shape[2]):
-        output[n0] = np.quantile(data[:, :, n0, q])
+        output[n0] = np.quantile(data[:, :, n0], q)
     return output
 
 
-@nb.njit(parallel=True, fastmath=True, cache=True)
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
 def numba_quantile_keep3(data: np.ndarray, q) -> np.ndarray:
     """Numba speedup for quantile reducing all but axes (3,)"""
     output = np.zeros((data.shape[3]))
     for n0 in nb.prange(data.shape[3]):
-        output[n0] = np.quantile(data[:, :, :, n0, q])
+        output[n0] = np.quantile(data[:, :, :, n0], q)
     return output
 
 
-@nb.njit(parallel=True, fastmath=True, cache=True)
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
 def numba_quantile_keep4(data: np.ndarray, q) -> np.ndarray:
     """Numba speedup for quantile reducing all but axes (4,)"""
     output = np.zeros((data.shape[4]))
     for n0 in nb.prange(data.shape[4]):
-        output[n0] = np.quantile(data[:, :, :, :, n0, q])
+        output[n0] = np.quantile(data[:, :, :, :, n0], q)
     return output
 
 
-@nb.njit(parallel=True, fastmath=True, cache=True)
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
 def numba_quantile_keep01(data: np.ndarray, q) -> np.ndarray:
     """Numba speedup for quantile reducing all but axes (0, 1)"""
     output = np.zeros((data.shape[0], data.shape[1]))
-    for n0 in nb.prange(data.shape[0]):
-        for n1 in nb.prange(data.shape[1]):
-            output[n0, n1] = np.quantile(data[n0, n1, q])
+    for n in nb.prange(data.shape[0] * data.shape[1]):
+        n1 = n % data.shape[1]
+        n0 = n // data.shape[1]
+        output[n0, n1] = np.quantile(data[n0, n1], q)
     return output
 
 
-@nb.njit(parallel=True, fastmath=True, cache=True)
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
 def numba_quantile_keep02(data: np.ndarray, q) -> np.ndarray:
     """Numba speedup for quantile reducing all but axes (0, 2)"""
     output = np.zeros((data.shape[0], data.shape[2]))
-    for n0 in nb.prange(data.shape[0]):
-        for n1 in nb.prange(data.shape[2]):
-            output[n0, n1] = np.quantile(data[n0, :, n1, q])
+    for n in nb.prange(data.shape[0] * data.shape[2]):
+        n1 = n % data.shape[2]
+        n0 = n // data.shape[2]
+        output[n0, n1] = np.quantile(data[n0, :, n1], q)
     return output
 
 
-@nb.njit(parallel=True, fastmath=True, cache=True)
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
 def numba_quantile_keep03(data: np.ndarray, q) -> np.ndarray:
     """Numba speedup for quantile reducing all but axes (0, 3)"""
     output = np.zeros((data.shape[0], data.shape[3]))
-    for n0 in nb.prange(data.shape[0]):
-        for n1 in nb.prange(data.shape[3]):
-            output[n0, n1] = np.quantile(data[n0, :, :, n1, q])
+    for n in nb.prange(data.shape[0] * data.shape[3]):
+        n1 = n % data.shape[3]
+        n0 = n // data.shape[3]
+        output[n0, n1] = np.quantile(data[n0, :, :, n1], q)
     return output
 
 
-@nb.njit(parallel=True, fastmath=True, cache=True)
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
 def numba_quantile_keep04(data: np.ndarray, q) -> np.ndarray:
     """Numba speedup for quantile reducing all but axes (0, 4)"""
     output = np.zeros((data.shape[0], data.shape[4]))
-    for n0 in nb.prange(data.shape[0]):
-        for n1 in nb.prange(data.shape[4]):
-            output[n0, n1] = np.quantile(data[n0, :, :, :, n1, q])
+    for n in nb.prange(data.shape[0] * data.shape[4]):
+        n1 = n % data.shape[4]
+        n0 = n // data.shape[4]
+        output[n0, n1] = np.quantile(data[n0, :, :, :, n1], q)
     return output
 
 
-@nb.njit(parallel=True, fastmath=True, cache=True)
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
 def numba_quantile_keep12(data: np.ndarray, q) -> np.ndarray:
     """Numba speedup for quantile reducing all but axes (1, 2)"""
     output = np.zeros((data.shape[1], data.shape[2]))
-    for n0 in nb.prange(data.shape[1]):
-        for n1 in nb.prange(data.shape[2]):
-            output[n0, n1] = np.quantile(data[:, n0, n1, q])
+    for n in nb.prange(data.shape[1] * data.shape[2]):
+        n1 = n % data.shape[2]
+        n0 = n // data.shape[2]
+        output[n0, n1] = np.quantile(data[:, n0, n1], q)
     return output
 
 
-@nb.njit(parallel=True, fastmath=True, cache=True)
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
 def numba_quantile_keep13(data: np.ndarray, q) -> np.ndarray:
     """Numba speedup for quantile reducing all but axes (1, 3)"""
     output = np.zeros((data.shape[1], data.shape[3]))
-    for n0 in nb.prange(data.shape[1]):
-        for n1 in nb.prange(data.shape[3]):
-            output[n0, n1] = np.quantile(data[:, n0, :, n1, q])
+    for n in nb.prange(data.shape[1] * data.shape[3]):
+        n1 = n % data.shape[3]
+        n0 = n // data.shape[3]
+        output[n0, n1] = np.quantile(data[:, n0, :, n1], q)
     return output
 
 
-@nb.njit(parallel=True, fastmath=True, cache=True)
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
 def numba_quantile_keep14(data: np.ndarray, q) -> np.ndarray:
     """Numba speedup for quantile reducing all but axes (1, 4)"""
     output = np.zeros((data.shape[1], data.shape[4]))
-    for n0 in nb.prange(data.shape[1]):
-        for n1 in nb.prange(data.shape[4]):
-            output[n0, n1] = np.quantile(data[:, n0, :, :, n1, q])
+    for n in nb.prange(data.shape[1] * data.shape[4]):
+        n1 = n % data.shape[4]
+        n0 = n // data.shape[4]
+        output[n0, n1] = np.quantile(data[:, n0, :, :, n1], q)
     return output
 
 
-@nb.njit(parallel=True, fastmath=True, cache=True)
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
 def numba_quantile_keep23(data: np.ndarray, q) -> np.ndarray:
     """Numba speedup for quantile reducing all but axes (2, 3)"""
     output = np.zeros((data.shape[2], data.shape[3]))
-    for n0 in nb.prange(data.shape[2]):
-        for n1 in nb.prange(data.shape[3]):
-            output[n0, n1] = np.quantile(data[:, :, n0, n1, q])
+    for n in nb.prange(data.shape[2] * data.shape[3]):
+        n1 = n % data.shape[3]
+        n0 = n // data.shape[3]
+        output[n0, n1] = np.quantile(data[:, :, n0, n1], q)
     return output
 
 
-@nb.njit(parallel=True, fastmath=True, cache=True)
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
 def numba_quantile_keep24(data: np.ndarray, q) -> np.ndarray:
     """Numba speedup for quantile reducing all but axes (2, 4)"""
     output = np.zeros((data.shape[2], data.shape[4]))
-    for n0 in nb.prange(data.shape[2]):
-        for n1 in nb.prange(data.shape[4]):
-            output[n0, n1] = np.quantile(data[:, :, n0, :, n1, q])
+    for n in nb.prange(data.shape[2] * data.shape[4]):
+        n1 = n % data.shape[4]
+        n0 = n // data.shape[4]
+        output[n0, n1] = np.quantile(data[:, :, n0, :, n1], q)
     return output
 
 
-@nb.njit(parallel=True, fastmath=True, cache=True)
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
 def numba_quantile_keep34(data: np.ndarray, q) -> np.ndarray:
     """Numba speedup for quantile reducing all but axes (3, 4)"""
     output = np.zeros((data.shape[3], data.shape[4]))
-    for n0 in nb.prange(data.shape[3]):
-        for n1 in nb.prange(data.shape[4]):
-            output[n0, n1] = np.quantile(data[:, :, :, n0, n1, q])
+    for n in nb.prange(data.shape[3] * data.shape[4]):
+        n1 = n % data.shape[4]
+        n0 = n // data.shape[4]
+        output[n0, n1] = np.quantile(data[:, :, :, n0, n1], q)
     return output
 
 
-@nb.njit(parallel=True, fastmath=True, cache=True)
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
 def numba_quantile_keep012(data: np.ndarray, q) -> np.ndarray:
     """Numba speedup for quantile reducing all but axes (0, 1, 2)"""
     output = np.zeros((data.shape[0], data.shape[1], data.shape[2]))
-    for n0 in nb.prange(data.shape[0]):
-        for n1 in nb.prange(data.shape[1]):
-            for n2 in nb.prange(data.shape[2]):
-                output[n0, n1, n2] = np.quantile(data[n0, n1, n2, q])
+    for n in nb.prange(data.shape[0] * data.shape[1] * data.shape[2]):
+        n2 = n % data.shape[2]
+        rest2 = n // data.shape[2]
+        n1 = rest2 % data.shape[1]
+        n0 = rest2 // data.shape[1]
+        output[n0, n1, n2] = np.quantile(data[n0, n1, n2], q)
     return output
 
 
-@nb.njit(parallel=True, fastmath=True, cache=True)
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
 def numba_quantile_keep013(data: np.ndarray, q) -> np.ndarray:
     """Numba speedup for quantile reducing all but axes (0, 1, 3)"""
     output = np.zeros((data.shape[0], data.shape[1], data.shape[3]))
-    for n0 in nb.prange(data.shape[0]):
-        for n1 in nb.prange(data.shape[1]):
-            for n2 in nb.prange(data.shape[3]):
-                output[n0, n1, n2] = np.quantile(data[n0, n1, :, n2, q])
+    for n in nb.prange(data.shape[0] * data.shape[1] * data.shape[3]):
+        n2 = n % data.shape[3]
+        rest2 = n // data.shape[3]
+        n1 = rest2 % data.shape[1]
+        n0 = rest2 // data.shape[1]
+        output[n0, n1, n2] = np.quantile(data[n0, n1, :, n2], q)
     return output
 
 
-@nb.njit(parallel=True, fastmath=True, cache=True)
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
 def numba_quantile_keep014(data: np.ndarray, q) -> np.ndarray:
     """Numba speedup for quantile reducing all but axes (0, 1, 4)"""
     output = np.zeros((data.shape[0], data.shape[1], data.shape[4]))
-    for n0 in nb.prange(data.shape[0]):
-        for n1 in nb.prange(data.shape[1]):
-            for n2 in nb.prange(data.shape[4]):
-                output[n0, n1, n2] = np.quantile(data[n0, n1, :, :, n2, q])
+    for n in nb.prange(data.shape[0] * data.shape[1] * data.shape[4]):
+        n2 = n % data.shape[4]
+        rest2 = n // data.shape[4]
+        n1 = rest2 % data.shape[1]
+        n0 = rest2 // data.shape[1]
+        output[n0, n1, n2] = np.quantile(data[n0, n1, :, :, n2], q)
     return output
 
 
-@nb.njit(parallel=True, fastmath=True, cache=True)
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
 def numba_quantile_keep023(data: np.ndarray, q) -> np.ndarray:
     """Numba speedup for quantile reducing all but axes (0, 2, 3)"""
     output = np.zeros((data.shape[0], data.shape[2], data.shape[3]))
-    for n0 in nb.prange(data.shape[0]):
-        for n1 in nb.prange(data.shape[2]):
-            for n2 in nb.prange(data.shape[3]):
-                output[n0, n1, n2] = np.quantile(data[n0, :, n1, n2, q])
+    for n in nb.prange(data.shape[0] * data.shape[2] * data.shape[3]):
+        n2 = n % data.shape[3]
+        rest2 = n // data.shape[3]
+        n1 = rest2 % data.shape[2]
+        n0 = rest2 // data.shape[2]
+        output[n0, n1, n2] = np.quantile(data[n0, :, n1, n2], q)
     return output
 
 
-@nb.njit(parallel=True, fastmath=True, cache=True)
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
 def numba_quantile_keep024(data: np.ndarray, q) -> np.ndarray:
     """Numba speedup for quantile reducing all but axes (0, 2, 4)"""
     output = np.zeros((data.shape[0], data.shape[2], data.shape[4]))
-    for n0 in nb.prange(data.shape[0]):
-        for n1 in nb.prange(data.shape[2]):
-            for n2 in nb.prange(data.shape[4]):
-                output[n0, n1, n2] = np.quantile(data[n0, :, n1, :, n2, q])
+    for n in nb.prange(data.shape[0] * data.shape[2] * data.shape[4]):
+        n2 = n % data.shape[4]
+        rest2 = n // data.shape[4]
+        n1 = rest2 % data.shape[2]
+        n0 = rest2 // data.shape[2]
+        output[n0, n1, n2] = np.quantile(data[n0, :, n1, :, n2], q)
     return output
 
 
-@nb.njit(parallel=True, fastmath=True, cache=True)
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
 def numba_quantile_keep034(data: np.ndarray, q) -> np.ndarray:
     """Numba speedup for quantile reducing all but axes (0, 3, 4)"""
     output = np.zeros((data.shape[0], data.shape[3], data.shape[4]))
-    for n0 in nb.prange(data.shape[0]):
-        for n1 in nb.prange(data.shape[3]):
-            for n2 in nb.prange(data.shape[4]):
-                output[n0, n1, n2] = np.quantile(data[n0, :, :, n1, n2, q])
+    for n in nb.prange(data.shape[0] * data.shape[3] * data.shape[4]):
+        n2 = n % data.shape[4]
+        rest2 = n // data.shape[4]
+        n1 = rest2 % data.shape[3]
+        n0 = rest2 // data.shape[3]
+        output[n0, n1, n2] = np.quantile(data[n0, :, :, n1, n2], q)
     return output
 
 
-@nb.njit(parallel=True, fastmath=True, cache=True)
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
 def numba_quantile_keep123(data: np.ndarray, q) -> np.ndarray:
     """Numba speedup for quantile reducing all but axes (1, 2, 3)"""
     output = np.zeros((data.shape[1], data.shape[2], data.shape[3]))
-    for n0 in nb.prange(data.shape[1]):
-        for n1 in nb.prange(data.shape[2]):
-            for n2 in nb.prange(data.shape[3]):
-                output[n0, n1, n2] = np.quantile(data[:, n0, n1, n2, q])
+    for n in nb.prange(data.shape[1] * data.shape[2] * data.shape[3]):
+        n2 = n % data.shape[3]
+        rest2 = n // data.shape[3]
+        n1 = rest2 % data.shape[2]
+        n0 = rest2 // data.shape[2]
+        output[n0, n1, n2] = np.quantile(data[:, n0, n1, n2], q)
     return output
 
 
-@nb.njit(parallel=True, fastmath=True, cache=True)
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
 def numba_quantile_keep124(data: np.ndarray, q) -> np.ndarray:
     """Numba speedup for quantile reducing all but axes (1, 2, 4)"""
     output = np.zeros((data.shape[1], data.shape[2], data.shape[4]))
-    for n0 in nb.prange(data.shape[1]):
-        for n1 in nb.prange(data.shape[2]):
-            for n2 in nb.prange(data.shape[4]):
-                output[n0, n1, n2] = np.quantile(data[:, n0, n1, :, n2, q])
+    for n in nb.prange(data.shape[1] * data.shape[2] * data.shape[4]):
+        n2 = n % data.shape[4]
+        rest2 = n // data.shape[4]
+        n1 = rest2 % data.shape[2]
+        n0 = rest2 // data.shape[2]
+        output[n0, n1, n2] = np.quantile(data[:, n0, n1, :, n2], q)
     return output
 
 
-@nb.njit(parallel=True, fastmath=True, cache=True)
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
 def numba_quantile_keep134(data: np.ndarray, q) -> np.ndarray:
     """Numba speedup for quantile reducing all but axes (1, 3, 4)"""
     output = np.zeros((data.shape[1], data.shape[3], data.shape[4]))
-    for n0 in nb.prange(data.shape[1]):
-        for n1 in nb.prange(data.shape[3]):
-            for n2 in nb.prange(data.shape[4]):
-                output[n0, n1, n2] = np.quantile(data[:, n0, :, n1, n2, q])
+    for n in nb.prange(data.shape[1] * data.shape[3] * data.shape[4]):
+        n2 = n % data.shape[4]
+        rest2 = n // data.shape[4]
+        n1 = rest2 % data.shape[3]
+        n0 = rest2 // data.shape[3]
+        output[n0, n1, n2] = np.quantile(data[:, n0, :, n1, n2], q)
     return output
 
 
-@nb.njit(parallel=True, fastmath=True, cache=True)
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
 def numba_quantile_keep234(data: np.ndarray, q) -> np.ndarray:
     """Numba speedup for quantile reducing all but axes (2, 3, 4)"""
     output = np.zeros((data.shape[2], data.shape[3], data.shape[4]))
-    for n0 in nb.prange(data.shape[2]):
-        for n1 in nb.prange(data.shape[3]):
-            for n2 in nb.prange(data.shape[4]):
-                output[n0, n1, n2] = np.quantile(data[:, :, n0, n1, n2, q])
+    for n in nb.prange(data.shape[2] * data.shape[3] * data.shape[4]):
+        n2 = n % data.shape[4]
+        rest2 = n // data.shape[4]
+        n1 = rest2 % data.shape[3]
+        n0 = rest2 // data.shape[3]
+        output[n0, n1, n2] = np.quantile(data[:, :, n0, n1, n2], q)
     return output
 
 
-@nb.njit(parallel=True, fastmath=True, cache=True)
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
 def numba_quantile_keep0123(data: np.ndarray, q) -> np.ndarray:
     """Numba speedup for quantile reducing all but axes (0, 1, 2, 3)"""
     output = np.zeros((data.shape[0], data.shape[1], data.shape[2], data.shape[3]))
-    for n0 in nb.prange(data.shape[0]):
-        for n1 in nb.prange(data.shape[1]):
-            for n2 in nb.prange(data.shape[2]):
-                for n3 in nb.prange(data.shape[3]):
-                    output[n0, n1, n2, n3] = np.quantile(data[n0, n1, n2, n3, q])
+    for n in nb.prange(data.shape[0] * data.shape[1] * data.shape[2] * data.shape[3]):
+        n3 = n % data.shape[3]
+        rest3 = n // data.shape[3]
+        n2 = rest3 % data.shape[2]
+        rest2 = rest3 // data.shape[2]
+        n1 = rest2 % data.shape[1]
+        n0 = rest2 // data.shape[1]
+        output[n0, n1, n2, n3] = np.quantile(data[n0, n1, n2, n3], q)
     return output
 
 
-@nb.njit(parallel=True, fastmath=True, cache=True)
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
 def numba_quantile_keep0124(data: np.ndarray, q) -> np.ndarray:
     """Numba speedup for quantile reducing all but axes (0, 1, 2, 4)"""
     output = np.zeros((data.shape[0], data.shape[1], data.shape[2], data.shape[4]))
-    for n0 in nb.prange(data.shape[0]):
-        for n1 in nb.prange(data.shape[1]):
-            for n2 in nb.prange(data.shape[2]):
-                for n3 in nb.prange(data.shape[4]):
-                    output[n0, n1, n2, n3] = np.quantile(data[n0, n1, n2, :, n3, q])
+    for n in nb.prange(data.shape[0] * data.shape[1] * data.shape[2] * data.shape[4]):
+        n3 = n % data.shape[4]
+        rest3 = n // data.shape[4]
+        n2 = rest3 % data.shape[2]
+        rest2 = rest3 // data.shape[2]
+        n1 = rest2 % data.shape[1]
+        n0 = rest2 // data.shape[1]
+        output[n0, n1, n2, n3] = np.quantile(data[n0, n1, n2, :, n3], q)
     return output
 
 
-@nb.njit(parallel=True, fastmath=True, cache=True)
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
 def numba_quantile_keep0134(data: np.ndarray, q) -> np.ndarray:
     """Numba speedup for quantile reducing all but axes (0, 1, 3, 4)"""
     output = np.zeros((data.shape[0], data.shape[1], data.shape[3], data.shape[4]))
-    for n0 in nb.prange(data.shape[0]):
-        for n1 in nb.prange(data.shape[1]):
-            for n2 in nb.prange(data.shape[3]):
-                for n3 in nb.prange(data.shape[4]):
-                    output[n0, n1, n2, n3] = np.quantile(data[n0, n1, :, n2, n3, q])
+    for n in nb.prange(data.shape[0] * data.shape[1] * data.shape[3] * data.shape[4]):
+        n3 = n % data.shape[4]
+        rest3 = n // data.shape[4]
+        n2 = rest3 % data.shape[3]
+        rest2 = rest3 // data.shape[3]
+        n1 = rest2 % data.shape[1]
+        n0 = rest2 // data.shape[1]
+        output[n0, n1, n2, n3] = np.quantile(data[n0, n1, :, n2, n3], q)
     return output
 
 
-@nb.njit(parallel=True, fastmath=True, cache=True)
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
 def numba_quantile_keep0234(data: np.ndarray, q) -> np.ndarray:
     """Numba speedup for quantile reducing all but axes (0, 2, 3, 4)"""
     output = np.zeros((data.shape[0], data.shape[2], data.shape[3], data.shape[4]))
-    for n0 in nb.prange(data.shape[0]):
-        for n1 in nb.prange(data.shape[2]):
-            for n2 in nb.prange(data.shape[3]):
-                for n3 in nb.prange(data.shape[4]):
-                    output[n0, n1, n2, n3] = np.quantile(data[n0, :, n1, n2, n3, q])
+    for n in nb.prange(data.shape[0] * data.shape[2] * data.shape[3] * data.shape[4]):
+        n3 = n % data.shape[4]
+        rest3 = n // data.shape[4]
+        n2 = rest3 % data.shape[3]
+        rest2 = rest3 // data.shape[3]
+        n1 = rest2 % data.shape[2]
+        n0 = rest2 // data.shape[2]
+        output[n0, n1, n2, n3] = np.quantile(data[n0, :, n1, n2, n3], q)
     return output
 
 
-@nb.njit(parallel=True, fastmath=True, cache=True)
+@nb.njit(parallel=True, fastmath=False, nogil=True, cache=True)
 def numba_quantile_keep1234(data: np.ndarray, q) -> np.ndarray:
     """Numba speedup for quantile reducing all but axes (1, 2, 3, 4)"""
     output = np.zeros((data.shape[1], data.shape[2], data.shape[3], data.shape[4]))
-    for n0 in nb.prange(data.shape[1]):
-        for n1 in nb.prange(data.shape[2]):
-            for n2 in nb.prange(data.shape[3]):
-                for n3 in nb.prange(data.shape[4]):
-                    output[n0, n1, n2, n3] = np.quantile(data[:, n0, n1, n2, n3, q])
+    for n in nb.prange(data.shape[1] * data.shape[2] * data.shape[3] * data.shape[4]):
+        n3 = n % data.shape[4]
+        rest3 = n // data.shape[4]
+        n2 = rest3 % data.shape[3]
+        rest2 = rest3 // data.shape[3]
+        n1 = rest2 % data.shape[2]
+        n0 = rest2 // data.shape[2]
+        output[n0, n1, n2, n3] = np.quantile(data[:, n0, n1, n2, n3], q)
     return output
+
+
+# Kernel for each set of kept axes
+KERNELS = {
+    (0,): numba_quantile_keep0,
+    (1,): numba_quantile_keep1,
+    (2,): numba_quantile_keep2,
+    (3,): numba_quantile_keep3,
+    (4,): numba_quantile_keep4,
+    (0, 1): numba_quantile_keep01,
+    (0, 2): numba_quantile_keep02,
+    (0, 3): numba_quantile_keep03,
+    (0, 4): numba_quantile_keep04,
+    (1, 2): numba_quantile_keep12,
+    (1, 3): numba_quantile_keep13,
+    (1, 4): numba_quantile_keep14,
+    (2, 3): numba_quantile_keep23,
+    (2, 4): numba_quantile_keep24,
+    (3, 4): numba_quantile_keep34,
+    (0, 1, 2): numba_quantile_keep012,
+    (0, 1, 3): numba_quantile_keep013,
+    (0, 1, 4): numba_quantile_keep014,
+    (0, 2, 3): numba_quantile_keep023,
+    (0, 2, 4): numba_quantile_keep024,
+    (0, 3, 4): numba_quantile_keep034,
+    (1, 2, 3): numba_quantile_keep123,
+    (1, 2, 4): numba_quantile_keep124,
+    (1, 3, 4): numba_quantile_keep134,
+    (2, 3, 4): numba_quantile_keep234,
+    (0, 1, 2, 3): numba_quantile_keep0123,
+    (0, 1, 2, 4): numba_quantile_keep0124,
+    (0, 1, 3, 4): numba_quantile_keep0134,
+    (0, 2, 3, 4): numba_quantile_keep0234,
+    (1, 2, 3, 4): numba_quantile_keep1234,
+}
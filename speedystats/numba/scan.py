@@ -0,0 +1,112 @@
+"""Parallel cumulative (scan) kernels.
+
+Scans work on data reshaped to (pre, n, post), where n is the length of the
+scanned axis and pre/post are the flattened axes before and after it. This is a
+free reshape for contiguous data, and it means the innermost loop always walks
+contiguous memory. The parallel iteration space is every (pre, block of post)
+pair, so scans along a leading axis still use all threads. Purely 1D scans use
+a two-pass blocked scan instead.
+"""
+
+import numba as nb
+import numpy as np
+
+SUM = 0
+PROD = 1
+MAX = 2
+MIN = 3
+
+# Number of contiguous "post" elements handled by each parallel task
+POST_BLOCK = 64
+
+# Minimum length for a 1D scan to be split into parallel blocks
+MIN_BLOCKED_SCAN = 2**16
+
+# Length of each block in a 1D scan. This is fixed (rather than derived from the
+# number of threads) so that floating point results don't depend on the threads
+SCAN_BLOCK = 2**14
+
+
+@nb.njit(nogil=True, cache=True)
+def _identity(op: int, value):
+    """Value that leaves the scan unchanged (used in place of NaNs)."""
+    if op == SUM:
+        return 0
+    if op == PROD:
+        return 1
+    return value
+
+
+@nb.njit(nogil=True, cache=True)
+def _combine(op: int, accumulated, value):
+    if op == SUM:
+        return accumulated + value
+    if op == PROD:
+        return accumulated * value
+    # cummax / cummin propagate NaNs like np.maximum / np.minimum
+    if np.isnan(accumulated) or np.isnan(value):
+        return accumulated + value
+    if op == MAX:
+        return max(accumulated, value)
+    return min(accumulated, value)
+
+
+@nb.njit(nogil=True, cache=True)
+def _load(op: int, value, skipna: bool):
+    if skipna and np.isnan(value):
+        return _identity(op, value)
+    return value
+
+
+@nb.njit(parallel=True, nogil=True, cache=True)
+def scan_3d(data: np.ndarray, out: np.ndarray, op: int, skipna: bool) -> None:
+    """Scan data along axis 1 of a (pre, n, post) array into out."""
+    num_pre, n, num_post = data.shape
+    if n == 0:
+        return
+    num_blocks = (num_post + POST_BLOCK - 1) // POST_BLOCK
+    for task in nb.prange(num_pre * num_blocks):
+        i = task // num_blocks
+        start = (task % num_blocks) * POST_BLOCK
+        stop = min(start + POST_BLOCK, num_post)
+        for k in range(start, stop):
+            out[i, 0, k] = _load(op, data[i, 0, k], skipna)
+        for j in range(1, n):
+            for k in range(start, stop):
+                out[i, j, k] = _combine(
+                    op, out[i, j - 1, k], _load(op, data[i, j, k], skipna)
+                )
+
+
+@nb.njit(parallel=True, nogil=True, cache=True)
+def scan_1d(data: np.ndarray, out: np.ndarray, op: int, skipna: bool) -> None:
+    """Two-pass blocked scan of a 1D array into out.
+
+    The first pass scans each block independently, the block totals are then
+    scanned serially, and the second pass folds each block's prefix back in.
+    """
+    n = data.shape[0]
+    if n == 0:
+        return
+    block_size = SCAN_BLOCK
+    num_blocks = (n + block_size - 1) // block_size
+
+    for b in nb.prange(num_blocks):
+        start = b * block_size
+        stop = min(start + block_size, n)
+        out[start] = _load(op, data[start], skipna)
+        for j in range(start + 1, stop):
+            out[j] = _combine(op, out[j - 1], _load(op, data[j], skipna))
+
+    # Prefix of each block is the scan of all preceding block totals
+    prefix = np.empty(num_blocks, dtype=out.dtype)
+    prefix[0] = out[block_size - 1]
+    for b in range(1, num_blocks):
+        block_total = out[min((b + 1) * block_size, n) - 1]
+        prefix[b] = _combine(op, prefix[b - 1], block_total)
+
+    for b in nb.prange(1, num_blocks):
+        start = b * block_size
+        stop = min(start + block_size, n)
+        for j in range(start, stop):
+            out[j] = _combine(op, prefix[b - 1], out[j])
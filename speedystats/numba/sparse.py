@@ -0,0 +1,226 @@
+"""Reductions of compressed sparse (CSR / CSC) matrices.
+
+The kernels work directly on the compressed arrays of a matrix: ``indptr``
+splits the stored values into one segment per major index (rows for CSR,
+columns for CSC), and ``indices`` holds the minor index of each stored value.
+Every element that isn't stored is an implicit zero, which the kernels account
+for analytically (e.g. they add count * mean**2 to the sum of squares) so the
+matrix is never densified.
+
+Values are compared with themselves (v != v) to find NaNs, which also works for
+integer matrices.
+"""
+
+import numba as nb
+import numpy as np
+
+SUM = 0
+MEAN = 1
+VAR = 2
+STD = 3
+
+# Number of parallel tasks to aim for in a reduction along the minor axis
+SPARSE_TASKS = 16
+
+# Fewest stored values worth giving to a task in a reduction along the minor axis
+MIN_CHUNK_NNZ = 2**16
+
+
+@nb.njit(nogil=True, cache=True)
+def _segment_moment(
+    values: np.ndarray, length: int, statistic: int, skipna: bool
+) -> float:
+    """Moment of a segment of length elements, of which values are stored."""
+    total = 0.0
+    count = length
+    for v in values:
+        if skipna and v != v:
+            count -= 1
+            continue
+        total += v
+    if statistic == SUM:
+        return total
+    if count == 0:
+        return np.nan
+    center = total / count
+    if statistic == MEAN:
+        return center
+    squares = 0.0
+    stored = 0
+    for v in values:
+        if skipna and v != v:
+            continue
+        d = v - center
+        squares += d * d
+        stored += 1
+    squares += (count - stored) * center * center
+    if statistic == VAR:
+        return squares / count
+    return np.sqrt(squares / count)
+
+
+@nb.njit(nogil=True, cache=True)
+def _order_statistic(
+    sorted_values: np.ndarray, num_negative: int, num_zeros: int, j: int
+) -> float:
+    """The j-th smallest element of sorted_values merged with num_zeros zeros."""
+    if j < num_negative:
+        return sorted_values[j]
+    if j < num_negative + num_zeros:
+        return 0.0
+    return sorted_values[j - num_zeros]
+
+
+@nb.njit(nogil=True, cache=True)
+def _segment_quantiles(
+    values: np.ndarray, length: int, qs: np.ndarray, skipna: bool, out: np.ndarray
+) -> None:
+    """Quantiles (linear interpolation, like np.quantile) of a segment into out."""
+    buffer = np.empty(values.size, dtype=np.float64)
+    k = 0
+    has_nan = False
+    for v in values:
+        if v != v:
+            if skipna:
+                length -= 1
+                continue
+            has_nan = True
+            break
+        buffer[k] = v
+        k += 1
+    if has_nan or length == 0:
+        out[:] = np.nan
+        return
+
+    sorted_values = np.sort(buffer[:k])
+    num_negative = np.searchsorted(sorted_values, 0.0)
+    num_zeros = length - k
+    for i in range(qs.size):
+        position = qs[i] * (length - 1)
+        lo = int(np.floor(position))
+        hi = min(lo + 1, length - 1)
+        below = _order_statistic(sorted_values, num_negative, num_zeros, lo)
+        above = _order_statistic(sorted_values, num_negative, num_zeros, hi)
+        out[i] = below + (above - below) * (position - lo)
+
+
+@nb.njit(parallel=True, nogil=True, cache=True)
+def reduce_major(
+    indptr: np.ndarray, values: np.ndarray, length: int, statistic: int, skipna: bool
+) -> np.ndarray:
+    """Moment of each segment (e.g. each row of a CSR matrix)."""
+    num_segments = indptr.size - 1
+    output = np.empty(num_segments)
+    for i in nb.prange(num_segments):
+        segment = values[indptr[i] : indptr[i + 1]]
+        output[i] = _segment_moment(segment, length, statistic, skipna)
+    return output
+
+
+@nb.njit(parallel=True, nogil=True, cache=True)
+def quantile_major(
+    indptr: np.ndarray, values: np.ndarray, length: int, qs: np.ndarray, skipna: bool
+) -> np.ndarray:
+    """Quantiles of each segment, as a (quantiles, segments) array."""
+    num_segments = indptr.size - 1
+    output = np.empty((num_segments, qs.size))
+    for i in nb.prange(num_segments):
+        segment = values[indptr[i] : indptr[i + 1]]
+        _segment_quantiles(segment, length, qs, skipna, output[i])
+    return output.T.copy()
+
+
+@nb.njit(parallel=True, nogil=True, cache=True)
+def _scatter_pass(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    values: np.ndarray,
+    num_minor: int,
+    center: np.ndarray,
+    squared: bool,
+    skipna: bool,
+    num_chunks: int,
+):
+    """Accumulate stored values (or their squared deviations from center) by
+    minor index, over fixed chunks of segments combined in order.
+
+    Returns the totals, and the number of stored values that were accumulated
+    and that were skipped (NaNs, if skipna) for each minor index.
+    """
+    num_segments = indptr.size - 1
+    per_chunk = -(-num_segments // num_chunks)
+    totals = np.zeros((num_chunks, num_minor))
+    counts = np.zeros((num_chunks, 2, num_minor), dtype=np.int64)
+    for chunk in nb.prange(num_chunks):
+        first = min(chunk * per_chunk, num_segments)
+        last = min(first + per_chunk, num_segments)
+        for p in range(indptr[first], indptr[last]):
+            j = indices[p]
+            v = values[p]
+            if skipna and v != v:
+                counts[chunk, 1, j] += 1
+                continue
+            counts[chunk, 0, j] += 1
+            if squared:
+                d = v - center[j]
+                totals[chunk, j] += d * d
+            else:
+                totals[chunk, j] += v
+    total = totals[0].copy()
+    count = counts[0].copy()
+    for chunk in range(1, num_chunks):
+        total += totals[chunk]
+        count += counts[chunk]
+    return total, count[0], count[1]
+
+
+@nb.njit(nogil=True, cache=True)
+def reduce_minor(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    values: np.ndarray,
+    num_minor: int,
+    statistic: int,
+    skipna: bool,
+    num_chunks: int,
+) -> np.ndarray:
+    """Moment of each minor index (e.g. each column of a CSR matrix)."""
+    length = indptr.size - 1
+    total, _, skipped = _scatter_pass(
+        indptr, indices, values, num_minor, np.empty(0), False, skipna, num_chunks
+    )
+    if statistic == SUM:
+        return total
+    count = length - skipped
+    center = total / count
+    if statistic == MEAN:
+        return center
+    squares, stored, _ = _scatter_pass(
+        indptr, indices, values, num_minor, center, True, skipna, num_chunks
+    )
+    squares += (count - stored) * center * center
+    if statistic == VAR:
+        return squares / count
+    return np.sqrt(squares / count)
+
+
+@nb.njit(nogil=True, cache=True)
+def transpose(
+    indptr: np.ndarray, indices: np.ndarray, values: np.ndarray, num_minor: int
+):
+    """Convert between CSR and CSC (a counting sort of the stored values)."""
+    new_indptr = np.zeros(num_minor + 1, dtype=np.int64)
+    for j in indices:
+        new_indptr[j + 1] += 1
+    for j in range(num_minor):
+        new_indptr[j + 1] += new_indptr[j]
+    position = new_indptr[:-1].copy()
+    new_indices = np.empty(indices.size, dtype=np.int64)
+    new_values = np.empty(values.size, dtype=values.dtype)
+    for i in range(indptr.size - 1):
+        for p in range(indptr[i], indptr[i + 1]):
+            j = indices[p]
+            new_indices[position[j]] = i
+            new_values[position[j]] = values[p]
+            position[j] += 1
+    return new_indptr, new_indices, new_values
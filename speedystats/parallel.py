@@ -0,0 +1,64 @@
+from typing import Optional
+from contextlib import contextmanager, nullcontext
+import numba as nb
+
+# Below this many elements per thread, waking up another thread costs more than
+# it saves, so small reductions run on fewer threads (or serially)
+MIN_ELEMENTS_PER_THREAD = 2**15
+
+
+def get_num_threads() -> int:
+    """Get the number of threads the numba kernels run on (in this thread)."""
+    return nb.get_num_threads()
+
+
+def set_num_threads(num_threads: int) -> None:
+    """Set the number of threads the numba kernels run on.
+
+    Like numba.set_num_threads, this only affects the calling thread, and can't
+    exceed the size of numba's thread pool (NUMBA_NUM_THREADS).
+
+    Args:
+        num_threads: Number of threads to use
+    """
+    if num_threads < 1:
+        raise ValueError(f"num_threads must be at least 1, received: {num_threads}")
+    nb.set_num_threads(num_threads)
+
+
+@contextmanager
+def threads(num_threads: int):
+    """Context manager that runs the numba kernels on num_threads threads.
+
+    Example:
+        with speedystats.threads(4):
+            out = speedystats.median(data, axis=0)
+    """
+    previous = nb.get_num_threads()
+    set_num_threads(num_threads)
+    try:
+        yield
+    finally:
+        nb.set_num_threads(previous)
+
+
+def kernel_threads(num_tasks: int, size: int, num_threads: Optional[int] = None):
+    """Context manager scoping the threads used by a single kernel call.
+
+    The number of threads is capped by the number of independent parallel tasks
+    (e.g. kept output elements) and by the amount of work, so that small calls
+    run serially instead of paying to start up the whole thread pool.
+
+    Args:
+        num_tasks: Size of the kernel's parallel iteration space
+        size: Number of elements processed by the kernel
+        num_threads: Number of threads requested (default: current setting)
+    """
+    current = nb.get_num_threads()
+    if num_threads is None:
+        num_threads = current
+    num_threads = min(num_threads, num_tasks, size // MIN_ELEMENTS_PER_THREAD)
+    num_threads = max(num_threads, 1)
+    if num_threads == current:
+        return nullcontext()
+    return threads(num_threads)
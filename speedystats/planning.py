@@ -0,0 +1,206 @@
+"""Reductions resolved once for a fixed method, shape, dtype and axis.
+
+Every call to a public function validates its arguments, works out the axes to
+keep, picks between the contiguous and the generated kernels, and looks the
+kernel up, which costs a few microseconds. That's negligible for large arrays
+but dominates calls on small ones made in a loop. A Plan does all of this when
+it's created, so calling it only checks the input and launches the kernel.
+"""
+
+from typing import Union, Iterable, Optional, Tuple
+from functools import partial
+from math import prod
+import numpy as np
+from .parallel import kernel_threads
+from . import copies
+from .routing import (
+    KERNEL_MAP,
+    HAS_Q_PARAM,
+    speedystat_route,
+    get_max_dims,
+    get_keep_axes,
+    get_accuracy_method,
+    get_interpolation_method,
+    get_counting_method,
+    get_contiguous_statistic,
+)
+from .calibration import use_numpy
+from .numba.contiguous import view_shape, get_contiguous, get_contiguous_tasks
+
+
+class Plan:
+    """A reduction of arrays with a fixed shape and dtype (see plan)."""
+
+    def __init__(
+        self,
+        method: str,
+        shape: Tuple[int],
+        dtype: np.dtype,
+        axis: Optional[Union[int, Iterable[int]]] = None,
+        keepdims: bool = False,
+        q: Optional[float] = None,
+        accuracy: str = "fast",
+        deterministic: bool = False,
+        num_threads: Optional[int] = None,
+        interpolation: str = "linear",
+    ):
+        from .speedystats import _call_speedystat
+
+        self.method = method
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        self.axis = axis
+        self.keepdims = keepdims
+
+        # Resolve the kernel names exactly like _call_speedystat does
+        speedystat_route(method)
+        if deterministic and accuracy == "fast":
+            accuracy = "pairwise"
+        kernel_method, kernel_q = method, q
+        if interpolation != "linear":
+            kernel_method, kernel_q = get_interpolation_method(method, interpolation, q)
+        if accuracy != "fast":
+            kernel_method = get_accuracy_method(method, accuracy)
+        ndim = len(self.shape)
+        keep_axes = () if axis is None else get_keep_axes(axis, ndim)
+
+        # Full reductions, kept axes beyond the kernels and reductions that are
+        # faster in numpy (see calibrate) go through the usual path
+        if (
+            not keep_axes
+            or any(k >= get_max_dims() for k in keep_axes)
+            or use_numpy(kernel_method, self.shape, keep_axes)
+        ):
+            self._call = partial(
+                _call_speedystat,
+                method=method,
+                axis=axis,
+                keepdims=keepdims,
+                q=q,
+                accuracy=accuracy,
+                deterministic=deterministic,
+                num_threads=num_threads,
+                interpolation=interpolation,
+            )
+            return
+
+        size = prod(self.shape)
+        keep_shape = tuple(self.shape[k] for k in keep_axes)
+        if keepdims:
+            self._out_shape = tuple(
+                n if k in keep_axes else 1 for k, n in enumerate(self.shape)
+            )
+        else:
+            self._out_shape = keep_shape
+        self._num_threads = num_threads
+        self._size = size
+
+        # The contiguous kernels, used when the input turns out to be C-contiguous
+        statistic = get_contiguous_statistic(kernel_method)
+        self._view_shape = None
+        if statistic is not None:
+            self._view_shape = view_shape(self.shape, keep_axes)
+            self._statistic = statistic
+        if self._view_shape is not None:
+            self._contiguous_tasks = get_contiguous_tasks(self._view_shape)
+
+        # The generated kernel, on the data flattened along the trailing reduced axes
+        last_axis = keep_axes[-1]
+        self._kernel_shape = self.shape
+        self._merged_axes = None
+        if ndim > last_axis + 1:
+            self._merged_axes = range(last_axis + 1, ndim)
+            trailing = prod(self.shape[last_axis + 1 :])
+            self._kernel_shape = self.shape[: last_axis + 1] + (trailing,)
+        length = size // prod(keep_shape) if size else 0
+        kernel_method = get_counting_method(kernel_method, self.dtype, length)
+        self._kernel = KERNEL_MAP[kernel_method][keep_axes]
+        self._kernel_args = (kernel_q,) if HAS_Q_PARAM[kernel_method] else ()
+        self._kernel_tasks = prod(keep_shape)
+        self._call = self._reduce
+
+    def _reduce(self, data: np.ndarray) -> np.ndarray:
+        if self._view_shape is not None and data.flags.c_contiguous:
+            with kernel_threads(self._contiguous_tasks, self._size, self._num_threads):
+                out = get_contiguous(data, self._view_shape, self._statistic)
+            return np.reshape(out, self._out_shape)
+
+        if self._merged_axes is not None and copies.POLICY != "ignore":
+            copies.check_copy(data, [self._merged_axes], self.method, stacklevel=4)
+        data = np.reshape(data, self._kernel_shape)
+        with kernel_threads(self._kernel_tasks, self._size, self._num_threads):
+            out = self._kernel(data, *self._kernel_args)
+        if self.keepdims:
+            out = np.reshape(out, self._out_shape)
+        return out
+
+    def __call__(self, data: np.ndarray) -> np.ndarray:
+        """Reduce data, which must have the shape and dtype of the plan."""
+        if (
+            data.shape != self.shape
+            or data.dtype != self.dtype
+            or isinstance(data, np.ma.MaskedArray)
+        ):
+            raise ValueError(
+                f"Plan for {self.dtype} arrays with shape {self.shape} received "
+                f"{type(data).__name__} with dtype {data.dtype} and shape {data.shape}"
+            )
+        return self._call(data)
+
+    def __repr__(self) -> str:
+        return (
+            f"Plan({self.method!r}, shape={self.shape}, dtype={self.dtype}, "
+            f"axis={self.axis}, keepdims={self.keepdims})"
+        )
+
+
+def plan(
+    method: str,
+    shape: Tuple[int],
+    dtype: np.dtype = np.float64,
+    axis: Optional[Union[int, Iterable[int]]] = None,
+    keepdims: bool = False,
+    q: Optional[float] = None,
+    accuracy: str = "fast",
+    deterministic: bool = False,
+    num_threads: Optional[int] = None,
+    interpolation: str = "linear",
+) -> Plan:
+    """Resolve a reduction once, for repeated calls on arrays of one shape and dtype.
+
+    Calling the plan gives the same result as calling the method with the same
+    arguments, with most of the per-call overhead removed. Plans take plain
+    numpy arrays (not masked arrays or sparse matrices).
+
+    Args:
+        method: Name of the reduction (e.g. "mean", "nanmedian")
+        shape: Shape of the arrays the plan will be called on
+        dtype: Dtype of the arrays the plan will be called on
+        axis: Axis or axes to reduce (default: all of them)
+        keepdims: Whether to keep the reduced axes
+        q: Quantile or percentile, for the methods that take one
+        accuracy: Summation mode ("fast", "pairwise" or "kahan")
+        deterministic: Whether results must not depend on the number of threads
+        num_threads: Number of threads to use (default: current setting)
+        interpolation: Interpolation of the quantile methods (their method=)
+
+    Returns:
+        Plan: Callable that reduces an array
+
+    Example:
+        row_means = speedystats.plan("mean", (64, 32), np.float32, axis=1)
+        for frame in frames:
+            out = row_means(frame)
+    """
+    return Plan(
+        method,
+        shape,
+        dtype,
+        axis,
+        keepdims,
+        q,
+        accuracy,
+        deterministic,
+        num_threads,
+        interpolation,
+    )
@@ -0,0 +1,212 @@
+"""Multi-process execution of the reductions over shared memory.
+
+With backend="processes", the kept axis with the most elements is split into
+one block per worker process. Every worker attaches to a shared memory copy of
+the input (or to the input itself, if it's a SharedArray), reduces its block
+with the usual kernels on a single thread, and writes the result into a shared
+output buffer, so no arrays are pickled.
+"""
+
+from typing import Union, Iterable, Optional
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context, shared_memory
+import atexit
+import os
+import sys
+import weakref
+import numpy as np
+from .routing import get_keep_axes
+
+_pool = None
+_pool_size = 0
+
+
+class SharedArray(np.ndarray):
+    """A numpy array backed by shared memory.
+
+    backend="processes" reads a SharedArray in place instead of copying it into
+    shared memory first. The memory is released when the array (and every view
+    of it) has been garbage collected.
+
+    Example:
+        data = speedystats.SharedArray((100000, 1000))
+        data[:] = load_data()
+        out = speedystats.mean(data, axis=1, backend="processes")
+    """
+
+    def __new__(cls, shape, dtype=np.float64):
+        dtype = np.dtype(dtype)
+        nbytes = int(np.prod(shape)) * dtype.itemsize
+        shm = shared_memory.SharedMemory(create=True, size=max(nbytes, 1))
+        array = super().__new__(cls, shape, dtype, buffer=shm.buf)
+        array.shm = shm
+        weakref.finalize(array, _release, shm)
+        return array
+
+    def __array_finalize__(self, obj):
+        self.shm = getattr(obj, "shm", None)
+
+    def __array_wrap__(self, array, context=None, return_scalar=False):
+        # Results of ufuncs live in ordinary memory, so they're ordinary arrays
+        array = np.asarray(array).view(np.ndarray)
+        return array[()] if return_scalar else array
+
+
+def _release(shm: shared_memory.SharedMemory) -> None:
+    shm.close()
+    shm.unlink()
+
+
+def _shared_name(data: np.ndarray) -> Optional[str]:
+    """Name of the shared memory holding data, if it's a whole SharedArray."""
+    shm = getattr(data, "shm", None)
+    if shm is None or not data.flags.c_contiguous:
+        return None
+    start = np.frombuffer(shm.buf, dtype=np.uint8).ctypes.data
+    if data.ctypes.data != start:
+        return None
+    return shm.name
+
+
+def _attach(name: str, shape, dtype):
+    """Attach to shared memory created by another process, as an array."""
+    # Workers share the resource tracker of the process that created the memory,
+    # which owns (and unlinks) it, so registering it again is harmless
+    if sys.version_info >= (3, 13):
+        shm = shared_memory.SharedMemory(name=name, track=False)
+    else:
+        shm = shared_memory.SharedMemory(name=name)
+    return shm, np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+
+def _reduce_block(
+    data_spec,
+    out_spec,
+    method: str,
+    axis,
+    q,
+    accuracy: str,
+    deterministic: bool,
+    split_axis: int,
+    out_axis: int,
+    start: int,
+    stop: int,
+) -> None:
+    """Worker task: reduce data[..., start:stop, ...] into out[..., start:stop, ...]."""
+    from .speedystats import _call_speedystat
+
+    data_shm, data = _attach(*data_spec)
+    out_shm, out = _attach(*out_spec)
+    try:
+        index = [slice(None)] * data.ndim
+        index[split_axis] = slice(start, stop)
+        out_index = [slice(None)] * out.ndim
+        out_index[out_axis] = slice(start, stop)
+        out[tuple(out_index)] = _call_speedystat(
+            data[tuple(index)],
+            method,
+            axis,
+            False,
+            q,
+            accuracy,
+            deterministic,
+            num_threads=1,
+        )
+    finally:
+        del data, out
+        data_shm.close()
+        out_shm.close()
+
+
+def _get_pool(num_workers: int) -> ProcessPoolExecutor:
+    """The worker pool, kept alive between calls (workers are slow to start)."""
+    global _pool, _pool_size
+    if _pool is None or _pool_size != num_workers:
+        shutdown_processes()
+        # Forking a process that has started numba's threads isn't safe
+        _pool = ProcessPoolExecutor(num_workers, mp_context=get_context("spawn"))
+        _pool_size = num_workers
+    return _pool
+
+
+def shutdown_processes() -> None:
+    """Shut down the worker processes used by backend="processes"."""
+    global _pool, _pool_size
+    if _pool is not None:
+        _pool.shutdown()
+    _pool = None
+    _pool_size = 0
+
+
+atexit.register(shutdown_processes)
+
+
+def call_processes(
+    data: np.ndarray,
+    method: str,
+    axis: Optional[Union[int, Iterable[int]]] = None,
+    keepdims: bool = False,
+    q: Optional[float] = None,
+    accuracy: str = "fast",
+    deterministic: bool = False,
+    num_workers: Optional[int] = None,
+) -> np.ndarray:
+    """Reduce data by splitting its largest kept axis across worker processes.
+
+    Full reductions (no kept axes) can't be split, so they run in this process.
+    """
+    from .speedystats import _call_speedystat
+
+    data = np.asanyarray(data)
+    keep_axes = () if axis is None else get_keep_axes(axis, np.ndim(data))
+    if not keep_axes:
+        return _call_speedystat(
+            data, method, axis, keepdims, q, accuracy, deterministic
+        )
+
+    if num_workers is None:
+        num_workers = os.cpu_count()
+    out_axis = max(range(len(keep_axes)), key=lambda i: data.shape[keep_axes[i]])
+    split_axis = keep_axes[out_axis]
+    keep_shape = tuple(data.shape[k] for k in keep_axes)
+    bounds = np.linspace(0, data.shape[split_axis], num_workers + 1).astype(int)
+
+    name = _shared_name(data)
+    if name is None:
+        shared = SharedArray(data.shape, data.dtype)
+        shared[...] = data
+        name = _shared_name(shared)
+    else:
+        shared = data
+    out = SharedArray(keep_shape, np.float64)
+    data_spec = (name, data.shape, data.dtype)
+    out_spec = (out.shm.name, keep_shape, out.dtype)
+
+    pool = _get_pool(num_workers)
+    tasks = [
+        pool.submit(
+            _reduce_block,
+            data_spec,
+            out_spec,
+            method,
+            axis,
+            q,
+            accuracy,
+            deterministic,
+            split_axis,
+            out_axis,
+            start,
+            stop,
+        )
+        for start, stop in zip(bounds[:-1], bounds[1:])
+        if stop > start
+    ]
+    for task in tasks:
+        task.result()
+    del shared
+
+    out = np.array(out)
+    if keepdims:
+        reduce_axes = tuple(a for a in range(data.ndim) if a not in keep_axes)
+        out = np.expand_dims(out, reduce_axes)
+    return out
@@ -1,5 +1,230 @@
-from typing import Callable, Union, Iterable, Tuple
+from typing import Callable, Union, Iterable, Tuple, Optional
+import numpy as np
 from . import numba
+from .numba.kernels import INTERPOLATION_METHODS, COUNTING_MIN_LENGTH
+
+# Function choosing the numba kernel for a set of kept axes, by method
+METHOD_MAP = {
+    "sum": numba.sum.get_sum,
+    "nansum": numba.nansum.get_nansum,
+    "sum_pairwise": numba.sum_pairwise.get_sum_pairwise,
+    "sum_kahan": numba.sum_kahan.get_sum_kahan,
+    "nansum_pairwise": numba.nansum_pairwise.get_nansum_pairwise,
+    "nansum_kahan": numba.nansum_kahan.get_nansum_kahan,
+    "ptp": numba.ptp.get_ptp,
+    "percentile": numba.percentile.get_percentile,
+    "nanpercentile": numba.nanpercentile.get_nanpercentile,
+    "percentile_interpolated": numba.percentile_interpolated.get_percentile_interpolated,
+    "nanpercentile_interpolated": numba.nanpercentile_interpolated.get_nanpercentile_interpolated,
+    "percentile_counting": numba.percentile_counting.get_percentile_counting,
+    "quantile": numba.quantile.get_quantile,
+    "nanquantile": numba.nanquantile.get_nanquantile,
+    "quantile_interpolated": numba.quantile_interpolated.get_quantile_interpolated,
+    "nanquantile_interpolated": numba.nanquantile_interpolated.get_nanquantile_interpolated,
+    "quantile_counting": numba.quantile_counting.get_quantile_counting,
+    "median": numba.median.get_median,
+    "nanmedian": numba.nanmedian.get_nanmedian,
+    "median_counting": numba.median_counting.get_median_counting,
+    "average": numba.average.get_average,
+    "mean": numba.mean.get_mean,
+    "nanmean": numba.nanmean.get_nanmean,
+    "mean_pairwise": numba.mean_pairwise.get_mean_pairwise,
+    "mean_kahan": numba.mean_kahan.get_mean_kahan,
+    "nanmean_pairwise": numba.nanmean_pairwise.get_nanmean_pairwise,
+    "nanmean_kahan": numba.nanmean_kahan.get_nanmean_kahan,
+    "std": numba.std.get_std,
+    "nanstd": numba.nanstd.get_nanstd,
+    "std_pairwise": numba.std_pairwise.get_std_pairwise,
+    "std_kahan": numba.std_kahan.get_std_kahan,
+    "nanstd_pairwise": numba.nanstd_pairwise.get_nanstd_pairwise,
+    "nanstd_kahan": numba.nanstd_kahan.get_nanstd_kahan,
+    "var": numba.var.get_var,
+    "nanvar": numba.nanvar.get_nanvar,
+    "var_pairwise": numba.var_pairwise.get_var_pairwise,
+    "var_kahan": numba.var_kahan.get_var_kahan,
+    "nanvar_pairwise": numba.nanvar_pairwise.get_nanvar_pairwise,
+    "nanvar_kahan": numba.nanvar_kahan.get_nanvar_kahan,
+    "min": numba.min.get_min,
+    "nanmin": numba.nanmin.get_nanmin,
+    "max": numba.max.get_max,
+    "nanmax": numba.nanmax.get_nanmax,
+    "trim_mean": numba.trim_mean.get_trim_mean,
+    "nantrim_mean": numba.nantrim_mean.get_nantrim_mean,
+    "winsorized_mean": numba.winsorized_mean.get_winsorized_mean,
+    "nanwinsorized_mean": numba.nanwinsorized_mean.get_nanwinsorized_mean,
+    "median_abs_deviation": numba.median_abs_deviation.get_median_abs_deviation,
+    "nanmedian_abs_deviation": numba.nanmedian_abs_deviation.get_nanmedian_abs_deviation,
+    "iqr": numba.iqr.get_iqr,
+    "naniqr": numba.naniqr.get_naniqr,
+}
+
+# Numba kernels by kept axes, by method
+KERNEL_MAP = {
+    "sum": numba.sum.KERNELS,
+    "nansum": numba.nansum.KERNELS,
+    "sum_pairwise": numba.sum_pairwise.KERNELS,
+    "sum_kahan": numba.sum_kahan.KERNELS,
+    "nansum_pairwise": numba.nansum_pairwise.KERNELS,
+    "nansum_kahan": numba.nansum_kahan.KERNELS,
+    "ptp": numba.ptp.KERNELS,
+    "percentile": numba.percentile.KERNELS,
+    "nanpercentile": numba.nanpercentile.KERNELS,
+    "percentile_interpolated": numba.percentile_interpolated.KERNELS,
+    "nanpercentile_interpolated": numba.nanpercentile_interpolated.KERNELS,
+    "percentile_counting": numba.percentile_counting.KERNELS,
+    "quantile": numba.quantile.KERNELS,
+    "nanquantile": numba.nanquantile.KERNELS,
+    "quantile_interpolated": numba.quantile_interpolated.KERNELS,
+    "nanquantile_interpolated": numba.nanquantile_interpolated.KERNELS,
+    "quantile_counting": numba.quantile_counting.KERNELS,
+    "median": numba.median.KERNELS,
+    "nanmedian": numba.nanmedian.KERNELS,
+    "median_counting": numba.median_counting.KERNELS,
+    "average": numba.average.KERNELS,
+    "mean": numba.mean.KERNELS,
+    "nanmean": numba.nanmean.KERNELS,
+    "mean_pairwise": numba.mean_pairwise.KERNELS,
+    "mean_kahan": numba.mean_kahan.KERNELS,
+    "nanmean_pairwise": numba.nanmean_pairwise.KERNELS,
+    "nanmean_kahan": numba.nanmean_kahan.KERNELS,
+    "std": numba.std.KERNELS,
+    "nanstd": numba.nanstd.KERNELS,
+    "std_pairwise": numba.std_pairwise.KERNELS,
+    "std_kahan": numba.std_kahan.KERNELS,
+    "nanstd_pairwise": numba.nanstd_pairwise.KERNELS,
+    "nanstd_kahan": numba.nanstd_kahan.KERNELS,
+    "var": numba.var.KERNELS,
+    "nanvar": numba.nanvar.KERNELS,
+    "var_pairwise": numba.var_pairwise.KERNELS,
+    "var_kahan": numba.var_kahan.KERNELS,
+    "nanvar_pairwise": numba.nanvar_pairwise.KERNELS,
+    "nanvar_kahan": numba.nanvar_kahan.KERNELS,
+    "min": numba.min.KERNELS,
+    "nanmin": numba.nanmin.KERNELS,
+    "max": numba.max.KERNELS,
+    "nanmax": numba.nanmax.KERNELS,
+    "trim_mean": numba.trim_mean.KERNELS,
+    "nantrim_mean": numba.nantrim_mean.KERNELS,
+    "winsorized_mean": numba.winsorized_mean.KERNELS,
+    "nanwinsorized_mean": numba.nanwinsorized_mean.KERNELS,
+    "median_abs_deviation": numba.median_abs_deviation.KERNELS,
+    "nanmedian_abs_deviation": numba.nanmedian_abs_deviation.KERNELS,
+    "iqr": numba.iqr.KERNELS,
+    "naniqr": numba.naniqr.KERNELS,
+}
+
+# Whether each method takes a scalar parameter (e.g. q)
+HAS_Q_PARAM = {
+    "sum": False,
+    "nansum": False,
+    "sum_pairwise": False,
+    "sum_kahan": False,
+    "nansum_pairwise": False,
+    "nansum_kahan": False,
+    "ptp": False,
+    "percentile": True,
+    "nanpercentile": True,
+    "percentile_interpolated": True,
+    "nanpercentile_interpolated": True,
+    "percentile_counting": True,
+    "quantile": True,
+    "nanquantile": True,
+    "quantile_interpolated": True,
+    "nanquantile_interpolated": True,
+    "quantile_counting": True,
+    "median": False,
+    "nanmedian": False,
+    "median_counting": False,
+    "average": False,
+    "mean": False,
+    "nanmean": False,
+    "mean_pairwise": False,
+    "mean_kahan": False,
+    "nanmean_pairwise": False,
+    "nanmean_kahan": False,
+    "std": False,
+    "nanstd": False,
+    "std_pairwise": False,
+    "std_kahan": False,
+    "nanstd_pairwise": False,
+    "nanstd_kahan": False,
+    "var": False,
+    "nanvar": False,
+    "var_pairwise": False,
+    "var_kahan": False,
+    "nanvar_pairwise": False,
+    "nanvar_kahan": False,
+    "min": False,
+    "nanmin": False,
+    "max": False,
+    "nanmax": False,
+    "trim_mean": True,
+    "nantrim_mean": True,
+    "winsorized_mean": True,
+    "nanwinsorized_mean": True,
+    "median_abs_deviation": False,
+    "nanmedian_abs_deviation": False,
+    "iqr": False,
+    "naniqr": False,
+}
+
+# Compensated summation modes available for each method
+ACCURACY_MODES = {
+    "sum": ("pairwise", "kahan"),
+    "nansum": ("pairwise", "kahan"),
+    "mean": ("pairwise", "kahan"),
+    "nanmean": ("pairwise", "kahan"),
+    "std": ("pairwise", "kahan"),
+    "nanstd": ("pairwise", "kahan"),
+    "var": ("pairwise", "kahan"),
+    "nanvar": ("pairwise", "kahan"),
+}
+
+# Largest q of each method taking an interpolation method (see get_interpolation_method)
+INTERPOLATION_RANGES = {
+    "percentile": 100,
+    "nanpercentile": 100,
+    "quantile": 1,
+    "nanquantile": 1,
+}
+
+# Kernels computing each method on 8 and 16 bit integers by counting
+COUNTING_METHODS = {
+    "percentile": "percentile_counting",
+    "nanpercentile": "percentile_counting",
+    "quantile": "quantile_counting",
+    "nanquantile": "quantile_counting",
+    "median": "median_counting",
+    "nanmedian": "median_counting",
+}
+
+# Statistic (and whether NaNs are skipped) of each pairwise summation method
+PAIRWISE_REDUCTIONS = {
+    "sum_pairwise": ("sum", False),
+    "nansum_pairwise": ("sum", True),
+    "mean_pairwise": ("mean", False),
+    "nanmean_pairwise": ("mean", True),
+    "std_pairwise": ("std", False),
+    "nanstd_pairwise": ("std", True),
+    "var_pairwise": ("var", False),
+    "nanvar_pairwise": ("var", True),
+}
+
+# Statistic computed by the contiguous row / column kernels for each method
+CONTIGUOUS_STATISTICS = {
+    "sum": "sum",
+    "nansum": "nansum",
+    "ptp": "ptp",
+    "average": "mean",
+    "mean": "mean",
+    "nanmean": "nanmean",
+    "std": "std",
+    "nanstd": "nanstd",
+    "var": "var",
+    "nanvar": "nanvar",
+    "min": "min",
+    "max": "max",
+}
 
 
 def speedystat_route(np_method: str) -> Callable:
@@ -11,48 +236,97 @@ def speedystat_route(np_method: str) -> Callable:
     Returns:
         Callable: The corresponding fast implementation
     """
-    method_map = {
-        "sum": numba.sum.get_sum,
-        "nansum": numba.nansum.get_nansum,
-        "ptp": numba.ptp.get_ptp,
-        "percentile": numba.percentile.get_percentile,
-        "nanpercentile": numba.nanpercentile.get_nanpercentile,
-        "quantile": numba.quantile.get_quantile,
-        "nanquantile": numba.nanquantile.get_nanquantile,
-        "median": numba.median.get_median,
-        "nanmedian": numba.nanmedian.get_nanmedian,
-        "average": numba.average.get_average,
-        "mean": numba.mean.get_mean,
-        "nanmean": numba.nanmean.get_nanmean,
-        "std": numba.std.get_std,
-        "nanstd": numba.nanstd.get_nanstd,
-        "var": numba.var.get_var,
-        "nanvar": numba.nanvar.get_nanvar,
-    }
-    has_q_param = {
-        "sum": False,
-        "nansum": False,
-        "ptp": False,
-        "percentile": True,
-        "nanpercentile": True,
-        "quantile": True,
-        "nanquantile": True,
-        "median": False,
-        "nanmedian": False,
-        "average": False,
-        "mean": False,
-        "nanmean": False,
-        "std": False,
-        "nanstd": False,
-        "var": False,
-        "nanvar": False,
-    }
-
-    if np_method not in method_map:
+    if np_method not in METHOD_MAP:
         raise ValueError(f"No fast implementation available for {np_method}")
-    if np_method not in has_q_param:
-        raise ValueError(f"No q param config available for {np_method}")
-    return method_map[np_method], has_q_param[np_method]
+    return METHOD_MAP[np_method], HAS_Q_PARAM[np_method]
+
+
+def get_accuracy_method(np_method: str, accuracy: str) -> str:
+    """Get the name of the kernels computing a method with compensated summation.
+
+    Args:
+        np_method: Name of the numpy method
+        accuracy: Summation mode ("pairwise" or "kahan")
+
+    Returns:
+        str: Name of the method to route to
+    """
+    if accuracy not in ACCURACY_MODES.get(np_method, ()):
+        raise ValueError(f"accuracy={accuracy!r} is not available for {np_method}")
+    return f"{np_method}_{accuracy}"
+
+
+def get_interpolation_method(
+    np_method: str, interpolation: str, q: float
+) -> Tuple[str, Tuple[float, int]]:
+    """Get the kernels computing a quantile with another interpolation than "linear".
+
+    Args:
+        np_method: Name of the numpy method (e.g. "percentile")
+        interpolation: Interpolation method, as in np.quantile(method=...)
+        q: Quantile or percentile
+
+    Returns:
+        str: Name of the method to route to
+        Tuple[float, int]: The parameter of its kernels
+    """
+    if np_method not in INTERPOLATION_RANGES:
+        raise ValueError(f"method={interpolation!r} is not available for {np_method}")
+    if interpolation not in INTERPOLATION_METHODS:
+        raise ValueError(
+            f"method must be one of {tuple(INTERPOLATION_METHODS)}, received: {interpolation!r}"
+        )
+    if q is not None and not np.isscalar(q):
+        raise ValueError(
+            f"method={interpolation!r} only supports a scalar q, received: {q}"
+        )
+    q_max = INTERPOLATION_RANGES[np_method]
+    if q is None or not 0 <= q <= q_max:
+        raise ValueError(f"q must be a number in the range [0, {q_max}], received: {q}")
+    return f"{np_method}_interpolated", (float(q), INTERPOLATION_METHODS[interpolation])
+
+
+def get_counting_method(np_method: str, dtype: np.dtype, length: int) -> str:
+    """Get the name of the counting kernels for a method, if they're faster.
+
+    Args:
+        np_method: Name of the method being routed
+        dtype: Dtype of the data
+        length: Number of elements reduced into each output
+
+    Returns:
+        str: Name of the method to route to (np_method if it isn't counted)
+    """
+    if dtype.kind not in "iu" or dtype.itemsize > 2:
+        return np_method
+    if length < COUNTING_MIN_LENGTH * dtype.itemsize:
+        return np_method
+    return COUNTING_METHODS.get(np_method, np_method)
+
+
+def get_pairwise_reduction(np_method: str) -> Optional[Tuple[str, bool]]:
+    """Get the statistic computed by a pairwise method over a whole array.
+
+    Args:
+        np_method: Name of the method being routed
+
+    Returns:
+        Tuple[str, bool]: The statistic and whether NaNs are skipped, or None if
+            the method isn't a pairwise summation method
+    """
+    return PAIRWISE_REDUCTIONS.get(np_method)
+
+
+def get_contiguous_statistic(np_method: str) -> Optional[str]:
+    """Get the statistic computed by the contiguous row / column kernels for a method.
+
+    Args:
+        np_method: Name of the method being routed
+
+    Returns:
+        str: Name of the statistic, or None if the method has no contiguous kernel
+    """
+    return CONTIGUOUS_STATISTICS.get(np_method)
 
 
 def get_max_dims() -> int:
@@ -65,11 +339,11 @@ def get_max_dims() -> int:
 
 
 def get_keep_axes(axis: Union[int, Iterable[int]], ndim: int) -> Tuple[int]:
-    keep_axes = list(range(ndim))
     if isinstance(axis, int):
-        axis = [axis]
+        axis = (axis,)
+    reduce_axes = set()
     for a in axis:
-        keep_axes.remove(a)
-
-    keep_axes = tuple(keep_axes)
-    return keep_axes
+        if not -ndim <= a < ndim:
+            raise ValueError(f"axis {a} is out of bounds for array of dimension {ndim}")
+        reduce_axes.add(a % ndim)
+    return tuple(k for k in range(ndim) if k not in reduce_axes)
@@ -0,0 +1,117 @@
+from typing import Union, Iterable, Optional
+import numpy as np
+from .numba import sparse
+from .parallel import kernel_threads
+from .routing import get_keep_axes
+
+# Moment statistics and whether they skip NaNs
+SPARSE_MOMENTS = {
+    "sum": (sparse.SUM, False),
+    "nansum": (sparse.SUM, True),
+    "mean": (sparse.MEAN, False),
+    "nanmean": (sparse.MEAN, True),
+    "average": (sparse.MEAN, False),
+    "var": (sparse.VAR, False),
+    "nanvar": (sparse.VAR, True),
+    "std": (sparse.STD, False),
+    "nanstd": (sparse.STD, True),
+}
+
+# Quantile statistics, the scale of their q parameter, and whether they skip NaNs
+SPARSE_QUANTILES = {
+    "median": (None, False),
+    "nanmedian": (None, True),
+    "quantile": (1.0, False),
+    "nanquantile": (1.0, True),
+    "percentile": (100.0, False),
+    "nanpercentile": (100.0, True),
+}
+
+
+def is_sparse(data) -> bool:
+    """Whether data is a scipy.sparse CSR / CSC matrix (or array).
+
+    This checks the format attribute rather than the type, so that scipy is
+    only needed by callers that actually have sparse data.
+    """
+    return getattr(data, "format", None) in ("csr", "csc") and hasattr(data, "indptr")
+
+
+def call_sparse(
+    data,
+    method: str,
+    axis: Optional[Union[int, Iterable[int]]] = None,
+    keepdims: bool = False,
+    q: Optional[float] = None,
+    num_threads: Optional[int] = None,
+) -> np.ndarray:
+    """Reduce a CSR / CSC matrix on its compressed arrays, counting implicit zeros.
+
+    The result is always a dense numpy array (or a scalar when every axis is
+    reduced), never an np.matrix.
+    """
+    if method not in SPARSE_MOMENTS and method not in SPARSE_QUANTILES:
+        raise ValueError(f"{method} doesn't support scipy.sparse inputs")
+    if data.ndim != 2:
+        raise ValueError(f"Sparse inputs must be 2D, received {data.ndim}D")
+
+    # Duplicate entries would break the per-segment statistics
+    if not data.has_canonical_format:
+        data = data.copy()
+        data.sum_duplicates()
+
+    keep_axes = () if axis is None else get_keep_axes(axis, 2)
+    reduce_axes = tuple(a for a in range(2) if a not in keep_axes)
+    major_axis = 0 if data.format == "csr" else 1
+    indptr, indices, values = data.indptr, data.indices, data.data
+    num_minor = data.shape[1 - major_axis]
+
+    # A full reduction is a reduction of a single segment holding every value
+    if not keep_axes:
+        indptr = np.array([0, values.size], dtype=indptr.dtype)
+        length = data.shape[0] * data.shape[1]
+    elif keep_axes == (major_axis,):
+        length = num_minor
+    else:
+        length = data.shape[major_axis]
+
+    if method in SPARSE_QUANTILES:
+        scale, skipna = SPARSE_QUANTILES[method]
+        skipna = skipna and values.dtype.kind in "fc"
+        if scale is None:
+            qs = np.asarray(0.5)
+        else:
+            qs = np.asarray(q, dtype=np.float64) / scale
+        if np.any((qs < 0) | (qs > 1)):
+            raise ValueError(f"Quantiles must be in the range [0, 1], received {qs}")
+        # Segments along the minor axis have to be gathered first
+        if keep_axes and keep_axes != (major_axis,):
+            indptr, indices, values = sparse.transpose(
+                indptr, indices, values, num_minor
+            )
+        with kernel_threads(indptr.size - 1, values.size, num_threads):
+            out = sparse.quantile_major(indptr, values, length, np.ravel(qs), skipna)
+        out = np.reshape(out, qs.shape + (indptr.size - 1,))
+    else:
+        statistic, skipna = SPARSE_MOMENTS[method]
+        skipna = skipna and values.dtype.kind in "fc"
+        if not keep_axes or keep_axes == (major_axis,):
+            with kernel_threads(indptr.size - 1, values.size, num_threads):
+                out = sparse.reduce_major(indptr, values, length, statistic, skipna)
+        else:
+            num_chunks = min(sparse.SPARSE_TASKS, values.size // sparse.MIN_CHUNK_NNZ)
+            num_chunks = max(num_chunks, 1)
+            with kernel_threads(num_chunks, values.size, num_threads):
+                out = sparse.reduce_minor(
+                    indptr, indices, values, num_minor, statistic, skipna, num_chunks
+                )
+
+    if not keep_axes:
+        out = out[..., 0]
+        if keepdims:
+            out = np.reshape(out, out.shape + (1, 1))
+        elif out.ndim == 0:
+            out = out[()]
+    elif keepdims:
+        out = np.expand_dims(out, out.ndim - 1 + reduce_axes[0])
+    return out
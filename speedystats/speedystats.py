@@ -1,6 +1,26 @@
 from typing import Union, Iterable, Optional
+from math import prod
 import numpy as np
-from .routing import speedystat_route, get_max_dims, get_keep_axes
+from .parallel import kernel_threads
+from .routing import (
+    speedystat_route,
+    get_max_dims,
+    get_keep_axes,
+    get_accuracy_method,
+    get_interpolation_method,
+    get_counting_method,
+    get_pairwise_reduction,
+    get_contiguous_statistic,
+)
+from .numba import kernels
+from .numba.contiguous import contiguous_shape, get_contiguous, get_contiguous_tasks
+from .sparse import is_sparse, call_sparse
+from .masked import call_masked
+from .processes import call_processes
+from .nan_policy import get_nan_policy_method
+from .asynchronous import run_async
+from .calibration import use_numpy
+from . import instrumentation, copies
 
 MAX_DIMS = get_max_dims()
 
@@ -11,10 +31,128 @@ def _call_speedystat(
     axis: Optional[Union[int, Iterable[int]]] = None,
     keepdims: bool = False,
     q: Optional[float] = None,
+    accuracy: str = "fast",
+    deterministic: bool = False,
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
+    interpolation: str = "linear",
+    nan_policy: str = "propagate",
 ) -> np.ndarray:
+    if not instrumentation.ENABLED:
+        return _dispatch_speedystat(
+            data,
+            method,
+            axis,
+            keepdims,
+            q,
+            accuracy,
+            deterministic,
+            where,
+            num_threads,
+            backend,
+            interpolation,
+            nan_policy,
+        )
+    record = instrumentation.start_call(data, method, axis, is_sparse(data))
+    out = _dispatch_speedystat(
+        data,
+        method,
+        axis,
+        keepdims,
+        q,
+        accuracy,
+        deterministic,
+        where,
+        num_threads,
+        backend,
+        interpolation,
+        nan_policy,
+        record,
+    )
+    instrumentation.finish_call(record)
+    return out
+
+
+def _dispatch_speedystat(
+    data: np.ndarray,
+    method: str,
+    axis: Optional[Union[int, Iterable[int]]] = None,
+    keepdims: bool = False,
+    q: Optional[float] = None,
+    accuracy: str = "fast",
+    deterministic: bool = False,
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
+    interpolation: str = "linear",
+    nan_policy: str = "propagate",
+    record: Optional[instrumentation.CallRecord] = None,
+) -> np.ndarray:
+    # nan_policy="omit" goes to the nan variant (unless a full reduction has no
+    # NaNs) and "raise" checks for NaNs first (see speedystats.nan_policy)
+    if nan_policy != "propagate":
+        method = get_nan_policy_method(data, method, axis, where, nan_policy)
+        if record is not None:
+            record.method = method
+
+    # Quantiles with another interpolation than numpy's default go to the
+    # selection kernels (which have no numpy equivalent, so every path below
+    # goes through numba)
+    if interpolation != "linear":
+        method, q = get_interpolation_method(method, interpolation, q)
+        if record is not None:
+            record.method = method
+
+    # Split the kept axes across worker processes (which call back into this
+    # function on their blocks), with num_threads setting the number of workers
+    if backend == "processes":
+        if where is not None or isinstance(data, np.ma.MaskedArray) or is_sparse(data):
+            raise ValueError("backend='processes' only supports unmasked numpy arrays")
+        if record is not None:
+            record.path = "processes"
+        return call_processes(
+            data, method, axis, keepdims, q, accuracy, deterministic, num_threads
+        )
+    if backend != "threads":
+        raise ValueError(
+            f"backend must be 'threads' or 'processes', received: {backend}"
+        )
+
+    # scipy.sparse CSR / CSC matrices are reduced directly on their compressed
+    # arrays (in an order that doesn't depend on the threads, so deterministically)
+    if is_sparse(data):
+        if accuracy != "fast":
+            raise ValueError("Accuracy modes aren't supported for sparse inputs")
+        if where is not None:
+            raise ValueError("where= masks aren't supported for sparse inputs")
+        if record is not None:
+            record.path = "sparse"
+        return call_sparse(data, method, axis, keepdims, q, num_threads)
+
+    # Deterministic results need a summation order that doesn't depend on the
+    # number of threads or on fastmath, which is what the pairwise kernels use
+    if deterministic and accuracy == "fast":
+        accuracy = "pairwise"
+
+    # Use the compensated summation kernels if requested (these have no numpy
+    # equivalent, so the fallbacks below also go through numba)
+    if accuracy != "fast":
+        method = get_accuracy_method(method, accuracy)
+        if record is not None:
+            record.method = method
+
+    # Masked arrays and where= masks reduce the unmasked values only
+    if where is not None or isinstance(data, np.ma.MaskedArray):
+        if record is not None:
+            record.path = "masked"
+        return call_masked(data, method, axis, keepdims, q, where, num_threads, record)
+
     # If the axis is None, use the numpy fallback
     if axis is None:
-        return _fallback_speedystat(data, method, axis, keepdims, q)
+        return _fallback_speedystat(
+            data, method, axis, keepdims, q, num_threads, record
+        )
 
     # Identify the shape of the data and the axes to keep
     data_ndims = data.ndim
@@ -23,26 +161,62 @@ def _call_speedystat(
 
     # If no axes are kept, use the numpy fallback
     if not keep_axes:
-        return _fallback_speedystat(data, method, axis, keepdims, q)
+        return _fallback_speedystat(
+            data, method, axis, keepdims, q, num_threads, record
+        )
 
     # If the number of axes to keep isn't supported, use the numpy fallback
     if any(k >= MAX_DIMS for k in keep_axes):
-        return _fallback_speedystat(data, method, axis, keepdims, q)
+        return _fallback_speedystat(
+            data, method, axis, keepdims, q, num_threads, record
+        )
+
+    # Use numpy where calibrate() found it faster on this machine
+    if use_numpy(method, data_shape, keep_axes):
+        return _fallback_speedystat(
+            data, method, axis, keepdims, q, num_threads, record
+        )
+
+    # C-contiguous data with consecutive kept axes goes to the hand-written row
+    # and column kernels, which sweep memory in order instead of gathering
+    statistic = get_contiguous_statistic(method)
+    shape = None if statistic is None else contiguous_shape(data, keep_axes)
+    if shape is not None:
+        if record is not None:
+            record.path = "contiguous"
+        with kernel_threads(get_contiguous_tasks(shape), data.size, num_threads):
+            out = get_contiguous(data, shape, statistic)
+        out = np.reshape(out, tuple(data_shape[k] for k in keep_axes))
+        if keepdims:
+            out = np.expand_dims(out, axis)
+        return out
 
     # Reshape the data to be flattened along reducing axes
     last_axis = keep_axes[-1]
     if data_ndims > last_axis + 1:
         new_shape = data_shape[: last_axis + 1] + (-1,)
+        if record is not None or copies.POLICY != "ignore":
+            copies.check_copy(data, [range(last_axis + 1, data_ndims)], method, record)
         data = np.reshape(data, new_shape)
 
+    # Small integer types are reduced by counting, which doesn't copy each slice
+    num_outputs = prod(data_shape[k] for k in keep_axes)
+    length = data.size // num_outputs if num_outputs else 0
+    counting_method = get_counting_method(method, data.dtype, length)
+    if counting_method != method:
+        method = counting_method
+        if record is not None:
+            record.path = "counting"
+
     # Get the numba implementation and check if it has a q parameter
     func, has_q_param = speedystat_route(method)
 
-    # Call the numba implementation
-    if has_q_param:
-        out = func(data, keep_axes, q)
-    else:
-        out = func(data, keep_axes)
+    # Call the numba implementation, on as many threads as the output can use
+    with kernel_threads(num_outputs, data.size, num_threads):
+        if has_q_param:
+            out = func(data, keep_axes, q)
+        else:
+            out = func(data, keep_axes)
 
     # Reshape the output to match the original data shape if keepdims is True
     if keepdims:
@@ -57,7 +231,20 @@ def _fallback_speedystat(
     axis: Optional[Union[int, Iterable[int]]] = None,
     keepdims: bool = False,
     q: Optional[float] = None,
+    num_threads: Optional[int] = None,
+    record: Optional[instrumentation.CallRecord] = None,
 ) -> np.ndarray:
+    # Methods that numpy doesn't provide have to go through the numba kernels
+    if not hasattr(np, method):
+        if record is not None:
+            record.path = "flattened"
+        return _flattened_speedystat(
+            data, method, axis, keepdims, q, num_threads, record
+        )
+
+    if record is not None:
+        record.path = "numpy"
+
     np_method = getattr(np, method)
     if q is not None:
         return np_method(data, axis=axis, keepdims=keepdims, q=q)
@@ -65,28 +252,182 @@ def _fallback_speedystat(
         return np_method(data, axis=axis, keepdims=keepdims)
 
 
+def _flattened_speedystat(
+    data: np.ndarray,
+    method: str,
+    axis: Optional[Union[int, Iterable[int]]] = None,
+    keepdims: bool = False,
+    q: Optional[float] = None,
+    num_threads: Optional[int] = None,
+    record: Optional[instrumentation.CallRecord] = None,
+) -> np.ndarray:
+    if axis is None:
+        keep_axes = ()
+    else:
+        keep_axes = get_keep_axes(axis, data.ndim)
+    reduce_axes = tuple(a for a in range(data.ndim) if a not in keep_axes)
+    keep_shape = tuple(data.shape[k] for k in keep_axes)
+
+    # Full pairwise reductions are split into fixed-size chunks that run in parallel
+    pairwise_reduction = get_pairwise_reduction(method)
+    if not keep_axes and pairwise_reduction is not None:
+        statistic, skipna = pairwise_reduction
+        num_chunks = -(-data.size // kernels.PAIRWISE_CHUNK)
+        if record is not None or copies.POLICY != "ignore":
+            copies.check_copy(data, [range(data.ndim)], method, record, stacklevel=7)
+        with kernel_threads(num_chunks, data.size, num_threads):
+            out = kernels.pairwise_reduction(np.ravel(data), statistic, skipna)
+        if keepdims:
+            out = np.reshape(out, (1,) * data.ndim)
+        return out
+
+    data = np.transpose(data, keep_axes + reduce_axes)
+    if record is not None or copies.POLICY != "ignore":
+        groups = [range(len(keep_axes)), range(len(keep_axes), data.ndim)]
+        copies.check_copy(data, groups, method, record, stacklevel=7)
+    data = np.reshape(data, (int(np.prod(keep_shape)), -1))
+
+    func, has_q_param = speedystat_route(method)
+    with kernel_threads(data.shape[0], data.size, num_threads):
+        if has_q_param:
+            out = func(data, (0,), q)
+        else:
+            out = func(data, (0,))
+
+    out = np.reshape(out, keep_shape)
+    if keepdims:
+        out = np.expand_dims(out, reduce_axes)
+    elif not keep_shape:
+        out = out[()]
+    return out
+
+
 def sum(
     data: np.ndarray,
     axis: Union[int, Iterable[int]] = None,
     keepdims: bool = False,
+    accuracy: str = "fast",
+    deterministic: bool = False,
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
+    nan_policy: str = "propagate",
+) -> np.ndarray:
+    return _call_speedystat(
+        data,
+        "sum",
+        axis,
+        keepdims,
+        accuracy=accuracy,
+        deterministic=deterministic,
+        where=where,
+        num_threads=num_threads,
+        backend=backend,
+        nan_policy=nan_policy,
+    )
+
+
+async def asum(
+    data: np.ndarray,
+    axis: Union[int, Iterable[int]] = None,
+    keepdims: bool = False,
+    accuracy: str = "fast",
+    deterministic: bool = False,
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
+    nan_policy: str = "propagate",
 ) -> np.ndarray:
-    return _call_speedystat(data, "sum", axis, keepdims)
+    return await run_async(
+        sum,
+        data,
+        axis,
+        keepdims,
+        accuracy=accuracy,
+        deterministic=deterministic,
+        where=where,
+        num_threads=num_threads,
+        backend=backend,
+        nan_policy=nan_policy,
+    )
 
 
 def nansum(
     data: np.ndarray,
     axis: Union[int, Iterable[int]] = None,
     keepdims: bool = False,
+    accuracy: str = "fast",
+    deterministic: bool = False,
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
 ) -> np.ndarray:
-    return _call_speedystat(data, "nansum", axis, keepdims)
+    return _call_speedystat(
+        data,
+        "nansum",
+        axis,
+        keepdims,
+        accuracy=accuracy,
+        deterministic=deterministic,
+        where=where,
+        num_threads=num_threads,
+        backend=backend,
+    )
+
+
+async def anansum(
+    data: np.ndarray,
+    axis: Union[int, Iterable[int]] = None,
+    keepdims: bool = False,
+    accuracy: str = "fast",
+    deterministic: bool = False,
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
+) -> np.ndarray:
+    return await run_async(
+        nansum,
+        data,
+        axis,
+        keepdims,
+        accuracy=accuracy,
+        deterministic=deterministic,
+        where=where,
+        num_threads=num_threads,
+        backend=backend,
+    )
 
 
 def ptp(
     data: np.ndarray,
     axis: Union[int, Iterable[int]] = None,
     keepdims: bool = False,
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
 ) -> np.ndarray:
-    return _call_speedystat(data, "ptp", axis, keepdims)
+    return _call_speedystat(
+        data,
+        "ptp",
+        axis,
+        keepdims,
+        where=where,
+        num_threads=num_threads,
+        backend=backend,
+    )
+
+
+async def aptp(
+    data: np.ndarray,
+    axis: Union[int, Iterable[int]] = None,
+    keepdims: bool = False,
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
+) -> np.ndarray:
+    return await run_async(
+        ptp, data, axis, keepdims, where=where, num_threads=num_threads, backend=backend
+    )
 
 
 def percentile(
@@ -94,8 +435,49 @@ def percentile(
     axis: Union[int, Iterable[int]] = None,
     keepdims: bool = False,
     q: Optional[float] = None,
+    method: str = "linear",
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
+    nan_policy: str = "propagate",
 ) -> np.ndarray:
-    return _call_speedystat(data, "percentile", axis, keepdims, q)
+    return _call_speedystat(
+        data,
+        "percentile",
+        axis,
+        keepdims,
+        q,
+        where=where,
+        num_threads=num_threads,
+        backend=backend,
+        interpolation=method,
+        nan_policy=nan_policy,
+    )
+
+
+async def apercentile(
+    data: np.ndarray,
+    axis: Union[int, Iterable[int]] = None,
+    keepdims: bool = False,
+    q: Optional[float] = None,
+    method: str = "linear",
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
+    nan_policy: str = "propagate",
+) -> np.ndarray:
+    return await run_async(
+        percentile,
+        data,
+        axis,
+        keepdims,
+        q,
+        where=where,
+        num_threads=num_threads,
+        backend=backend,
+        method=method,
+        nan_policy=nan_policy,
+    )
 
 
 def nanpercentile(
@@ -103,8 +485,45 @@ def nanpercentile(
     axis: Union[int, Iterable[int]] = None,
     keepdims: bool = False,
     q: Optional[float] = None,
+    method: str = "linear",
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
+) -> np.ndarray:
+    return _call_speedystat(
+        data,
+        "nanpercentile",
+        axis,
+        keepdims,
+        q,
+        where=where,
+        num_threads=num_threads,
+        backend=backend,
+        interpolation=method,
+    )
+
+
+async def ananpercentile(
+    data: np.ndarray,
+    axis: Union[int, Iterable[int]] = None,
+    keepdims: bool = False,
+    q: Optional[float] = None,
+    method: str = "linear",
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
 ) -> np.ndarray:
-    return _call_speedystat(data, "nanpercentile", axis, keepdims, q)
+    return await run_async(
+        nanpercentile,
+        data,
+        axis,
+        keepdims,
+        q,
+        where=where,
+        num_threads=num_threads,
+        backend=backend,
+        method=method,
+    )
 
 
 def quantile(
@@ -112,8 +531,49 @@ def quantile(
     axis: Union[int, Iterable[int]] = None,
     keepdims: bool = False,
     q: Optional[float] = None,
+    method: str = "linear",
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
+    nan_policy: str = "propagate",
 ) -> np.ndarray:
-    return _call_speedystat(data, "quantile", axis, keepdims, q)
+    return _call_speedystat(
+        data,
+        "quantile",
+        axis,
+        keepdims,
+        q,
+        where=where,
+        num_threads=num_threads,
+        backend=backend,
+        interpolation=method,
+        nan_policy=nan_policy,
+    )
+
+
+async def aquantile(
+    data: np.ndarray,
+    axis: Union[int, Iterable[int]] = None,
+    keepdims: bool = False,
+    q: Optional[float] = None,
+    method: str = "linear",
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
+    nan_policy: str = "propagate",
+) -> np.ndarray:
+    return await run_async(
+        quantile,
+        data,
+        axis,
+        keepdims,
+        q,
+        where=where,
+        num_threads=num_threads,
+        backend=backend,
+        method=method,
+        nan_policy=nan_policy,
+    )
 
 
 def nanquantile(
@@ -121,77 +581,944 @@ def nanquantile(
     axis: Union[int, Iterable[int]] = None,
     keepdims: bool = False,
     q: Optional[float] = None,
+    method: str = "linear",
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
+) -> np.ndarray:
+    return _call_speedystat(
+        data,
+        "nanquantile",
+        axis,
+        keepdims,
+        q,
+        where=where,
+        num_threads=num_threads,
+        backend=backend,
+        interpolation=method,
+    )
+
+
+async def ananquantile(
+    data: np.ndarray,
+    axis: Union[int, Iterable[int]] = None,
+    keepdims: bool = False,
+    q: Optional[float] = None,
+    method: str = "linear",
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
 ) -> np.ndarray:
-    return _call_speedystat(data, "nanquantile", axis, keepdims, q)
+    return await run_async(
+        nanquantile,
+        data,
+        axis,
+        keepdims,
+        q,
+        where=where,
+        num_threads=num_threads,
+        backend=backend,
+        method=method,
+    )
 
 
 def median(
     data: np.ndarray,
     axis: Union[int, Iterable[int]] = None,
     keepdims: bool = False,
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
+    nan_policy: str = "propagate",
+) -> np.ndarray:
+    return _call_speedystat(
+        data,
+        "median",
+        axis,
+        keepdims,
+        where=where,
+        num_threads=num_threads,
+        backend=backend,
+        nan_policy=nan_policy,
+    )
+
+
+async def amedian(
+    data: np.ndarray,
+    axis: Union[int, Iterable[int]] = None,
+    keepdims: bool = False,
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
+    nan_policy: str = "propagate",
 ) -> np.ndarray:
-    return _call_speedystat(data, "median", axis, keepdims)
+    return await run_async(
+        median,
+        data,
+        axis,
+        keepdims,
+        where=where,
+        num_threads=num_threads,
+        backend=backend,
+        nan_policy=nan_policy,
+    )
 
 
 def nanmedian(
     data: np.ndarray,
     axis: Union[int, Iterable[int]] = None,
     keepdims: bool = False,
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
 ) -> np.ndarray:
-    return _call_speedystat(data, "nanmedian", axis, keepdims)
+    return _call_speedystat(
+        data,
+        "nanmedian",
+        axis,
+        keepdims,
+        where=where,
+        num_threads=num_threads,
+        backend=backend,
+    )
+
+
+async def ananmedian(
+    data: np.ndarray,
+    axis: Union[int, Iterable[int]] = None,
+    keepdims: bool = False,
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
+) -> np.ndarray:
+    return await run_async(
+        nanmedian,
+        data,
+        axis,
+        keepdims,
+        where=where,
+        num_threads=num_threads,
+        backend=backend,
+    )
 
 
 def average(
     data: np.ndarray,
     axis: Union[int, Iterable[int]] = None,
     keepdims: bool = False,
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
+) -> np.ndarray:
+    return _call_speedystat(
+        data,
+        "average",
+        axis,
+        keepdims,
+        where=where,
+        num_threads=num_threads,
+        backend=backend,
+    )
+
+
+async def aaverage(
+    data: np.ndarray,
+    axis: Union[int, Iterable[int]] = None,
+    keepdims: bool = False,
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
 ) -> np.ndarray:
-    return _call_speedystat(data, "average", axis, keepdims)
+    return await run_async(
+        average,
+        data,
+        axis,
+        keepdims,
+        where=where,
+        num_threads=num_threads,
+        backend=backend,
+    )
 
 
 def mean(
     data: np.ndarray,
     axis: Union[int, Iterable[int]] = None,
     keepdims: bool = False,
+    accuracy: str = "fast",
+    deterministic: bool = False,
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
+    nan_policy: str = "propagate",
 ) -> np.ndarray:
-    return _call_speedystat(data, "mean", axis, keepdims)
+    return _call_speedystat(
+        data,
+        "mean",
+        axis,
+        keepdims,
+        accuracy=accuracy,
+        deterministic=deterministic,
+        where=where,
+        num_threads=num_threads,
+        backend=backend,
+        nan_policy=nan_policy,
+    )
+
+
+async def amean(
+    data: np.ndarray,
+    axis: Union[int, Iterable[int]] = None,
+    keepdims: bool = False,
+    accuracy: str = "fast",
+    deterministic: bool = False,
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
+    nan_policy: str = "propagate",
+) -> np.ndarray:
+    return await run_async(
+        mean,
+        data,
+        axis,
+        keepdims,
+        accuracy=accuracy,
+        deterministic=deterministic,
+        where=where,
+        num_threads=num_threads,
+        backend=backend,
+        nan_policy=nan_policy,
+    )
 
 
 def nanmean(
     data: np.ndarray,
     axis: Union[int, Iterable[int]] = None,
     keepdims: bool = False,
+    accuracy: str = "fast",
+    deterministic: bool = False,
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
 ) -> np.ndarray:
-    return _call_speedystat(data, "nanmean", axis, keepdims)
+    return _call_speedystat(
+        data,
+        "nanmean",
+        axis,
+        keepdims,
+        accuracy=accuracy,
+        deterministic=deterministic,
+        where=where,
+        num_threads=num_threads,
+        backend=backend,
+    )
+
+
+async def ananmean(
+    data: np.ndarray,
+    axis: Union[int, Iterable[int]] = None,
+    keepdims: bool = False,
+    accuracy: str = "fast",
+    deterministic: bool = False,
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
+) -> np.ndarray:
+    return await run_async(
+        nanmean,
+        data,
+        axis,
+        keepdims,
+        accuracy=accuracy,
+        deterministic=deterministic,
+        where=where,
+        num_threads=num_threads,
+        backend=backend,
+    )
 
 
 def std(
     data: np.ndarray,
     axis: Union[int, Iterable[int]] = None,
     keepdims: bool = False,
+    accuracy: str = "fast",
+    deterministic: bool = False,
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
+    nan_policy: str = "propagate",
+) -> np.ndarray:
+    return _call_speedystat(
+        data,
+        "std",
+        axis,
+        keepdims,
+        accuracy=accuracy,
+        deterministic=deterministic,
+        where=where,
+        num_threads=num_threads,
+        backend=backend,
+        nan_policy=nan_policy,
+    )
+
+
+async def astd(
+    data: np.ndarray,
+    axis: Union[int, Iterable[int]] = None,
+    keepdims: bool = False,
+    accuracy: str = "fast",
+    deterministic: bool = False,
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
+    nan_policy: str = "propagate",
 ) -> np.ndarray:
-    return _call_speedystat(data, "std", axis, keepdims)
+    return await run_async(
+        std,
+        data,
+        axis,
+        keepdims,
+        accuracy=accuracy,
+        deterministic=deterministic,
+        where=where,
+        num_threads=num_threads,
+        backend=backend,
+        nan_policy=nan_policy,
+    )
 
 
 def nanstd(
     data: np.ndarray,
     axis: Union[int, Iterable[int]] = None,
     keepdims: bool = False,
+    accuracy: str = "fast",
+    deterministic: bool = False,
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
 ) -> np.ndarray:
-    return _call_speedystat(data, "nanstd", axis, keepdims)
+    return _call_speedystat(
+        data,
+        "nanstd",
+        axis,
+        keepdims,
+        accuracy=accuracy,
+        deterministic=deterministic,
+        where=where,
+        num_threads=num_threads,
+        backend=backend,
+    )
+
+
+async def ananstd(
+    data: np.ndarray,
+    axis: Union[int, Iterable[int]] = None,
+    keepdims: bool = False,
+    accuracy: str = "fast",
+    deterministic: bool = False,
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
+) -> np.ndarray:
+    return await run_async(
+        nanstd,
+        data,
+        axis,
+        keepdims,
+        accuracy=accuracy,
+        deterministic=deterministic,
+        where=where,
+        num_threads=num_threads,
+        backend=backend,
+    )
 
 
 def var(
     data: np.ndarray,
     axis: Union[int, Iterable[int]] = None,
     keepdims: bool = False,
+    accuracy: str = "fast",
+    deterministic: bool = False,
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
+    nan_policy: str = "propagate",
 ) -> np.ndarray:
-    return _call_speedystat(data, "var", axis, keepdims)
+    return _call_speedystat(
+        data,
+        "var",
+        axis,
+        keepdims,
+        accuracy=accuracy,
+        deterministic=deterministic,
+        where=where,
+        num_threads=num_threads,
+        backend=backend,
+        nan_policy=nan_policy,
+    )
+
+
+async def avar(
+    data: np.ndarray,
+    axis: Union[int, Iterable[int]] = None,
+    keepdims: bool = False,
+    accuracy: str = "fast",
+    deterministic: bool = False,
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
+    nan_policy: str = "propagate",
+) -> np.ndarray:
+    return await run_async(
+        var,
+        data,
+        axis,
+        keepdims,
+        accuracy=accuracy,
+        deterministic=deterministic,
+        where=where,
+        num_threads=num_threads,
+        backend=backend,
+        nan_policy=nan_policy,
+    )
 
 
 def nanvar(
     data: np.ndarray,
     axis: Union[int, Iterable[int]] = None,
     keepdims: bool = False,
+    accuracy: str = "fast",
+    deterministic: bool = False,
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
+) -> np.ndarray:
+    return _call_speedystat(
+        data,
+        "nanvar",
+        axis,
+        keepdims,
+        accuracy=accuracy,
+        deterministic=deterministic,
+        where=where,
+        num_threads=num_threads,
+        backend=backend,
+    )
+
+
+async def ananvar(
+    data: np.ndarray,
+    axis: Union[int, Iterable[int]] = None,
+    keepdims: bool = False,
+    accuracy: str = "fast",
+    deterministic: bool = False,
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
+) -> np.ndarray:
+    return await run_async(
+        nanvar,
+        data,
+        axis,
+        keepdims,
+        accuracy=accuracy,
+        deterministic=deterministic,
+        where=where,
+        num_threads=num_threads,
+        backend=backend,
+    )
+
+
+def min(
+    data: np.ndarray,
+    axis: Union[int, Iterable[int]] = None,
+    keepdims: bool = False,
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
+    nan_policy: str = "propagate",
+) -> np.ndarray:
+    return _call_speedystat(
+        data,
+        "min",
+        axis,
+        keepdims,
+        where=where,
+        num_threads=num_threads,
+        backend=backend,
+        nan_policy=nan_policy,
+    )
+
+
+async def amin(
+    data: np.ndarray,
+    axis: Union[int, Iterable[int]] = None,
+    keepdims: bool = False,
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
+    nan_policy: str = "propagate",
+) -> np.ndarray:
+    return await run_async(
+        min,
+        data,
+        axis,
+        keepdims,
+        where=where,
+        num_threads=num_threads,
+        backend=backend,
+        nan_policy=nan_policy,
+    )
+
+
+def nanmin(
+    data: np.ndarray,
+    axis: Union[int, Iterable[int]] = None,
+    keepdims: bool = False,
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
+) -> np.ndarray:
+    return _call_speedystat(
+        data,
+        "nanmin",
+        axis,
+        keepdims,
+        where=where,
+        num_threads=num_threads,
+        backend=backend,
+    )
+
+
+async def ananmin(
+    data: np.ndarray,
+    axis: Union[int, Iterable[int]] = None,
+    keepdims: bool = False,
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
+) -> np.ndarray:
+    return await run_async(
+        nanmin,
+        data,
+        axis,
+        keepdims,
+        where=where,
+        num_threads=num_threads,
+        backend=backend,
+    )
+
+
+def max(
+    data: np.ndarray,
+    axis: Union[int, Iterable[int]] = None,
+    keepdims: bool = False,
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
+    nan_policy: str = "propagate",
+) -> np.ndarray:
+    return _call_speedystat(
+        data,
+        "max",
+        axis,
+        keepdims,
+        where=where,
+        num_threads=num_threads,
+        backend=backend,
+        nan_policy=nan_policy,
+    )
+
+
+async def amax(
+    data: np.ndarray,
+    axis: Union[int, Iterable[int]] = None,
+    keepdims: bool = False,
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
+    nan_policy: str = "propagate",
+) -> np.ndarray:
+    return await run_async(
+        max,
+        data,
+        axis,
+        keepdims,
+        where=where,
+        num_threads=num_threads,
+        backend=backend,
+        nan_policy=nan_policy,
+    )
+
+
+def nanmax(
+    data: np.ndarray,
+    axis: Union[int, Iterable[int]] = None,
+    keepdims: bool = False,
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
+) -> np.ndarray:
+    return _call_speedystat(
+        data,
+        "nanmax",
+        axis,
+        keepdims,
+        where=where,
+        num_threads=num_threads,
+        backend=backend,
+    )
+
+
+async def ananmax(
+    data: np.ndarray,
+    axis: Union[int, Iterable[int]] = None,
+    keepdims: bool = False,
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
+) -> np.ndarray:
+    return await run_async(
+        nanmax,
+        data,
+        axis,
+        keepdims,
+        where=where,
+        num_threads=num_threads,
+        backend=backend,
+    )
+
+
+def trim_mean(
+    data: np.ndarray,
+    axis: Union[int, Iterable[int]] = None,
+    keepdims: bool = False,
+    proportion: float = 0.1,
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
+    nan_policy: str = "propagate",
+) -> np.ndarray:
+    return _call_speedystat(
+        data,
+        "trim_mean",
+        axis,
+        keepdims,
+        proportion,
+        where=where,
+        num_threads=num_threads,
+        backend=backend,
+        nan_policy=nan_policy,
+    )
+
+
+async def atrim_mean(
+    data: np.ndarray,
+    axis: Union[int, Iterable[int]] = None,
+    keepdims: bool = False,
+    proportion: float = 0.1,
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
+    nan_policy: str = "propagate",
+) -> np.ndarray:
+    return await run_async(
+        trim_mean,
+        data,
+        axis,
+        keepdims,
+        proportion,
+        where=where,
+        num_threads=num_threads,
+        backend=backend,
+        nan_policy=nan_policy,
+    )
+
+
+def nantrim_mean(
+    data: np.ndarray,
+    axis: Union[int, Iterable[int]] = None,
+    keepdims: bool = False,
+    proportion: float = 0.1,
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
+) -> np.ndarray:
+    return _call_speedystat(
+        data,
+        "nantrim_mean",
+        axis,
+        keepdims,
+        proportion,
+        where=where,
+        num_threads=num_threads,
+        backend=backend,
+    )
+
+
+async def anantrim_mean(
+    data: np.ndarray,
+    axis: Union[int, Iterable[int]] = None,
+    keepdims: bool = False,
+    proportion: float = 0.1,
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
+) -> np.ndarray:
+    return await run_async(
+        nantrim_mean,
+        data,
+        axis,
+        keepdims,
+        proportion,
+        where=where,
+        num_threads=num_threads,
+        backend=backend,
+    )
+
+
+def winsorized_mean(
+    data: np.ndarray,
+    axis: Union[int, Iterable[int]] = None,
+    keepdims: bool = False,
+    proportion: float = 0.1,
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
+    nan_policy: str = "propagate",
+) -> np.ndarray:
+    return _call_speedystat(
+        data,
+        "winsorized_mean",
+        axis,
+        keepdims,
+        proportion,
+        where=where,
+        num_threads=num_threads,
+        backend=backend,
+        nan_policy=nan_policy,
+    )
+
+
+async def awinsorized_mean(
+    data: np.ndarray,
+    axis: Union[int, Iterable[int]] = None,
+    keepdims: bool = False,
+    proportion: float = 0.1,
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
+    nan_policy: str = "propagate",
+) -> np.ndarray:
+    return await run_async(
+        winsorized_mean,
+        data,
+        axis,
+        keepdims,
+        proportion,
+        where=where,
+        num_threads=num_threads,
+        backend=backend,
+        nan_policy=nan_policy,
+    )
+
+
+def nanwinsorized_mean(
+    data: np.ndarray,
+    axis: Union[int, Iterable[int]] = None,
+    keepdims: bool = False,
+    proportion: float = 0.1,
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
+) -> np.ndarray:
+    return _call_speedystat(
+        data,
+        "nanwinsorized_mean",
+        axis,
+        keepdims,
+        proportion,
+        where=where,
+        num_threads=num_threads,
+        backend=backend,
+    )
+
+
+async def ananwinsorized_mean(
+    data: np.ndarray,
+    axis: Union[int, Iterable[int]] = None,
+    keepdims: bool = False,
+    proportion: float = 0.1,
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
+) -> np.ndarray:
+    return await run_async(
+        nanwinsorized_mean,
+        data,
+        axis,
+        keepdims,
+        proportion,
+        where=where,
+        num_threads=num_threads,
+        backend=backend,
+    )
+
+
+def median_abs_deviation(
+    data: np.ndarray,
+    axis: Union[int, Iterable[int]] = None,
+    keepdims: bool = False,
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
+    nan_policy: str = "propagate",
+) -> np.ndarray:
+    return _call_speedystat(
+        data,
+        "median_abs_deviation",
+        axis,
+        keepdims,
+        where=where,
+        num_threads=num_threads,
+        backend=backend,
+        nan_policy=nan_policy,
+    )
+
+
+async def amedian_abs_deviation(
+    data: np.ndarray,
+    axis: Union[int, Iterable[int]] = None,
+    keepdims: bool = False,
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
+    nan_policy: str = "propagate",
+) -> np.ndarray:
+    return await run_async(
+        median_abs_deviation,
+        data,
+        axis,
+        keepdims,
+        where=where,
+        num_threads=num_threads,
+        backend=backend,
+        nan_policy=nan_policy,
+    )
+
+
+def nanmedian_abs_deviation(
+    data: np.ndarray,
+    axis: Union[int, Iterable[int]] = None,
+    keepdims: bool = False,
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
+) -> np.ndarray:
+    return _call_speedystat(
+        data,
+        "nanmedian_abs_deviation",
+        axis,
+        keepdims,
+        where=where,
+        num_threads=num_threads,
+        backend=backend,
+    )
+
+
+async def ananmedian_abs_deviation(
+    data: np.ndarray,
+    axis: Union[int, Iterable[int]] = None,
+    keepdims: bool = False,
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
+) -> np.ndarray:
+    return await run_async(
+        nanmedian_abs_deviation,
+        data,
+        axis,
+        keepdims,
+        where=where,
+        num_threads=num_threads,
+        backend=backend,
+    )
+
+
+def iqr(
+    data: np.ndarray,
+    axis: Union[int, Iterable[int]] = None,
+    keepdims: bool = False,
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
+    nan_policy: str = "propagate",
+) -> np.ndarray:
+    return _call_speedystat(
+        data,
+        "iqr",
+        axis,
+        keepdims,
+        where=where,
+        num_threads=num_threads,
+        backend=backend,
+        nan_policy=nan_policy,
+    )
+
+
+async def aiqr(
+    data: np.ndarray,
+    axis: Union[int, Iterable[int]] = None,
+    keepdims: bool = False,
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
+    nan_policy: str = "propagate",
+) -> np.ndarray:
+    return await run_async(
+        iqr,
+        data,
+        axis,
+        keepdims,
+        where=where,
+        num_threads=num_threads,
+        backend=backend,
+        nan_policy=nan_policy,
+    )
+
+
+def naniqr(
+    data: np.ndarray,
+    axis: Union[int, Iterable[int]] = None,
+    keepdims: bool = False,
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
+) -> np.ndarray:
+    return _call_speedystat(
+        data,
+        "naniqr",
+        axis,
+        keepdims,
+        where=where,
+        num_threads=num_threads,
+        backend=backend,
+    )
+
+
+async def ananiqr(
+    data: np.ndarray,
+    axis: Union[int, Iterable[int]] = None,
+    keepdims: bool = False,
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
 ) -> np.ndarray:
-    return _call_speedystat(data, "nanvar", axis, keepdims)
+    return await run_async(
+        naniqr,
+        data,
+        axis,
+        keepdims,
+        where=where,
+        num_threads=num_threads,
+        backend=backend,
+    )
@@ -46,3 +46,15 @@ def random_3d_with_nan():
         np.random.randint(0, 10),
     ] = np.nan
     return data
+
+
+@pytest.fixture
+def random_4d():
+    np.random.seed(42)
+    return np.random.randn(6, 5, 4, 7)
+
+
+@pytest.fixture
+def random_5d():
+    np.random.seed(42)
+    return np.random.randn(4, 3, 5, 2, 6)
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+import speedystats
+
+
+test_methods = ["sum", "mean", "std", "var"]
+accuracy_modes = ["pairwise", "kahan"]
+
+
+@pytest.fixture
+def large_offset_float32():
+    np.random.seed(42)
+    return (np.random.randn(4, 20000) * 1e3 + 1e4).astype(np.float32)
+
+
+def test_matches_float64(large_offset_float32):
+    reference_data = large_offset_float32.astype(np.float64)
+    for method in test_methods:
+        np_method = getattr(np, method)
+        speedystat_method = getattr(speedystats, method)
+        for accuracy in accuracy_modes:
+            assert np.allclose(
+                speedystat_method(large_offset_float32, axis=1, accuracy=accuracy),
+                np_method(reference_data, axis=1),
+                rtol=1e-12,
+            )
+            assert np.allclose(
+                speedystat_method(large_offset_float32, accuracy=accuracy),
+                np_method(reference_data),
+                rtol=1e-12,
+            )
+
+
+def test_3d(random_3d):
+    for method in test_methods:
+        np_method = getattr(np, method)
+        speedystat_method = getattr(speedystats, method)
+        for accuracy in accuracy_modes:
+            for axis in [0, 2, (0, 1)]:
+                assert np.allclose(
+                    speedystat_method(random_3d, axis=axis, accuracy=accuracy),
+                    np_method(random_3d, axis=axis),
+                )
+
+
+def test_nan_variants(random_2d_with_nan):
+    for method in test_methods:
+        nan_method = f"nan{method}"
+        np_method = getattr(np, nan_method)
+        speedystat_method = getattr(speedystats, nan_method)
+        for accuracy in accuracy_modes:
+            assert np.allclose(
+                speedystat_method(random_2d_with_nan, axis=0, accuracy=accuracy),
+                np_method(random_2d_with_nan, axis=0),
+            )
+
+
+def test_invalid_accuracy(random_2d):
+    with pytest.raises(ValueError):
+        speedystats.sum(random_2d, axis=0, accuracy="exact")
@@ -0,0 +1,48 @@
+import asyncio
+import numpy as np
+import speedystats
+
+
+def test_async(random_3d):
+    async def main():
+        return await asyncio.gather(
+            speedystats.amean(random_3d, axis=0),
+            speedystats.aquantile(random_3d, axis=(1, 2), q=0.2),
+            speedystats.acumsum(random_3d, axis=1),
+        )
+
+    mean, quantile, cumsum = asyncio.run(main())
+    assert np.allclose(mean, np.mean(random_3d, axis=0))
+    assert np.allclose(quantile, np.quantile(random_3d, 0.2, axis=(1, 2)))
+    assert np.allclose(cumsum, np.cumsum(random_3d, axis=1))
+
+
+def test_async_doesnt_block():
+    # The event loop keeps running other tasks while a reduction is awaited, so
+    # the ticker gets to run before a slow reduction finishes
+    data = np.random.default_rng(0).random((1000, 10000))
+    ticks = []
+    done = []
+
+    async def reduce():
+        await speedystats.amedian(data, axis=1)
+        done.append(len(ticks))
+
+    async def ticker():
+        while not done:
+            ticks.append(None)
+            await asyncio.sleep(0.001)
+
+    async def main():
+        await asyncio.gather(reduce(), ticker())
+
+    asyncio.run(main())
+    assert done[0] >= 1
+
+
+def test_set_async_workers():
+    speedystats.set_async_workers(2)
+    try:
+        assert speedystats.asynchronous.get_async_executor()._max_workers == 2
+    finally:
+        speedystats.set_async_workers(1)
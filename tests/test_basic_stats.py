@@ -10,6 +10,8 @@ test_methods = [
     "var",
     "ptp",
     "average",
+    "min",
+    "max",
 ]
 
 
@@ -56,3 +58,24 @@ def test_3d(random_3d):
         assert np.allclose(
             speedystat_method(random_3d, axis=(1, 2)), np_method(random_3d, axis=(1, 2))
         )
+
+
+def test_4d(random_4d):
+    # Reductions keeping 3 axes go through kernels with a flattened prange
+    for method in test_methods:
+        np_method = getattr(np, method)
+        speedystat_method = getattr(speedystats, method)
+        for axis in [0, 1, 2, 3, (1, 2), (0, 3)]:
+            assert np.allclose(
+                speedystat_method(random_4d, axis=axis), np_method(random_4d, axis=axis)
+            )
+
+
+def test_5d(random_5d):
+    for method in test_methods:
+        np_method = getattr(np, method)
+        speedystat_method = getattr(speedystats, method)
+        for axis in [0, 2, 4, (1, 3), (0, 4)]:
+            assert np.allclose(
+                speedystat_method(random_5d, axis=axis), np_method(random_5d, axis=axis)
+            )
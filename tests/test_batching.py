@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+import speedystats
+
+
+def test_batch(random_3d_with_nan):
+    arrays = list(random_3d_with_nan)
+    for method in ["mean", "nanmean", "nanmedian", "std"]:
+        speedystat_method = getattr(speedystats, method)
+        for axis in [None, 0, 1, (0, 1)]:
+            expected = np.stack([speedystat_method(x, axis=axis) for x in arrays])
+            assert np.allclose(
+                speedystats.batch(method, arrays, axis=axis), expected, equal_nan=True
+            )
+    # Negative axes count from the end of each array
+    assert np.allclose(
+        speedystats.batch("mean", arrays, axis=-1),
+        speedystats.batch("mean", arrays, axis=1),
+        equal_nan=True,
+    )
+
+
+def test_batch_arguments(random_3d):
+    # Stacked arrays, scalar parameters and keepdims are passed through
+    result = speedystats.batch("quantile", random_3d, axis=1, q=0.3, keepdims=True)
+    expected = np.stack([np.quantile(x, 0.3, axis=1, keepdims=True) for x in random_3d])
+    assert np.allclose(result, expected)
+
+
+def test_batch_errors(random_3d):
+    with pytest.raises(ValueError, match="nanmedian"):
+        speedystats.batch("cumsum", random_3d, axis=0)
+    with pytest.raises(ValueError):
+        speedystats.batch("sum_kahan", random_3d, axis=0)
+    with pytest.raises(ValueError):
+        speedystats.batch("mean", random_3d, axis=2)
@@ -0,0 +1,64 @@
+import json
+import numpy as np
+import pytest
+import speedystats
+from speedystats import calibration
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("SPEEDYSTATS_CACHE_DIR", str(tmp_path))
+    yield tmp_path
+    speedystats.clear_calibration()
+
+
+def test_calibrate(cache_dir, random_2d):
+    path = speedystats.calibrate(["mean", "nanquantile"], max_elements=4**4)
+    assert path == calibration.get_calibration_path()
+    assert path.parent == cache_dir
+    with open(path) as f:
+        payload = json.load(f)
+    assert set(payload["methods"]) == {"mean", "nanquantile"}
+    grid = np.array(payload["methods"]["mean"])
+    assert grid.shape == (2, calibration.GRID_SIZE, calibration.GRID_SIZE)
+
+    # Whichever way a call is routed, the results are the same
+    assert calibration.load_calibration()
+    assert np.allclose(speedystats.mean(random_2d, axis=0), np.mean(random_2d, axis=0))
+    with pytest.raises(ValueError):
+        speedystats.calibrate(["trim_mean"])
+
+
+def test_calibrated_routing(cache_dir, random_2d, monkeypatch):
+    # A table that prefers numpy for reductions of the last axis only
+    grids = [np.zeros((10, 10), int).tolist(), np.ones((10, 10), int).tolist()]
+    payload = {
+        "format": calibration.CALIBRATION_FORMAT,
+        "speedystats": speedystats.__version__,
+        "methods": {"mean": grids},
+    }
+    with open(calibration.get_calibration_path(), "w") as f:
+        json.dump(payload, f)
+    assert calibration.load_calibration()
+    assert calibration.use_numpy("mean", (10, 10), (0,))
+    assert not calibration.use_numpy("mean", (10, 10), (1,))
+    assert not calibration.use_numpy("median", (10, 10), (0,))
+
+    calls = []
+    fallback = speedystats.speedystats._fallback_speedystat
+    monkeypatch.setattr(
+        speedystats.speedystats,
+        "_fallback_speedystat",
+        lambda *args: calls.append(args) or fallback(*args),
+    )
+    assert np.allclose(speedystats.mean(random_2d, axis=1), np.mean(random_2d, axis=1))
+    assert len(calls) == 1
+    speedystats.mean(random_2d, axis=0)
+    assert len(calls) == 1
+
+    # Calibrations from another version are ignored
+    payload["speedystats"] = "unknown"
+    with open(calibration.get_calibration_path(), "w") as f:
+        json.dump(payload, f)
+    assert not calibration.load_calibration()
+    assert not calibration.use_numpy("mean", (10, 10), (0,))
@@ -0,0 +1,124 @@
+import platform
+import numba as nb
+import numpy as np
+import pytest
+import speedystats
+from speedystats.numba import contiguous
+
+reference_methods = {
+    "sum": np.sum,
+    "mean": np.mean,
+    "var": np.var,
+    "std": np.std,
+    "ptp": np.ptp,
+    "min": np.min,
+    "max": np.max,
+}
+
+
+def test_rows_and_columns(random_3d):
+    for method, reference in reference_methods.items():
+        speedystat_method = getattr(speedystats, method)
+        # Keeping leading (rows), trailing (columns) or middle axes
+        for axis in [2, (1, 2), 0, (0, 1), (0, 2)]:
+            keep_axes = speedystats.routing.get_keep_axes(axis, 3)
+            assert contiguous.contiguous_shape(random_3d, keep_axes) is not None
+            assert np.allclose(
+                speedystat_method(random_3d, axis=axis),
+                reference(random_3d, axis=axis),
+            )
+
+
+def test_middle_axes():
+    np.random.seed(42)
+    # Long inner runs are reduced as rows, short ones as groups of columns
+    for shape in [(30, 20, 100), (300, 20, 3), (4, 5, 6, 7)]:
+        data = np.random.randn(*shape)
+        axis = (0, data.ndim - 1)
+        for method, reference in reference_methods.items():
+            speedystat_method = getattr(speedystats, method)
+            assert np.allclose(
+                speedystat_method(data, axis=axis), reference(data, axis=axis)
+            )
+
+
+def test_nan(random_3d_with_nan):
+    data = random_3d_with_nan.copy()
+    data[:, 3, :] = np.nan
+    for method in ["nansum", "nanmean", "nanvar", "nanstd"]:
+        speedystat_method = getattr(speedystats, method)
+        reference = getattr(np, method)
+        for axis in [(1, 2), 0, (0, 2)]:
+            with np.errstate(all="ignore"):
+                expected = reference(data, axis=axis)
+            assert np.allclose(
+                speedystat_method(data, axis=axis), expected, equal_nan=True
+            )
+
+
+def test_extrema_propagate_nan():
+    np.random.seed(42)
+    data = np.random.randn(30, 8, 100)
+    data[np.random.rand(*data.shape) < 0.002] = np.nan
+    # Rows and columns, C-ordered, F-ordered and sliced
+    for layout in [data, np.asfortranarray(data), data[::2, :, 1:]]:
+        for method in ["min", "max", "ptp"]:
+            speedystat_method = getattr(speedystats, method)
+            reference = getattr(np, method)
+            for axis in [None, 0, 1, 2, (0, 1), (0, 2), (1, 2)]:
+                result = speedystat_method(layout, axis=axis)
+                expected = reference(layout, axis=axis)
+                assert np.allclose(result, expected, equal_nan=True)
+
+
+def test_extrema_keep_dtype():
+    # Integers beyond 2**53 would be rounded by a float64 result
+    data = np.full((1000, 8), 2**60 + 1, dtype=np.int64)
+    data[::7, ::3] = 2**60 + 3
+    for layout in [data, np.asfortranarray(data), data.reshape(10, 100, 8)]:
+        for method in ["min", "max", "ptp"]:
+            for axis in [None, 0, -1]:
+                result = getattr(speedystats, method)(layout, axis=axis)
+                expected = getattr(np, method)(layout, axis=axis)
+                assert np.asarray(result).dtype == expected.dtype
+                assert np.array_equal(result, expected)
+    assert speedystats.min(data.astype(np.float32), axis=0).dtype == np.float32
+
+
+def test_odd_sizes():
+    np.random.seed(42)
+    data = np.random.randn(7, 1031, 3).astype(np.float32)
+    for method, reference in reference_methods.items():
+        speedystat_method = getattr(speedystats, method)
+        for axis in [(1, 2), 0]:
+            assert np.allclose(
+                speedystat_method(data, axis=axis),
+                reference(data.astype(np.float64), axis=axis),
+                rtol=1e-4,
+                atol=1e-4,
+            )
+
+
+def test_chunked_columns():
+    np.random.seed(42)
+    data = np.random.randn(5000, 300)
+    num_chunks, num_blocks = contiguous.column_chunks(*data.shape)
+    assert num_chunks > 1 and num_blocks == 2
+    for method, reference in reference_methods.items():
+        speedystat_method = getattr(speedystats, method)
+        assert np.allclose(
+            speedystat_method(data, axis=0, keepdims=True),
+            reference(data, axis=0, keepdims=True),
+        )
+
+
+@pytest.mark.skipif(
+    platform.machine().lower() not in ("x86_64", "amd64"),
+    reason="checks for x86 packed instructions",
+)
+def test_row_sum_vectorizes():
+    # Cached kernels can't be inspected, so compile an uncached copy
+    row_sum = nb.njit(fastmath=True)(contiguous._row_sum.py_func)
+    row_sum(np.random.randn(1000), 0.0, False)
+    for signature, asm in row_sum.inspect_asm().items():
+        assert any(op in asm for op in ("addpd", "vaddpd")), signature
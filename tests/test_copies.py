@@ -0,0 +1,75 @@
+import warnings
+import numpy as np
+import pytest
+import speedystats
+
+
+def test_copy_warnings(random_3d):
+    fortran = np.asfortranarray(random_3d)
+    with speedystats.copy_policy("warn"):
+        # Flattening the reduced axes of a Fortran-ordered array copies it
+        with pytest.warns(speedystats.CopyWarning, match=str(fortran.nbytes)) as w:
+            speedystats.median(fortran, axis=(1, 2))
+        assert w[0].filename == __file__
+        with pytest.warns(speedystats.CopyWarning) as w:
+            speedystats.trim_mean(fortran)
+        assert w[0].filename == __file__
+        with pytest.warns(speedystats.CopyWarning):
+            speedystats.plan("median", fortran.shape, axis=(1, 2))(fortran)
+
+        # Views that can be reshaped in place don't warn
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            speedystats.median(random_3d, axis=(1, 2))
+            speedystats.median(fortran, axis=(0, 1))
+            speedystats.median(random_3d[::2], axis=(1, 2))
+            speedystats.trim_mean(random_3d)
+            speedystats.median(random_3d[:, :, ::2], axis=(1, 2))
+    assert speedystats.copies.POLICY == "ignore"
+
+
+def test_copy_raise(random_3d):
+    fortran = np.asfortranarray(random_3d)
+    with speedystats.copy_policy("raise"):
+        with pytest.raises(ValueError):
+            speedystats.median(fortran, axis=(1, 2))
+        with pytest.raises(ValueError):
+            speedystats.median(random_3d[:, ::2], axis=(1, 2))
+    with pytest.raises(ValueError):
+        speedystats.set_copy_policy("error")
+
+
+def test_copy_where(random_3d):
+    fortran = np.asfortranarray(random_3d)
+    mask = random_3d > 0
+    with speedystats.copy_policy("warn"):
+        # The data and the mask are each copied to flatten the reduced axes
+        with pytest.warns(speedystats.CopyWarning) as w:
+            speedystats.mean(fortran, axis=(1, 2), where=mask)
+        assert len(w) == 1 and w[0].filename == __file__
+        with pytest.warns(speedystats.CopyWarning, match="where= mask") as w:
+            speedystats.mean(random_3d, axis=(1, 2), where=np.asfortranarray(mask))
+        assert len(w) == 1 and w[0].filename == __file__
+        with pytest.warns(speedystats.CopyWarning):
+            speedystats.mean(np.ma.masked_array(fortran, ~mask), axis=(1, 2))
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            speedystats.mean(random_3d, axis=(1, 2), where=mask)
+    with speedystats.copy_policy("raise"):
+        with pytest.raises(ValueError):
+            speedystats.mean(fortran, axis=(1, 2), where=mask)
+
+
+def test_copy_stats(random_3d):
+    speedystats.reset_stats()
+    speedystats.enable_stats()
+    try:
+        speedystats.median(np.asfortranarray(random_3d), axis=(1, 2))
+        speedystats.median(random_3d, axis=(1, 2))
+    finally:
+        speedystats.enable_stats(False)
+    median = speedystats.stats()[("median", (0,), "float64")]
+    assert median.copies == 1
+    assert median.copied_bytes == random_3d.nbytes
+    speedystats.reset_stats()
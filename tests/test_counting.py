@@ -0,0 +1,65 @@
+import numpy as np
+import speedystats
+
+test_axes = [0, 2, (0, 1), (1, 2)]
+
+
+def random_integers(dtype, shape):
+    info = np.iinfo(dtype)
+    rng = np.random.default_rng(0)
+    return rng.integers(info.min, info.max, shape, dtype=dtype, endpoint=True)
+
+
+def test_median():
+    for dtype in [np.uint8, np.uint16, np.int16]:
+        data = random_integers(dtype, (200, 10, 10))
+        for axis in test_axes:
+            assert np.array_equal(
+                speedystats.median(data, axis=axis), np.median(data, axis=axis)
+            )
+            assert np.array_equal(
+                speedystats.nanmedian(data, axis=axis), np.median(data, axis=axis)
+            )
+
+
+def test_percentile():
+    data = random_integers(np.uint16, (200, 10, 10))
+    for axis in test_axes:
+        for q in [0, 12.5, 50, 99, 100]:
+            assert np.allclose(
+                speedystats.percentile(data, axis=axis, q=q),
+                np.percentile(data, q, axis=axis),
+            )
+            assert np.allclose(
+                speedystats.nanquantile(data, axis=axis, q=q / 100),
+                np.quantile(data, q / 100, axis=axis),
+            )
+
+
+def test_ties():
+    # The values around the quantile are often in the same or a later bin. The
+    # reference is computed in float64, since numpy's interpolation of signed
+    # integers overflows when the values are far apart
+    rng = np.random.default_rng(0)
+    for dtype in [np.uint8, np.int16]:
+        values = np.array([np.iinfo(dtype).min, 0, 1, 300 % np.iinfo(dtype).max])
+        data = rng.choice(values.astype(dtype), (300, 20))
+        for q in [0, 25, 33.3, 50, 77, 100]:
+            assert np.allclose(
+                speedystats.percentile(data, axis=0, q=q),
+                np.percentile(data.astype(np.float64), q, axis=0),
+            )
+
+
+def test_routing():
+    speedystats.enable_stats()
+    speedystats.reset_stats()
+    try:
+        speedystats.median(random_integers(np.uint16, (200, 10)), axis=0)
+        speedystats.median(random_integers(np.uint16, (20, 10)), axis=0)
+        paths = {k[1:]: v.paths for k, v in speedystats.stats().items()}
+    finally:
+        speedystats.enable_stats(False)
+        speedystats.reset_stats()
+    # Short slices are faster to select than to count
+    assert paths == {((1,), "uint16"): {"counting": 1, "numba": 1}}
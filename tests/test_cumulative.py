@@ -0,0 +1,77 @@
+import numpy as np
+import speedystats
+from speedystats.numba import scan
+
+
+reference_methods = {
+    "cumsum": np.cumsum,
+    "nancumsum": np.nancumsum,
+    "cumprod": np.cumprod,
+    "nancumprod": np.nancumprod,
+    "cummax": np.maximum.accumulate,
+    "cummin": np.minimum.accumulate,
+}
+
+
+def reference(method, data, axis):
+    if axis is None:
+        return reference_methods[method](np.ravel(data), axis=0)
+    return reference_methods[method](data, axis=axis)
+
+
+def test_3d(random_3d):
+    for method in reference_methods:
+        speedystat_method = getattr(speedystats, method)
+        for axis in [None, 0, 1, 2, -1]:
+            assert np.allclose(
+                speedystat_method(random_3d, axis=axis),
+                reference(method, random_3d, axis),
+            )
+
+
+def test_3d_nan(random_3d_with_nan):
+    for method in reference_methods:
+        speedystat_method = getattr(speedystats, method)
+        for axis in [0, 2]:
+            assert np.allclose(
+                speedystat_method(random_3d_with_nan, axis=axis),
+                reference(method, random_3d_with_nan, axis),
+                equal_nan=True,
+            )
+
+
+def test_blocked_1d():
+    np.random.seed(42)
+    data = np.random.randn(scan.MIN_BLOCKED_SCAN * 3 + 17)
+    data[1000] = np.nan
+    for method in reference_methods:
+        speedystat_method = getattr(speedystats, method)
+        assert np.allclose(
+            speedystat_method(data),
+            reference(method, data, None),
+            equal_nan=True,
+        )
+
+
+def test_integer_dtype():
+    np.random.seed(42)
+    data = np.random.randint(0, 100, size=(20, 30)).astype(np.uint8)
+    for method in ["cumsum", "cummax", "cummin"]:
+        speedystat_method = getattr(speedystats, method)
+        expected = reference(method, data, 0)
+        result = speedystat_method(data, axis=0)
+        assert result.dtype == expected.dtype
+        assert np.array_equal(result, expected)
+
+
+def test_out(random_3d):
+    out = np.empty_like(random_3d)
+    result = speedystats.cumsum(random_3d, axis=1, out=out)
+    assert result is out
+    assert np.allclose(out, np.cumsum(random_3d, axis=1))
+
+    # Non-contiguous outputs are filled too
+    out = np.empty((10, 10, 10)).transpose(2, 1, 0)
+    result = speedystats.cummax(random_3d, axis=0, out=out)
+    assert result is out
+    assert np.allclose(out, np.maximum.accumulate(random_3d, axis=0))
@@ -0,0 +1,56 @@
+import numba as nb
+import numpy as np
+import pytest
+import speedystats
+from speedystats.numba import kernels
+
+
+test_methods = ["sum", "mean", "std", "var"]
+
+
+@pytest.fixture
+def long_1d():
+    np.random.seed(42)
+    return np.random.randn(kernels.PAIRWISE_CHUNK * 5 + 1234) * 1e3 + 5
+
+
+def test_matches_numpy(random_3d):
+    for method in test_methods:
+        np_method = getattr(np, method)
+        speedystat_method = getattr(speedystats, method)
+        for axis in [None, 0, (1, 2)]:
+            assert np.allclose(
+                speedystat_method(random_3d, axis=axis, deterministic=True),
+                np_method(random_3d, axis=axis),
+            )
+
+
+def test_chunked_matches_serial(long_1d):
+    # The parallel full reduction reproduces the serial pairwise tree exactly
+    chunked = speedystats.sum(long_1d, deterministic=True)
+    serial = kernels.sum_pairwise(long_1d)
+    assert chunked == serial
+    assert speedystats.sum(long_1d, axis=0, deterministic=True) == serial
+
+
+def test_thread_count_independent(long_1d):
+    data = np.reshape(long_1d[: 600 * 1000], (600, 1000))
+    original_threads = nb.get_num_threads()
+    try:
+        results = []
+        for num_threads in range(1, nb.config.NUMBA_NUM_THREADS + 1):
+            nb.set_num_threads(num_threads)
+            results.append(
+                [
+                    getattr(speedystats, method)(long_1d, deterministic=True)
+                    for method in test_methods
+                ]
+                + [speedystats.mean(data, axis=0, deterministic=True)]
+                + [speedystats.cumsum(long_1d)]
+            )
+    finally:
+        nb.set_num_threads(original_threads)
+
+    for result in results[1:]:
+        for first, other in zip(results[0], result):
+            assert np.array_equal(first, other)
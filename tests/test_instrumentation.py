@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+import speedystats
+
+
+@pytest.fixture
+def instrumented():
+    speedystats.reset_stats()
+    speedystats.enable_stats()
+    yield
+    speedystats.enable_stats(False)
+    speedystats.reset_stats()
+
+
+def test_stats(instrumented, random_3d):
+    speedystats.mean(random_3d, axis=0)
+    speedystats.mean(random_3d, axis=0)
+    speedystats.median(random_3d, axis=(1, 2))
+    speedystats.median(np.asfortranarray(random_3d), axis=(1, 2))
+    speedystats.mean(random_3d)
+    speedystats.trim_mean(random_3d)
+    speedystats.sum(random_3d, axis=1, accuracy="kahan")
+
+    stats = speedystats.stats()
+    mean = stats[("mean", (1, 2), "float64")]
+    assert mean.calls == 2
+    assert mean.nbytes == 2 * random_3d.nbytes
+    assert mean.paths == {"contiguous": 2}
+    assert mean.total_time > 0 and mean.mean_time == mean.total_time / 2
+
+    # Reshaping the Fortran-ordered array to flatten the trailing axes copies it
+    median = stats[("median", (0,), "float64")]
+    assert median.paths == {"numba": 2}
+    assert median.copies == 1
+
+    assert stats[("mean", (), "float64")].fallbacks == 1
+    assert stats[("trim_mean", (), "float64")].paths == {"flattened": 1}
+    assert ("sum_kahan", (0, 2), "float64") in stats
+
+    speedystats.reset_stats()
+    assert speedystats.stats() == {}
+    speedystats.enable_stats(False)
+    speedystats.mean(random_3d, axis=0)
+    assert speedystats.stats() == {}
+
+
+def test_hooks(random_2d):
+    records = []
+    speedystats.add_hook(records.append)
+    try:
+        speedystats.nanstd(random_2d, axis=1)
+        speedystats.mean(random_2d, axis=0, where=random_2d > 0)
+    finally:
+        speedystats.remove_hook(records.append)
+    speedystats.mean(random_2d, axis=0)
+
+    assert [r.path for r in records] == ["contiguous", "masked"]
+    assert records[0].method == "nanstd"
+    assert records[0].keep_axes == (0,)
+    assert records[0].shape == random_2d.shape
+    assert records[0].time > 0
+    # Hooks don't fill the registry unless it's enabled
+    assert speedystats.stats() == {}
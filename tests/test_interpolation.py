@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+import speedystats
+from speedystats.numba.kernels import INTERPOLATION_METHODS
+
+test_axes = [None, 0, 2, (0, 1), (1, 2)]
+
+
+def test_methods_match_numpy():
+    rng = np.random.default_rng(0)
+    for method in INTERPOLATION_METHODS:
+        if method == "linear":
+            continue
+        for n in [1, 2, 5, 10, 33]:
+            # Ties exercise the discrete methods' boundaries
+            for data in [rng.standard_normal((4, n)), rng.integers(0, 5, (4, n))]:
+                for q in [0.0, 0.01, 0.25, 0.5, 0.6, 0.99, 1.0]:
+                    assert np.array_equal(
+                        speedystats.quantile(data, axis=1, q=q, method=method),
+                        np.quantile(data, q, axis=1, method=method),
+                    )
+
+
+def test_reduced_axes(random_3d):
+    for axis in test_axes:
+        for method in ["lower", "nearest", "hazen"]:
+            assert np.array_equal(
+                speedystats.percentile(random_3d, axis=axis, q=30, method=method),
+                np.percentile(random_3d, 30, axis=axis, method=method),
+            )
+    assert speedystats.quantile(
+        random_3d, axis=1, q=0.3, method="higher", keepdims=True
+    ).shape == (10, 1, 10)
+
+
+def test_nan_variants(random_3d_with_nan):
+    for axis in test_axes:
+        for method in ["midpoint", "weibull"]:
+            assert np.array_equal(
+                speedystats.nanquantile(
+                    random_3d_with_nan, axis=axis, q=0.7, method=method
+                ),
+                np.nanquantile(random_3d_with_nan, 0.7, axis=axis, method=method),
+            )
+            assert np.array_equal(
+                speedystats.percentile(
+                    random_3d_with_nan, axis=axis, q=70, method=method
+                ),
+                np.percentile(random_3d_with_nan, 70, axis=axis, method=method),
+                equal_nan=True,
+            )
+
+
+def test_where(random_3d, random_3d_with_nan):
+    np.random.seed(1)
+    mask = np.random.rand(10, 10, 10) > 0.3
+    for method in ["lower", "nearest", "hazen"]:
+        expected = [
+            [
+                np.percentile(random_3d[i, mask[i, :, j], j], 30, method=method)
+                for j in range(10)
+            ]
+            for i in range(10)
+        ]
+        assert np.array_equal(
+            speedystats.percentile(random_3d, axis=1, q=30, method=method, where=mask),
+            expected,
+        )
+        # Masked arrays, skipping NaNs
+        data = np.ma.masked_array(random_3d_with_nan, mask=~mask)
+        assert np.array_equal(
+            speedystats.nanquantile(data, axis=1, q=0.3, method=method),
+            [
+                [
+                    np.nanquantile(data[i, :, j].compressed(), 0.3, method=method)
+                    for j in range(10)
+                ]
+                for i in range(10)
+            ],
+        )
+
+
+def test_plan(random_3d):
+    func = speedystats.plan(
+        "percentile", random_3d.shape, axis=1, q=90, interpolation="nearest"
+    )
+    assert np.array_equal(
+        func(random_3d), np.percentile(random_3d, 90, axis=1, method="nearest")
+    )
+
+
+def test_invalid(random_3d):
+    with pytest.raises(ValueError, match="method must be one of"):
+        speedystats.quantile(random_3d, axis=1, q=0.5, method="cubic")
+    with pytest.raises(ValueError, match="range"):
+        speedystats.percentile(random_3d, axis=1, q=101, method="lower")
+    with pytest.raises(ValueError, match="only supports a scalar q"):
+        speedystats.percentile(random_3d, axis=1, q=[10, 90], method="lower")
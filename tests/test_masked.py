@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+import speedystats
+
+moment_methods = ["sum", "mean", "var", "std", "nansum", "nanmean", "nanvar", "nanstd"]
+
+
+@pytest.fixture
+def mask_3d():
+    np.random.seed(1)
+    return np.random.rand(10, 10, 10) > 0.3
+
+
+def test_where(random_3d_with_nan, mask_3d):
+    for method in moment_methods:
+        speedystat_method = getattr(speedystats, method)
+        np_method = getattr(np, method)
+        for axis in [None, 0, 1, (0, 2), (1, 2)]:
+            assert np.allclose(
+                speedystat_method(random_3d_with_nan, axis=axis, where=mask_3d),
+                np_method(random_3d_with_nan, axis=axis, where=mask_3d),
+                equal_nan=True,
+            )
+
+
+def test_where_broadcast(random_3d, mask_3d):
+    # A mask over the last two axes applies to every slice along the first
+    mask = mask_3d[0]
+    for method in ["min", "max"]:
+        initial = np.inf if method == "min" else -np.inf
+        result = getattr(speedystats, method)(random_3d, axis=0, where=mask)
+        expected = getattr(np, method)(random_3d, axis=0, where=mask, initial=initial)
+        assert np.allclose(result[mask], expected[mask])
+        # Empty reductions give NaN rather than the initial value
+        assert np.all(np.isnan(result[~mask]))
+    assert np.allclose(
+        speedystats.mean(random_3d, axis=2, keepdims=True, where=mask),
+        np.mean(random_3d, axis=2, keepdims=True, where=mask),
+    )
+
+
+def test_masked_array(random_3d, mask_3d):
+    data = np.ma.masked_array(random_3d, mask=~mask_3d)
+    for method in ["mean", "median", "var"]:
+        expected = getattr(np.ma, method)(data, axis=1)
+        assert np.allclose(getattr(speedystats, method)(data, axis=1), expected)
+    assert np.allclose(
+        speedystats.quantile(data, axis=0, q=0.25),
+        [
+            [np.quantile(data[:, i, j].compressed(), 0.25) for j in range(10)]
+            for i in range(10)
+        ],
+    )
+
+
+def test_iqr(random_3d_with_nan, mask_3d):
+    def reference(data, mask):
+        values = data[mask]
+        q1, q3 = np.percentile(values[~np.isnan(values)], [25, 75])
+        return q3 - q1
+
+    expected = [
+        [reference(random_3d_with_nan[:, i, j], mask_3d[:, i, j]) for j in range(10)]
+        for i in range(10)
+    ]
+    result = speedystats.naniqr(random_3d_with_nan, axis=0, where=mask_3d)
+    assert np.allclose(result, expected)
+    data = np.ma.masked_array(random_3d_with_nan, mask=~mask_3d)
+    assert np.allclose(speedystats.naniqr(data, axis=0), expected)
+    # Without skipping NaNs, the slices with an unmasked NaN give NaN
+    has_nan = np.any(np.isnan(random_3d_with_nan) & mask_3d, axis=0)
+    result = speedystats.iqr(random_3d_with_nan, axis=0, where=mask_3d)
+    assert np.array_equal(np.isnan(result), has_nan)
+    assert np.allclose(result[~has_nan], np.asarray(expected)[~has_nan])
+
+
+def test_empty_mask(random_2d):
+    mask = np.zeros(random_2d.shape, dtype=bool)
+    assert np.all(speedystats.sum(random_2d, axis=0, where=mask) == 0)
+    assert np.all(np.isnan(speedystats.median(random_2d, axis=0, where=mask)))
@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+import speedystats
+
+test_axes = [None, 0, 2, (0, 1), (1, 2)]
+
+
+def test_omit(random_3d_with_nan):
+    for method in ["sum", "mean", "std", "median", "max", "trim_mean"]:
+        func = getattr(speedystats, method)
+        nan_func = getattr(speedystats, f"nan{method}")
+        for axis in test_axes:
+            assert np.allclose(
+                func(random_3d_with_nan, axis=axis, nan_policy="omit"),
+                nan_func(random_3d_with_nan, axis=axis),
+            )
+    assert np.allclose(
+        speedystats.percentile(random_3d_with_nan, axis=1, q=30, nan_policy="omit"),
+        np.nanpercentile(random_3d_with_nan, 30, axis=1),
+    )
+
+
+def test_propagate(random_3d_with_nan):
+    # Slices containing NaNs give NaN, for the selection methods too
+    data = np.asfortranarray(random_3d_with_nan)
+    for layout in [random_3d_with_nan, data]:
+        for axis in test_axes:
+            for method in ["median", "min", "max", "sum"]:
+                assert np.allclose(
+                    getattr(speedystats, method)(
+                        layout, axis=axis, nan_policy="propagate"
+                    ),
+                    getattr(np, method)(layout, axis=axis),
+                    equal_nan=True,
+                )
+            assert np.allclose(
+                speedystats.percentile(layout, axis=axis, q=30, nan_policy="propagate"),
+                np.percentile(layout, 30, axis=axis),
+                equal_nan=True,
+            )
+            assert np.allclose(
+                speedystats.quantile(layout, axis=axis, q=0.3, nan_policy="propagate"),
+                np.quantile(layout, 0.3, axis=axis),
+                equal_nan=True,
+            )
+
+
+def test_omit_without_nans(random_3d):
+    for axis in test_axes:
+        assert np.allclose(
+            speedystats.mean(random_3d, axis=axis, nan_policy="omit"),
+            np.mean(random_3d, axis=axis),
+        )
+
+
+def test_raise(random_3d, random_3d_with_nan):
+    with pytest.raises(ValueError, match="contains NaNs"):
+        speedystats.mean(random_3d_with_nan, axis=1, nan_policy="raise")
+    with pytest.raises(ValueError, match="contains NaNs"):
+        speedystats.median(random_3d_with_nan[:, ::2], nan_policy="raise")
+    assert np.allclose(
+        speedystats.mean(random_3d, axis=1, nan_policy="raise"),
+        np.mean(random_3d, axis=1),
+    )
+    # Masked NaNs aren't used by the reduction
+    where = ~np.isnan(random_3d_with_nan)
+    assert np.allclose(
+        speedystats.sum(random_3d_with_nan, axis=1, where=where, nan_policy="raise"),
+        np.nansum(random_3d_with_nan, axis=1),
+    )
+
+
+def test_invalid(random_3d):
+    with pytest.raises(ValueError, match="nan_policy must be one of"):
+        speedystats.mean(random_3d, axis=1, nan_policy="ignore")
@@ -8,6 +8,8 @@ test_methods = [
     "nanmedian",
     "nanstd",
     "nanvar",
+    "nanmin",
+    "nanmax",
 ]
 
 
@@ -0,0 +1,58 @@
+import numba as nb
+import numpy as np
+import pytest
+import speedystats
+from speedystats.parallel import kernel_threads, MIN_ELEMENTS_PER_THREAD
+
+
+def test_set_num_threads():
+    original_threads = speedystats.get_num_threads()
+    try:
+        speedystats.set_num_threads(1)
+        assert speedystats.get_num_threads() == 1
+        assert nb.get_num_threads() == 1
+    finally:
+        speedystats.set_num_threads(original_threads)
+
+    with pytest.raises(ValueError):
+        speedystats.set_num_threads(0)
+
+
+def test_threads_context():
+    original_threads = speedystats.get_num_threads()
+    with speedystats.threads(1):
+        assert speedystats.get_num_threads() == 1
+    assert speedystats.get_num_threads() == original_threads
+
+    # The previous setting is restored even if the block raises
+    with pytest.raises(RuntimeError):
+        with speedystats.threads(1):
+            raise RuntimeError
+    assert speedystats.get_num_threads() == original_threads
+
+
+def test_kernel_threads():
+    # Small calls and calls with a single parallel task run serially
+    with kernel_threads(1000, MIN_ELEMENTS_PER_THREAD - 1):
+        assert nb.get_num_threads() == 1
+    with kernel_threads(1, 10 * MIN_ELEMENTS_PER_THREAD):
+        assert nb.get_num_threads() == 1
+    with kernel_threads(1000, 1000 * MIN_ELEMENTS_PER_THREAD, num_threads=1):
+        assert nb.get_num_threads() == 1
+    with kernel_threads(1000, 1000 * MIN_ELEMENTS_PER_THREAD):
+        assert nb.get_num_threads() == nb.config.NUMBA_NUM_THREADS
+
+
+def test_num_threads_argument(random_3d):
+    original_threads = speedystats.get_num_threads()
+    for method in ["mean", "median", "trim_mean"]:
+        np_method = getattr(np, method, None)
+        speedystat_method = getattr(speedystats, method)
+        result = speedystat_method(random_3d, axis=1, num_threads=1)
+        if np_method is not None:
+            assert np.allclose(result, np_method(random_3d, axis=1))
+        assert speedystats.get_num_threads() == original_threads
+    assert np.allclose(
+        speedystats.cumsum(random_3d, axis=0, num_threads=1),
+        np.cumsum(random_3d, axis=0),
+    )
@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+import speedystats
+
+
+def test_plan(random_3d_with_nan):
+    # Contiguous, strided and fallback inputs all match the public functions
+    transposed = np.transpose(random_3d_with_nan, (2, 0, 1))
+    for data in [random_3d_with_nan, transposed]:
+        for method in ["mean", "nansum", "nanmedian", "std"]:
+            speedystat_method = getattr(speedystats, method)
+            for axis in [None, 0, 2, (0, 2), (1, 2), -1]:
+                for keepdims in [False, True]:
+                    func = speedystats.plan(
+                        method, data.shape, data.dtype, axis=axis, keepdims=keepdims
+                    )
+                    expected = speedystat_method(data, axis=axis, keepdims=keepdims)
+                    result = func(data)
+                    assert np.shape(result) == np.shape(expected)
+                    assert np.allclose(result, expected, equal_nan=True)
+
+
+def test_plan_arguments(random_3d):
+    func = speedystats.plan("quantile", random_3d.shape, axis=1, q=0.3)
+    assert np.allclose(func(random_3d), np.quantile(random_3d, 0.3, axis=1))
+    func = speedystats.plan("sum", random_3d.shape, axis=0, deterministic=True)
+    assert np.array_equal(
+        func(random_3d), speedystats.sum(random_3d, axis=0, deterministic=True)
+    )
+
+
+def test_plan_errors(random_3d):
+    with pytest.raises(ValueError):
+        speedystats.plan("cumsum", random_3d.shape, axis=0)
+    with pytest.raises(ValueError):
+        speedystats.plan("mean", random_3d.shape, axis=3)
+    func = speedystats.plan("mean", random_3d.shape, axis=0)
+    with pytest.raises(ValueError):
+        func(random_3d[1:])
+    with pytest.raises(ValueError):
+        func(random_3d.astype(np.float32))
+    with pytest.raises(ValueError):
+        func(np.ma.masked_array(random_3d))
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+import speedystats
+
+
+@pytest.fixture(scope="module", autouse=True)
+def shutdown():
+    yield
+    speedystats.shutdown_processes()
+
+
+def test_processes(random_3d_with_nan):
+    for method in ["mean", "nanmedian", "nanvar"]:
+        speedystat_method = getattr(speedystats, method)
+        for axis in [0, (1, 2), 2]:
+            assert np.allclose(
+                speedystat_method(
+                    random_3d_with_nan, axis=axis, backend="processes", num_threads=2
+                ),
+                speedystat_method(random_3d_with_nan, axis=axis),
+                equal_nan=True,
+            )
+    # Parameters are passed through to the workers
+    assert np.allclose(
+        speedystats.quantile(
+            random_3d_with_nan, axis=1, q=0.3, backend="processes", num_threads=2
+        ),
+        speedystats.quantile(random_3d_with_nan, axis=1, q=0.3),
+        equal_nan=True,
+    )
+
+
+def test_shared_array(random_3d):
+    data = speedystats.SharedArray(random_3d.shape)
+    data[:] = random_3d
+    assert isinstance(data + 1, np.ndarray) and not isinstance(
+        data + 1, speedystats.SharedArray
+    )
+    out = speedystats.sum(
+        data, axis=(0, 2), keepdims=True, backend="processes", num_threads=2
+    )
+    assert np.allclose(out, np.sum(random_3d, axis=(0, 2), keepdims=True))
+
+
+def test_processes_errors(random_2d):
+    with pytest.raises(ValueError):
+        speedystats.mean(random_2d, axis=0, backend="gpu")
+    with pytest.raises(ValueError):
+        speedystats.mean(random_2d, axis=0, where=random_2d > 0, backend="processes")
@@ -0,0 +1,66 @@
+import numpy as np
+import speedystats
+
+test_axes = [None, 0, 2, (0, 1), (1, 2), (0, 2)]
+
+
+def test_quartiles(random_3d):
+    for axis in test_axes:
+        assert np.array_equal(
+            speedystats.quartiles(random_3d, axis=axis),
+            np.percentile(random_3d, [25, 50, 75], axis=axis),
+        )
+    # Non-contiguous input
+    data = random_3d[:, ::2]
+    assert np.array_equal(
+        speedystats.quartiles(data, axis=1), np.percentile(data, [25, 50, 75], axis=1)
+    )
+
+
+def test_quartiles_small_and_tied():
+    # Every length up to a few times the nesting, with ties
+    rng = np.random.default_rng(0)
+    for n in range(1, 20):
+        data = rng.integers(0, 4, size=(3, n))
+        assert np.array_equal(
+            speedystats.quartiles(data, axis=1),
+            np.percentile(data, [25, 50, 75], axis=1),
+        )
+
+
+def test_quartiles_keepdims(random_3d):
+    assert speedystats.quartiles(random_3d, axis=1, keepdims=True).shape == (
+        3,
+        10,
+        1,
+        10,
+    )
+    assert speedystats.quartiles(random_3d).shape == (3,)
+
+
+def test_iqr(random_3d):
+    for axis in test_axes:
+        q1, q3 = np.percentile(random_3d, [25, 75], axis=axis)
+        assert np.allclose(speedystats.iqr(random_3d, axis=axis), q3 - q1)
+
+
+def test_nan_variants(random_3d_with_nan):
+    for axis in test_axes:
+        expected = np.nanpercentile(random_3d_with_nan, [25, 50, 75], axis=axis)
+        assert np.array_equal(
+            speedystats.nanquartiles(random_3d_with_nan, axis=axis), expected
+        )
+        assert np.allclose(
+            speedystats.naniqr(random_3d_with_nan, axis=axis), expected[2] - expected[0]
+        )
+
+
+def test_nan_propagation(random_3d_with_nan):
+    expected = np.isnan(np.mean(random_3d_with_nan, axis=2))
+    assert np.array_equal(
+        np.isnan(speedystats.quartiles(random_3d_with_nan, axis=2)),
+        np.broadcast_to(expected, (3,) + expected.shape),
+    )
+    assert np.array_equal(
+        np.isnan(speedystats.iqr(random_3d_with_nan, axis=2)), expected
+    )
@@ -0,0 +1,100 @@
+import numpy as np
+import speedystats
+
+
+def reference_trim_mean(data, proportion):
+    data = np.sort(data[~np.isnan(data)])
+    cut = int(proportion * data.size)
+    return np.mean(data[cut : data.size - cut])
+
+
+def reference_winsorized_mean(data, proportion):
+    data = np.sort(data[~np.isnan(data)])
+    cut = int(proportion * data.size)
+    data[:cut] = data[cut]
+    data[data.size - cut :] = data[data.size - cut - 1]
+    return np.mean(data)
+
+
+def reference_median_abs_deviation(data):
+    data = data[~np.isnan(data)]
+    return np.median(np.abs(data - np.median(data)))
+
+
+def reference(func, data, axis, *args):
+    """Apply a 1D reference function over the reduced axes of data"""
+    if axis is None:
+        return func(data.ravel(), *args)
+    axis = (axis,) if isinstance(axis, int) else axis
+    keep_axes = [a for a in range(data.ndim) if a not in axis]
+    data = np.transpose(data, keep_axes + list(axis))
+    data = np.reshape(data, data.shape[: len(keep_axes)] + (-1,))
+    return np.apply_along_axis(func, -1, data, *args)
+
+
+test_axes = [None, 0, 2, (0, 1), (1, 2)]
+
+
+def test_trim_mean(random_3d):
+    for axis in test_axes:
+        for proportion in [0.0, 0.1, 0.25]:
+            assert np.allclose(
+                speedystats.trim_mean(random_3d, axis=axis, proportion=proportion),
+                reference(reference_trim_mean, random_3d, axis, proportion),
+            )
+    # Trimming with proportion=0 is just the mean
+    assert np.allclose(
+        speedystats.trim_mean(random_3d, axis=1, proportion=0.0),
+        np.mean(random_3d, axis=1),
+    )
+
+
+def test_winsorized_mean(random_3d):
+    for axis in test_axes:
+        for proportion in [0.0, 0.1, 0.25]:
+            assert np.allclose(
+                speedystats.winsorized_mean(
+                    random_3d, axis=axis, proportion=proportion
+                ),
+                reference(reference_winsorized_mean, random_3d, axis, proportion),
+            )
+
+
+def test_median_abs_deviation(random_3d):
+    for axis in test_axes:
+        assert np.allclose(
+            speedystats.median_abs_deviation(random_3d, axis=axis),
+            reference(reference_median_abs_deviation, random_3d, axis),
+        )
+
+
+def test_keepdims(random_3d):
+    for method in ["trim_mean", "winsorized_mean", "median_abs_deviation"]:
+        speedystat_method = getattr(speedystats, method)
+        assert speedystat_method(random_3d, axis=1, keepdims=True).shape == (10, 1, 10)
+        assert speedystat_method(random_3d, keepdims=True).shape == (1, 1, 1)
+
+
+def test_nan_variants(random_3d_with_nan):
+    for axis in test_axes:
+        assert np.allclose(
+            speedystats.nantrim_mean(random_3d_with_nan, axis=axis),
+            reference(reference_trim_mean, random_3d_with_nan, axis, 0.1),
+        )
+        assert np.allclose(
+            speedystats.nanwinsorized_mean(random_3d_with_nan, axis=axis),
+            reference(reference_winsorized_mean, random_3d_with_nan, axis, 0.1),
+        )
+        assert np.allclose(
+            speedystats.nanmedian_abs_deviation(random_3d_with_nan, axis=axis),
+            reference(reference_median_abs_deviation, random_3d_with_nan, axis),
+        )
+
+
+def test_nan_propagation(random_3d_with_nan):
+    for method in ["trim_mean", "winsorized_mean", "median_abs_deviation"]:
+        speedystat_method = getattr(speedystats, method)
+        expected = np.isnan(np.mean(random_3d_with_nan, axis=2))
+        assert np.array_equal(
+            np.isnan(speedystat_method(random_3d_with_nan, axis=2)), expected
+        )
@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+import speedystats
+
+sp = pytest.importorskip("scipy.sparse")
+
+
+moment_methods = ["sum", "mean", "var", "std", "nansum", "nanmean", "nanvar", "nanstd"]
+quantile_methods = ["median", "nanmedian"]
+
+
+def random_sparse(format, with_nan=False):
+    matrix = sp.random(300, 200, density=0.1, format=format, random_state=42)
+    matrix.data -= 0.5
+    if with_nan:
+        matrix.data[::97] = np.nan
+    return matrix
+
+
+@pytest.mark.parametrize("format", ["csr", "csc"])
+def test_sparse(format):
+    matrix = random_sparse(format)
+    dense = matrix.toarray()
+    for method in moment_methods + quantile_methods:
+        speedystat_method = getattr(speedystats, method)
+        np_method = getattr(np, method)
+        for axis in [None, 0, 1]:
+            result = speedystat_method(matrix, axis=axis)
+            assert isinstance(result, (float, np.ndarray))
+            assert np.allclose(result, np_method(dense, axis=axis))
+
+
+@pytest.mark.parametrize("format", ["csr", "csc"])
+def test_sparse_nan(format):
+    matrix = random_sparse(format, with_nan=True)
+    dense = matrix.toarray()
+    for method in moment_methods + quantile_methods:
+        speedystat_method = getattr(speedystats, method)
+        np_method = getattr(np, method)
+        for axis in [0, 1]:
+            assert np.allclose(
+                speedystat_method(matrix, axis=axis),
+                np_method(dense, axis=axis),
+                equal_nan=True,
+            )
+
+
+def test_sparse_quantiles():
+    matrix = random_sparse("csr", with_nan=True)
+    dense = matrix.toarray()
+    q = [0.1, 0.5, 0.9]
+    for axis in [None, 0, 1]:
+        assert np.allclose(
+            speedystats.nanquantile(matrix, axis=axis, q=q),
+            np.nanquantile(dense, q, axis=axis),
+        )
+        assert np.allclose(
+            speedystats.percentile(matrix, axis=axis, q=30, keepdims=True),
+            np.percentile(dense, 30, axis=axis, keepdims=True),
+            equal_nan=True,
+        )
+
+
+def test_sparse_integer_and_duplicates():
+    # Duplicate entries are summed, like scipy does when converting to dense
+    rows = np.array([0, 0, 1, 2, 2])
+    columns = np.array([1, 1, 0, 2, 2])
+    values = np.array([1, 2, 3, 4, 5], dtype=np.int64)
+    matrix = sp.csr_matrix((values, (rows, columns)), shape=(3, 4))
+    matrix.has_canonical_format = False
+    dense = matrix.toarray()
+    for method in ["sum", "var", "median"]:
+        assert np.allclose(
+            getattr(speedystats, method)(matrix, axis=1),
+            getattr(np, method)(dense, axis=1),
+        )
+
+
+def test_sparse_unsupported():
+    matrix = random_sparse("csr")
+    with pytest.raises(ValueError):
+        speedystats.ptp(matrix, axis=0)
+    with pytest.raises(ValueError):
+        speedystats.sum(matrix, axis=0, accuracy="kahan")
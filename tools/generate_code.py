@@ -4,21 +4,27 @@ Template for generating Numba functions.
 This is a template for generating Numba functions. It is used to generate the
 functions for the mean, std, and other functions that are used in the speedystats
 package. The template produces a function that computes a statistic from the
-numpy library using numba speedups using (nested) loops.
+numpy library using numba speedups using a parallel loop over the kept axes.
 
 An example of the template is shown below, we'll use it to discuss what's
 happening in the template generator function.
 ```python
-@nb.njit(parallel=True, fastmath=True, cache=True)
+@nb.njit(parallel=True, fastmath=True, nogil=True, cache=True)
 def numba_mean_keep01(data):
     '''Numba speedup for mean reducing all but axes (0, 1)'''
-    output = np.zeros((data.shape[0], date.shape[1]))
-    for n0 in nb.prange(data.shape[0]):
-        for n1 in nb.prange(data.shape[1]):
-            output[n0, n1] = np.mean(data[n0, n1])
+    output = np.zeros((data.shape[0], data.shape[1]))
+    for n in nb.prange(data.shape[0] * data.shape[1]):
+        n1 = n % data.shape[1]
+        n0 = n // data.shape[1]
+        output[n0, n1] = np.mean(data[n0, n1])
     return output
 ```
 
+When more than one axis is kept, the kept axes are flattened into a single
+parallel loop (and unraveled inside it). Numba only parallelizes the outermost
+prange of a nest, so nested loops would only use as many threads as the size of
+the first kept axis (e.g. 2 threads for a (2, 100000, N) array).
+
 Each numba function is compiled with nopython, parallel, fastmath, and cache.
 The function name indicates the statistic being computed and the axes that are
 _kept_ (not reduced!). This is important because it works for a numpy array
@@ -117,6 +123,10 @@ def generate_numba_function(
     parallel: bool,
     cache: bool,
     has_q_param: bool,
+    param_name: str = "q",
+    implementation: str = "np",
+    nogil: bool = True,
+    keep_dtype: bool = False,
 ) -> str:
     """
     Generate a Numba function that computes mean while keeping specified axes.
@@ -124,6 +134,12 @@ def generate_numba_function(
     Args:
         np_method: str, the name of the numpy method to use
         keep_axes: int or tuple of ints representing axes to keep
+        param_name: str, the name of the scalar parameter (if has_q_param)
+        implementation: str, the module providing the per-slice function
+            ("np" for numpy, "kernels" for speedystats.numba.kernels)
+        nogil: bool, whether the kernel releases the GIL
+        keep_dtype: bool, whether the output has the dtype of the data (rather
+            than float64)
 
     Returns:
         str: The generated function code as a string
@@ -137,15 +153,29 @@ def generate_numba_function(
     shape_dims = [f"data.shape[{i}]" for i in keep_axes]
     output_shape = ", ".join(shape_dims)
 
-    # Generate the nested loops
+    # Generate a single parallel loop over all kept axes
     indent = "    "
     loop_vars = [f"n{i}" for i in range(len(keep_axes))]
-    loop_ranges = [f"nb.prange(data.shape[{ax}])" for ax in keep_axes]
 
     loops = ""
-    for var, range_expr in zip(loop_vars, loop_ranges):
-        loops += f"{indent}for {var} in {range_expr}:\n"
+    if len(keep_axes) == 1:
+        loops += f"{indent}for n0 in nb.prange(data.shape[{keep_axes[0]}]):\n"
+        indent += "    "
+    else:
+        num_outputs = " * ".join(shape_dims)
+        loops += f"{indent}for n in nb.prange({num_outputs}):\n"
         indent += "    "
+        # Unravel the flat index into the kept axes, last axis first. Each step
+        # gets a new name: numba rejects reassigning the prange index (or a
+        # name aliasing it) inside the loop
+        index = "n"
+        for i in range(len(keep_axes) - 1, 0, -1):
+            loops += f"{indent}n{i} = {index} % data.shape[{keep_axes[i]}]\n"
+            if i > 1:
+                loops += f"{indent}rest{i} = {index} // data.shape[{keep_axes[i]}]\n"
+                index = f"rest{i}"
+            else:
+                loops += f"{indent}n0 = {index} // data.shape[{keep_axes[i]}]\n"
 
     # Generate the indexing for the output and input arrays
     out_index = ", ".join(loop_vars)
@@ -167,41 +197,113 @@ def generate_numba_function(
         fastmath = False
 
     # Create the function template
-    q_param = ", q" if has_q_param else ""
+    q_param = f", {param_name}" if has_q_param else ""
+    output_dtype = ", dtype=data.dtype" if keep_dtype else ""
     template = f'''
-@nb.njit(parallel={parallel}, fastmath={fastmath}, cache={cache})
+@nb.njit(parallel={parallel}, fastmath={fastmath}, nogil={nogil}, cache={cache})
 def {func_name}(data: np.ndarray{q_param}) -> np.ndarray:
     """Numba speedup for {np_method} reducing all but axes {keep_axes}"""
-    output = np.zeros(({output_shape}))
-{loops}{indent}output[{out_index}] = np.{np_method}(data[{data_index}{q_param}])
+    output = np.zeros(({output_shape}){output_dtype})
+{loops}{indent}output[{out_index}] = {implementation}.{np_method}(data[{data_index}]{q_param})
     return output
 '''
 
     return template
 
 
-def lookup_template(np_method, has_q_param):
-    q_param = ", q" if has_q_param else ""
+def lookup_template(np_method, has_q_param, param_name="q"):
+    q_param = f", {param_name}" if has_q_param else ""
     return f"""
 def get_{np_method}(data: np.ndarray, keep_axes: Tuple[int]{q_param}) -> np.ndarray:
 """
 
 
-def generate_numba_lookup(np_method, max_dims, has_q_param):
-    axis_combinations = get_all_combinations(max_dims)
-
-    template = lookup_template(np_method, has_q_param)
-    for keep_axes in axis_combinations:
-        q_param = ", q" if has_q_param else ""
-        func_name = get_func_name(np_method, keep_axes)
-        template += f"    if keep_axes == {keep_axes}:\n"
-        template += f"        return {func_name}(data{q_param})\n"
+def generate_numba_lookup(np_method, max_dims, has_q_param, param_name="q"):
+    q_param = f", {param_name}" if has_q_param else ""
+    template = lookup_template(np_method, has_q_param, param_name)
+    template += f"    if keep_axes not in KERNELS:\n"
+    template += f"        raise ValueError(f'Invalid data shape for {np_method}, received: {{keep_axes}}')\n"
+    template += f"    return KERNELS[keep_axes](data{q_param})\n"
+    return template
 
-    template += f"    raise ValueError(f'Invalid data shape for {np_method}, received: {{keep_axes}}')\n"
 
+def generate_kernel_table(np_method, max_dims):
+    """Generate the dict mapping kept axes to kernels (after the kernels are defined)."""
+    template = "\n\n# Kernel for each set of kept axes\nKERNELS = {\n"
+    for keep_axes in get_all_combinations(max_dims):
+        template += f"    {keep_axes}: {get_func_name(np_method, keep_axes)},\n"
+    template += "}\n"
     return template
 
 
+def get_accuracy_variants(method_name, method_config):
+    """
+    Get the names of the compensated summation variants of a method.
+
+    Each accuracy mode listed in the config (besides the default "fast") gets its
+    own set of kernels, named {method}_{mode}, for the method and its nan variant.
+
+    Args:
+        method_name: str, the name of the method
+        method_config: dict, the configuration of the method
+
+    Returns:
+        list: names of the accuracy variants
+    """
+    base_names = [method_name]
+    if method_config["has_nan_variant"]:
+        base_names.append(f"nan{method_name}")
+    return [
+        f"{base_name}_{mode}"
+        for base_name in base_names
+        for mode in method_config.get("accuracy_modes", [])
+    ]
+
+
+def get_interpolation_variants(method_name, method_config):
+    """
+    Get the names of the interpolation variants of a quantile method.
+
+    Methods with interpolation enabled in the config get a set of kernels, named
+    {method}_interpolated, for every interpolation method besides numpy's
+    default "linear" (which keeps the np.percentile / np.quantile kernels). Their
+    parameter is a (q, interpolation code) tuple.
+
+    Args:
+        method_name: str, the name of the method
+        method_config: dict, the configuration of the method
+
+    Returns:
+        list: names of the interpolation variants
+    """
+    if not method_config.get("interpolation", False):
+        return []
+    base_names = [method_name]
+    if method_config["has_nan_variant"]:
+        base_names.append(f"nan{method_name}")
+    return [f"{base_name}_interpolated" for base_name in base_names]
+
+
+def get_counting_variants(method_name, method_config):
+    """
+    Get the names of the counting variants of a quantile method.
+
+    Methods with counting enabled in the config get a set of kernels, named
+    {method}_counting, that compute the statistic of 8 and 16 bit integers by
+    counting. Integers have no NaNs, so the nan variant uses the same kernels.
+
+    Args:
+        method_name: str, the name of the method
+        method_config: dict, the configuration of the method
+
+    Returns:
+        list: names of the counting variants
+    """
+    if not method_config.get("counting", False):
+        return []
+    return [f"{method_name}_counting"]
+
+
 def get_all_combinations(max_dims):
     """
     Get all combinations of axes for a given number of dimensions.
@@ -228,13 +330,28 @@ def get_all_combinations(max_dims):
 
 
 @format_with_black
-def generate_module(np_method, max_dims, fastmath, parallel, cache, has_q_param):
+def generate_module(
+    np_method,
+    max_dims,
+    fastmath,
+    parallel,
+    cache,
+    has_q_param,
+    param_name="q",
+    implementation="np",
+    nogil=True,
+    keep_dtype=False,
+):
     """
     Generate a module containing all possible numba functions up to max_dims.
 
     Args:
         np_method: str, the name of the numpy method to use
         max_dims: maximum number of dimensions to consider
+        param_name: str, the name of the scalar parameter (if has_q_param)
+        implementation: str, the module providing the per-slice function
+        nogil: bool, whether the kernels release the GIL
+        keep_dtype: bool, whether the outputs have the dtype of the data
 
     Returns:
         str: Complete code containing all generated functions
@@ -251,15 +368,23 @@ def generate_module(np_method, max_dims, fastmath, parallel, cache, has_q_param)
                 parallel,
                 cache,
                 has_q_param,
+                param_name,
+                implementation,
+                nogil,
+                keep_dtype,
             )
         )
 
     complete_code = """from typing import Tuple
 import numba as nb
-import numpy as np\n\n"""
+import numpy as np\n"""
+    if implementation != "np":
+        complete_code += f"from . import {implementation}\n"
+    complete_code += "\n"
 
-    complete_code += generate_numba_lookup(np_method, max_dims, has_q_param)
+    complete_code += generate_numba_lookup(np_method, max_dims, has_q_param, param_name)
     complete_code += "\n".join(all_functions)
+    complete_code += generate_kernel_table(np_method, max_dims)
 
     return complete_code
 
@@ -269,15 +394,36 @@ def generate_speedystat_module(config):
     # Imports
     template = """
 from typing import Union, Iterable, Optional
+from math import prod
 import numpy as np
-from .routing import speedystat_route, get_max_dims, get_keep_axes
+from .parallel import kernel_threads
+from .routing import (
+    speedystat_route,
+    get_max_dims,
+    get_keep_axes,
+    get_accuracy_method,
+    get_interpolation_method,
+    get_counting_method,
+    get_pairwise_reduction,
+    get_contiguous_statistic,
+)
+from .numba import kernels
+from .numba.contiguous import contiguous_shape, get_contiguous, get_contiguous_tasks
+from .sparse import is_sparse, call_sparse
+from .masked import call_masked
+from .processes import call_processes
+from .nan_policy import get_nan_policy_method
+from .asynchronous import run_async
+from .calibration import use_numpy
+from . import instrumentation, copies
 """
 
     # This global variable is used to determine the maximum number of dimensions
     # supported by the fast implementations
     template += f"""MAX_DIMS = get_max_dims()\n\n"""
 
-    # Define the speedystats call function
+    # Define the speedystats call function, which records the call if
+    # instrumentation is enabled
     template += f"""
 def _call_speedystat(
     data: np.ndarray,
@@ -285,10 +431,97 @@ def _call_speedystat(
     axis: Optional[Union[int, Iterable[int]]] = None,
     keepdims: bool = False,
     q: Optional[float] = None,
+    accuracy: str = "fast",
+    deterministic: bool = False,
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
+    interpolation: str = "linear",
+    nan_policy: str = "propagate",
+) -> np.ndarray:
+    if not instrumentation.ENABLED:
+        return _dispatch_speedystat(data, method, axis, keepdims, q, accuracy, deterministic, where, num_threads, backend, interpolation, nan_policy)
+    record = instrumentation.start_call(data, method, axis, is_sparse(data))
+    out = _dispatch_speedystat(data, method, axis, keepdims, q, accuracy, deterministic, where, num_threads, backend, interpolation, nan_policy, record)
+    instrumentation.finish_call(record)
+    return out
+
+
+def _dispatch_speedystat(
+    data: np.ndarray,
+    method: str,
+    axis: Optional[Union[int, Iterable[int]]] = None,
+    keepdims: bool = False,
+    q: Optional[float] = None,
+    accuracy: str = "fast",
+    deterministic: bool = False,
+    where: Optional[np.ndarray] = None,
+    num_threads: Optional[int] = None,
+    backend: str = "threads",
+    interpolation: str = "linear",
+    nan_policy: str = "propagate",
+    record: Optional[instrumentation.CallRecord] = None,
 ) -> np.ndarray:
+    # nan_policy="omit" goes to the nan variant (unless a full reduction has no
+    # NaNs) and "raise" checks for NaNs first (see speedystats.nan_policy)
+    if nan_policy != "propagate":
+        method = get_nan_policy_method(data, method, axis, where, nan_policy)
+        if record is not None:
+            record.method = method
+
+    # Quantiles with another interpolation than numpy's default go to the
+    # selection kernels (which have no numpy equivalent, so every path below
+    # goes through numba)
+    if interpolation != "linear":
+        method, q = get_interpolation_method(method, interpolation, q)
+        if record is not None:
+            record.method = method
+
+    # Split the kept axes across worker processes (which call back into this
+    # function on their blocks), with num_threads setting the number of workers
+    if backend == "processes":
+        if where is not None or isinstance(data, np.ma.MaskedArray) or is_sparse(data):
+            raise ValueError("backend='processes' only supports unmasked numpy arrays")
+        if record is not None:
+            record.path = "processes"
+        return call_processes(
+            data, method, axis, keepdims, q, accuracy, deterministic, num_threads
+        )
+    if backend != "threads":
+        raise ValueError(f"backend must be 'threads' or 'processes', received: {{backend}}")
+
+    # scipy.sparse CSR / CSC matrices are reduced directly on their compressed
+    # arrays (in an order that doesn't depend on the threads, so deterministically)
+    if is_sparse(data):
+        if accuracy != "fast":
+            raise ValueError("Accuracy modes aren't supported for sparse inputs")
+        if where is not None:
+            raise ValueError("where= masks aren't supported for sparse inputs")
+        if record is not None:
+            record.path = "sparse"
+        return call_sparse(data, method, axis, keepdims, q, num_threads)
+
+    # Deterministic results need a summation order that doesn't depend on the
+    # number of threads or on fastmath, which is what the pairwise kernels use
+    if deterministic and accuracy == "fast":
+        accuracy = "pairwise"
+
+    # Use the compensated summation kernels if requested (these have no numpy
+    # equivalent, so the fallbacks below also go through numba)
+    if accuracy != "fast":
+        method = get_accuracy_method(method, accuracy)
+        if record is not None:
+            record.method = method
+
+    # Masked arrays and where= masks reduce the unmasked values only
+    if where is not None or isinstance(data, np.ma.MaskedArray):
+        if record is not None:
+            record.path = "masked"
+        return call_masked(data, method, axis, keepdims, q, where, num_threads, record)
+
     # If the axis is None, use the numpy fallback
     if axis is None:
-        return _fallback_speedystat(data, method, axis, keepdims, q)
+        return _fallback_speedystat(data, method, axis, keepdims, q, num_threads, record)
 
     # Identify the shape of the data and the axes to keep
     data_ndims = data.ndim
@@ -297,26 +530,56 @@ def _call_speedystat(
 
     # If no axes are kept, use the numpy fallback
     if not keep_axes:
-        return _fallback_speedystat(data, method, axis, keepdims, q)
+        return _fallback_speedystat(data, method, axis, keepdims, q, num_threads, record)
 
     # If the number of axes to keep isn't supported, use the numpy fallback
     if any(k >= MAX_DIMS for k in keep_axes):
-        return _fallback_speedystat(data, method, axis, keepdims, q)
+        return _fallback_speedystat(data, method, axis, keepdims, q, num_threads, record)
+
+    # Use numpy where calibrate() found it faster on this machine
+    if use_numpy(method, data_shape, keep_axes):
+        return _fallback_speedystat(data, method, axis, keepdims, q, num_threads, record)
+
+    # C-contiguous data with consecutive kept axes goes to the hand-written row
+    # and column kernels, which sweep memory in order instead of gathering
+    statistic = get_contiguous_statistic(method)
+    shape = None if statistic is None else contiguous_shape(data, keep_axes)
+    if shape is not None:
+        if record is not None:
+            record.path = "contiguous"
+        with kernel_threads(get_contiguous_tasks(shape), data.size, num_threads):
+            out = get_contiguous(data, shape, statistic)
+        out = np.reshape(out, tuple(data_shape[k] for k in keep_axes))
+        if keepdims:
+            out = np.expand_dims(out, axis)
+        return out
 
     # Reshape the data to be flattened along reducing axes
     last_axis = keep_axes[-1]
     if data_ndims > last_axis + 1:
         new_shape = data_shape[: last_axis + 1] + (-1,)
+        if record is not None or copies.POLICY != "ignore":
+            copies.check_copy(data, [range(last_axis + 1, data_ndims)], method, record)
         data = np.reshape(data, new_shape)
 
+    # Small integer types are reduced by counting, which doesn't copy each slice
+    num_outputs = prod(data_shape[k] for k in keep_axes)
+    length = data.size // num_outputs if num_outputs else 0
+    counting_method = get_counting_method(method, data.dtype, length)
+    if counting_method != method:
+        method = counting_method
+        if record is not None:
+            record.path = "counting"
+
     # Get the numba implementation and check if it has a q parameter
     func, has_q_param = speedystat_route(method)
 
-    # Call the numba implementation
-    if has_q_param:
-        out = func(data, keep_axes, q)
-    else:
-        out = func(data, keep_axes)
+    # Call the numba implementation, on as many threads as the output can use
+    with kernel_threads(num_outputs, data.size, num_threads):
+        if has_q_param:
+            out = func(data, keep_axes, q)
+        else:
+            out = func(data, keep_axes)
 
     # Reshape the output to match the original data shape if keepdims is True
     if keepdims:
@@ -328,7 +591,16 @@ def _call_speedystat(
     # Add a numpy fallback when the speedystats implementation isn't available
     # or won't be faster
     template += f"""
-def _fallback_speedystat(data: np.ndarray, method: str, axis: Optional[Union[int, Iterable[int]]] = None, keepdims: bool = False, q: Optional[float] = None) -> np.ndarray:
+def _fallback_speedystat(data: np.ndarray, method: str, axis: Optional[Union[int, Iterable[int]]] = None, keepdims: bool = False, q: Optional[float] = None, num_threads: Optional[int] = None, record: Optional[instrumentation.CallRecord] = None) -> np.ndarray:
+    # Methods that numpy doesn't provide have to go through the numba kernels
+    if not hasattr(np, method):
+        if record is not None:
+            record.path = "flattened"
+        return _flattened_speedystat(data, method, axis, keepdims, q, num_threads, record)
+
+    if record is not None:
+        record.path = "numpy"
+
     np_method = getattr(np, method)
     if q is not None:
         return np_method(data, axis=axis, keepdims=keepdims, q=q)
@@ -336,24 +608,97 @@ def _fallback_speedystat(data: np.ndarray, method: str, axis: Optional[Union[int
         return np_method(data, axis=axis, keepdims=keepdims)
 """
 
+    # Add a fallback for methods without a numpy equivalent, which moves all the
+    # kept axes to the front and reduces the data as a (kept, reduced) 2D array
+    template += f"""
+def _flattened_speedystat(data: np.ndarray, method: str, axis: Optional[Union[int, Iterable[int]]] = None, keepdims: bool = False, q: Optional[float] = None, num_threads: Optional[int] = None, record: Optional[instrumentation.CallRecord] = None) -> np.ndarray:
+    if axis is None:
+        keep_axes = ()
+    else:
+        keep_axes = get_keep_axes(axis, data.ndim)
+    reduce_axes = tuple(a for a in range(data.ndim) if a not in keep_axes)
+    keep_shape = tuple(data.shape[k] for k in keep_axes)
+
+    # Full pairwise reductions are split into fixed-size chunks that run in parallel
+    pairwise_reduction = get_pairwise_reduction(method)
+    if not keep_axes and pairwise_reduction is not None:
+        statistic, skipna = pairwise_reduction
+        num_chunks = -(-data.size // kernels.PAIRWISE_CHUNK)
+        if record is not None or copies.POLICY != "ignore":
+            copies.check_copy(data, [range(data.ndim)], method, record, stacklevel=7)
+        with kernel_threads(num_chunks, data.size, num_threads):
+            out = kernels.pairwise_reduction(np.ravel(data), statistic, skipna)
+        if keepdims:
+            out = np.reshape(out, (1,) * data.ndim)
+        return out
+
+    data = np.transpose(data, keep_axes + reduce_axes)
+    if record is not None or copies.POLICY != "ignore":
+        groups = [range(len(keep_axes)), range(len(keep_axes), data.ndim)]
+        copies.check_copy(data, groups, method, record, stacklevel=7)
+    data = np.reshape(data, (int(np.prod(keep_shape)), -1))
+
+    func, has_q_param = speedystat_route(method)
+    with kernel_threads(data.shape[0], data.size, num_threads):
+        if has_q_param:
+            out = func(data, (0,), q)
+        else:
+            out = func(data, (0,))
+
+    out = np.reshape(out, keep_shape)
+    if keepdims:
+        out = np.expand_dims(out, reduce_axes)
+    elif not keep_shape:
+        out = out[()]
+    return out
+"""
+
     # Then, for every method in the config, add a function so the user can just call
     # that directly -- and it will use _call_speedystat internally for dispatching
     for method_name in config["methods"]:
         if config["methods"][method_name]["has_q_param"]:
-            q_signature = ", q: Optional[float] = None"
-            q_call = ", q"
+            param_name = config["methods"][method_name].get("param_name", "q")
+            param_default = config["methods"][method_name].get("param_default")
+            if param_default is None:
+                q_signature = f", {param_name}: Optional[float] = None"
+            else:
+                q_signature = f", {param_name}: float = {param_default}"
+            q_call = f", {param_name}"
         else:
             q_signature = ""
             q_call = ""
-        template += f"""
-def {method_name}(data: np.ndarray, axis: Union[int, Iterable[int]] = None, keepdims: bool = False{q_signature},) -> np.ndarray:
-    return _call_speedystat(data, "{method_name}", axis, keepdims{q_call})
-"""
-        if config["methods"][method_name]["has_nan_variant"]:
-            nan_name = f"nan{method_name}"
+        if config["methods"][method_name].get("accuracy_modes"):
+            q_signature += ', accuracy: str = "fast", deterministic: bool = False'
+            q_call += ", accuracy=accuracy, deterministic=deterministic"
+        # The public argument is numpy's method=, which the dispatcher calls interpolation
+        interpolation_call = async_interpolation_call = ""
+        if config["methods"][method_name].get("interpolation", False):
+            q_signature += ', method: str = "linear"'
+            interpolation_call = ", interpolation=method"
+            async_interpolation_call = ", method=method"
+        q_signature += ", where: Optional[np.ndarray] = None"
+        q_call += ", where=where"
+        q_signature += ", num_threads: Optional[int] = None"
+        q_call += ", num_threads=num_threads"
+        q_signature += ', backend: str = "threads"'
+        q_call += ", backend=backend"
+        # Methods with a nan variant take a nan_policy (which the variant implies)
+        has_nan_variant = config["methods"][method_name]["has_nan_variant"]
+        names = [(method_name, has_nan_variant)]
+        if has_nan_variant:
+            names.append((f"nan{method_name}", False))
+        for name, has_nan_policy in names:
+            policy_signature = policy_call = ""
+            if has_nan_policy:
+                policy_signature = ', nan_policy: str = "propagate"'
+                policy_call = ", nan_policy=nan_policy"
             template += f"""
-def {nan_name}(data: np.ndarray, axis: Union[int, Iterable[int]] = None, keepdims: bool = False{q_signature},) -> np.ndarray:
-    return _call_speedystat(data, "{nan_name}", axis, keepdims{q_call})
+def {name}(data: np.ndarray, axis: Union[int, Iterable[int]] = None, keepdims: bool = False{q_signature}{policy_signature},) -> np.ndarray:
+    return _call_speedystat(data, "{name}", axis, keepdims{q_call}{interpolation_call}{policy_call})
+
+
+async def a{name}(data: np.ndarray, axis: Union[int, Iterable[int]] = None, keepdims: bool = False{q_signature}{policy_signature},) -> np.ndarray:
+    return await run_async({name}, data, axis, keepdims{q_call}{async_interpolation_call}{policy_call})
 """
 
     return template
@@ -362,48 +707,210 @@ def {nan_name}(data: np.ndarray, axis: Union[int, Iterable[int]] = None, keepdim
 @format_with_black
 def generate_routing_module(config):
     """Generate the routing module that maps numpy methods to their numba implementations."""
-    template = """from typing import Callable, Union, Iterable, Tuple
-from . import numba\n\n
+    template = """from typing import Callable, Union, Iterable, Tuple, Optional
+import numpy as np
+from . import numba
+from .numba.kernels import INTERPOLATION_METHODS, COUNTING_MIN_LENGTH\n\n
+"""
+
+    # The lookup tables are built once at import, so dispatch is a dict lookup
+    method_map = ""
+    kernel_map = ""
+    has_q_param = ""
+    for method_name in config["methods"]:
+        method_config = config["methods"][method_name]
+        names = [(method_name, method_config["has_q_param"])]
+        if method_config["has_nan_variant"]:
+            names.append((f"nan{method_name}", method_config["has_q_param"]))
+        for variant in get_accuracy_variants(method_name, method_config):
+            names.append((variant, False))
+        for variant in get_interpolation_variants(method_name, method_config):
+            names.append((variant, True))
+        for variant in get_counting_variants(method_name, method_config):
+            names.append((variant, method_config["has_q_param"]))
+        for name, q_param in names:
+            method_map += f'    "{name}": numba.{name}.get_{name},\n'
+            kernel_map += f'    "{name}": numba.{name}.KERNELS,\n'
+            has_q_param += f'    "{name}": {q_param},\n'
+
+    accuracy_modes = ""
+    interpolation_ranges = ""
+    counting_methods = ""
+    pairwise_reductions = ""
+    contiguous_statistics = ""
+    for method_name in config["methods"]:
+        method_config = config["methods"][method_name]
+        has_nan_variant = method_config["has_nan_variant"]
+        modes = method_config.get("accuracy_modes")
+        if modes:
+            accuracy_modes += f'    "{method_name}": {tuple(modes)},\n'
+            if has_nan_variant:
+                accuracy_modes += f'    "nan{method_name}": {tuple(modes)},\n'
+        if method_config.get("interpolation", False):
+            q_max = method_config["q_max"]
+            interpolation_ranges += f'    "{method_name}": {q_max},\n'
+            if has_nan_variant:
+                interpolation_ranges += f'    "nan{method_name}": {q_max},\n'
+        for variant in get_counting_variants(method_name, method_config):
+            counting_methods += f'    "{method_name}": "{variant}",\n'
+            if has_nan_variant:
+                counting_methods += f'    "nan{method_name}": "{variant}",\n'
+        if "pairwise" in method_config.get("accuracy_modes", []):
+            pairwise_reductions += (
+                f'    "{method_name}_pairwise": ("{method_name}", False),\n'
+            )
+            if has_nan_variant:
+                pairwise_reductions += (
+                    f'    "nan{method_name}_pairwise": ("{method_name}", True),\n'
+                )
+        statistic = method_config.get("contiguous")
+        if statistic is not None:
+            contiguous_statistics += f'    "{method_name}": "{statistic}",\n'
+            if method_config.get("contiguous_nan", False):
+                contiguous_statistics += f'    "nan{method_name}": "nan{statistic}",\n'
+
+    template += f"""
+# Function choosing the numba kernel for a set of kept axes, by method
+METHOD_MAP = {{
+{method_map}}}
+
+# Numba kernels by kept axes, by method
+KERNEL_MAP = {{
+{kernel_map}}}
+
+# Whether each method takes a scalar parameter (e.g. q)
+HAS_Q_PARAM = {{
+{has_q_param}}}
+
+# Compensated summation modes available for each method
+ACCURACY_MODES = {{
+{accuracy_modes}}}
+
+# Largest q of each method taking an interpolation method (see get_interpolation_method)
+INTERPOLATION_RANGES = {{
+{interpolation_ranges}}}
+
+# Kernels computing each method on 8 and 16 bit integers by counting
+COUNTING_METHODS = {{
+{counting_methods}}}
+
+# Statistic (and whether NaNs are skipped) of each pairwise summation method
+PAIRWISE_REDUCTIONS = {{
+{pairwise_reductions}}}
+
+# Statistic computed by the contiguous row / column kernels for each method
+CONTIGUOUS_STATISTICS = {{
+{contiguous_statistics}}}
 """
 
     # Add speedystat_route function
-    template += """def speedystat_route(np_method: str) -> Callable:
+    template += """
+def speedystat_route(np_method: str) -> Callable:
     \"\"\"Route numpy method names to their fast implementations.
-    
+
     Args:
         np_method: Name of the numpy method to route
-        
+
     Returns:
         Callable: The corresponding fast implementation
     \"\"\"
+    if np_method not in METHOD_MAP:
+        raise ValueError(f"No fast implementation available for {np_method}")
+    return METHOD_MAP[np_method], HAS_Q_PARAM[np_method]
 """
-    # Add routing logic for each method
-    template += "    method_map = {\n"
-    for method_name in config["methods"]:
-        template += f'        "{method_name}": numba.{method_name}.get_{method_name},\n'
-        # Add nan variant if it exists
-        if config["methods"][method_name]["has_nan_variant"]:
-            nan_name = f"nan{method_name}"
-            template += f'        "{nan_name}": numba.{nan_name}.get_{nan_name},\n'
-    template += "    }\n"
 
-    # Add has_q_param logic
-    template += "    has_q_param = {\n"
-    for method_name in config["methods"]:
-        template += f'        "{method_name}": {config["methods"][method_name]["has_q_param"]},\n'
-        # Add nan variant if it exists
-        if config["methods"][method_name]["has_nan_variant"]:
-            nan_name = f"nan{method_name}"
-            template += f'        "{nan_name}": {config["methods"][method_name]["has_q_param"]},\n'
-    template += "    }\n"
+    # Add get_accuracy_method function
+    template += """
+def get_accuracy_method(np_method: str, accuracy: str) -> str:
+    \"\"\"Get the name of the kernels computing a method with compensated summation.
 
-    # Add raise and return logic
-    template += """    
-    if np_method not in method_map:
-        raise ValueError(f"No fast implementation available for {np_method}")
-    if np_method not in has_q_param:
-        raise ValueError(f"No q param config available for {np_method}")
-    return method_map[np_method], has_q_param[np_method]
+    Args:
+        np_method: Name of the numpy method
+        accuracy: Summation mode ("pairwise" or "kahan")
+
+    Returns:
+        str: Name of the method to route to
+    \"\"\"
+    if accuracy not in ACCURACY_MODES.get(np_method, ()):
+        raise ValueError(f"accuracy={accuracy!r} is not available for {np_method}")
+    return f"{np_method}_{accuracy}"
+"""
+
+    # Add get_interpolation_method function
+    template += """
+def get_interpolation_method(np_method: str, interpolation: str, q: float) -> Tuple[str, Tuple[float, int]]:
+    \"\"\"Get the kernels computing a quantile with another interpolation than "linear".
+
+    Args:
+        np_method: Name of the numpy method (e.g. "percentile")
+        interpolation: Interpolation method, as in np.quantile(method=...)
+        q: Quantile or percentile
+
+    Returns:
+        str: Name of the method to route to
+        Tuple[float, int]: The parameter of its kernels
+    \"\"\"
+    if np_method not in INTERPOLATION_RANGES:
+        raise ValueError(f"method={interpolation!r} is not available for {np_method}")
+    if interpolation not in INTERPOLATION_METHODS:
+        raise ValueError(
+            f"method must be one of {tuple(INTERPOLATION_METHODS)}, received: {interpolation!r}"
+        )
+    if q is not None and not np.isscalar(q):
+        raise ValueError(f"method={interpolation!r} only supports a scalar q, received: {q}")
+    q_max = INTERPOLATION_RANGES[np_method]
+    if q is None or not 0 <= q <= q_max:
+        raise ValueError(f"q must be a number in the range [0, {q_max}], received: {q}")
+    return f"{np_method}_interpolated", (float(q), INTERPOLATION_METHODS[interpolation])
+"""
+
+    # Add get_counting_method function
+    template += """
+def get_counting_method(np_method: str, dtype: np.dtype, length: int) -> str:
+    \"\"\"Get the name of the counting kernels for a method, if they're faster.
+
+    Args:
+        np_method: Name of the method being routed
+        dtype: Dtype of the data
+        length: Number of elements reduced into each output
+
+    Returns:
+        str: Name of the method to route to (np_method if it isn't counted)
+    \"\"\"
+    if dtype.kind not in "iu" or dtype.itemsize > 2:
+        return np_method
+    if length < COUNTING_MIN_LENGTH * dtype.itemsize:
+        return np_method
+    return COUNTING_METHODS.get(np_method, np_method)
+"""
+
+    # Add get_pairwise_reduction function
+    template += """
+def get_pairwise_reduction(np_method: str) -> Optional[Tuple[str, bool]]:
+    \"\"\"Get the statistic computed by a pairwise method over a whole array.
+
+    Args:
+        np_method: Name of the method being routed
+
+    Returns:
+        Tuple[str, bool]: The statistic and whether NaNs are skipped, or None if
+            the method isn't a pairwise summation method
+    \"\"\"
+    return PAIRWISE_REDUCTIONS.get(np_method)
+"""
+
+    # Add get_contiguous_statistic function
+    template += """
+def get_contiguous_statistic(np_method: str) -> Optional[str]:
+    \"\"\"Get the statistic computed by the contiguous row / column kernels for a method.
+
+    Args:
+        np_method: Name of the method being routed
+
+    Returns:
+        str: Name of the statistic, or None if the method has no contiguous kernel
+    \"\"\"
+    return CONTIGUOUS_STATISTICS.get(np_method)
 """
 
     # Add get_max_dims function
@@ -420,14 +927,14 @@ def get_max_dims() -> int:
     # Add get_keep_axes function
     template += f"""
 def get_keep_axes(axis: Union[int, Iterable[int]], ndim: int) -> Tuple[int]:
-    keep_axes = list(range(ndim))
     if isinstance(axis, int):
-        axis = [axis]
+        axis = (axis,)
+    reduce_axes = set()
     for a in axis:
-        keep_axes.remove(a)
-
-    keep_axes = tuple(keep_axes)
-    return keep_axes
+        if not -ndim <= a < ndim:
+            raise ValueError(f"axis {{a}} is out of bounds for array of dimension {{ndim}}")
+        reduce_axes.add(a % ndim)
+    return tuple(k for k in range(ndim) if k not in reduce_axes)
 """
     return template
 
@@ -447,6 +954,14 @@ def generate_numba_init_file(config):
             nan_name = f"nan{method_name}"
             template += f"from .{nan_name} import get_{nan_name}\n"
 
+        # Add accuracy and interpolation variants if they exist
+        for variant in (
+            get_accuracy_variants(method_name, config["methods"][method_name])
+            + get_interpolation_variants(method_name, config["methods"][method_name])
+            + get_counting_variants(method_name, config["methods"][method_name])
+        ):
+            template += f"from .{variant} import get_{variant}\n"
+
     return template
 
 
@@ -461,10 +976,15 @@ def generate_init_file(config):
 
     # Add imports for each method
     for method_name in config["methods"]:
-        template += f"from .speedystats import {method_name}\n"
+        template += f"from .speedystats import {method_name}, a{method_name}\n"
         if config["methods"][method_name]["has_nan_variant"]:
             nan_name = f"nan{method_name}"
-            template += f"from .speedystats import {nan_name}\n"
+            template += f"from .speedystats import {nan_name}, a{nan_name}\n"
+
+    # Add imports for hand-written modules that don't follow the reduction template
+    for module_name, function_names in config.get("modules", {}).items():
+        for function_name in function_names:
+            template += f"from .{module_name} import {function_name}\n"
 
     return template
 
@@ -480,6 +1000,7 @@ if __name__ == "__main__":
     max_dims = config["meta"]["max_dimensions"]
     parallel = config["meta"]["parallel"]
     cache = config["meta"]["cache"]
+    nogil = config["meta"]["nogil"]
     numba_path = config["meta"]["output_path"] + "/numba"
     numba_init_path = os.path.join(numba_path, "__init__.py")
     init_path = config["meta"]["output_path"] + "/__init__.py"
@@ -521,7 +1042,11 @@ if __name__ == "__main__":
             fastmath=config["methods"][method_name]["fastmath"],
             parallel=parallel,
             cache=cache,
+            nogil=nogil,
             has_q_param=config["methods"][method_name]["has_q_param"],
+            param_name=config["methods"][method_name].get("param_name", "q"),
+            implementation=config["methods"][method_name].get("implementation", "np"),
+            keep_dtype=config["methods"][method_name].get("keep_dtype", False),
         )
 
         # Write code to output file
@@ -539,9 +1064,74 @@ if __name__ == "__main__":
                 fastmath=False,
                 parallel=parallel,
                 cache=cache,
+                nogil=nogil,
                 has_q_param=config["methods"][method_name]["has_q_param"],
+                param_name=config["methods"][method_name].get("param_name", "q"),
+                implementation=config["methods"][method_name].get(
+                    "implementation", "np"
+                ),
+                keep_dtype=config["methods"][method_name].get("keep_dtype", False),
             )
             output_file = os.path.join(numba_path, f"{nan_name}.py")
             with open(output_file, "w") as f:
                 f.write(code)
             print(f"Generated {output_file}")
+
+        # Compensated summation variants use kernels without fastmath, which
+        # would otherwise reassociate away the compensation
+        for variant in get_accuracy_variants(
+            method_name, config["methods"][method_name]
+        ):
+            code = generate_module(
+                np_method=variant,
+                max_dims=max_dims,
+                fastmath=False,
+                parallel=parallel,
+                cache=cache,
+                nogil=nogil,
+                has_q_param=False,
+                implementation="kernels",
+            )
+            output_file = os.path.join(numba_path, f"{variant}.py")
+            with open(output_file, "w") as f:
+                f.write(code)
+            print(f"Generated {output_file}")
+
+        # Interpolation variants select order statistics in the hand-written
+        # kernels, without fastmath (which could break the comparisons)
+        for variant in get_interpolation_variants(
+            method_name, config["methods"][method_name]
+        ):
+            code = generate_module(
+                np_method=variant,
+                max_dims=max_dims,
+                fastmath=False,
+                parallel=parallel,
+                cache=cache,
+                nogil=nogil,
+                has_q_param=True,
+                implementation="kernels",
+            )
+            output_file = os.path.join(numba_path, f"{variant}.py")
+            with open(output_file, "w") as f:
+                f.write(code)
+            print(f"Generated {output_file}")
+
+        # Counting variants read integer slices in place
+        for variant in get_counting_variants(
+            method_name, config["methods"][method_name]
+        ):
+            code = generate_module(
+                np_method=variant,
+                max_dims=max_dims,
+                fastmath=False,
+                parallel=parallel,
+                cache=cache,
+                nogil=nogil,
+                has_q_param=config["methods"][method_name]["has_q_param"],
+                implementation="kernels",
+            )
+            output_file = os.path.join(numba_path, f"{variant}.py")
+            with open(output_file, "w") as f:
+                f.write(code)
+            print(f"Generated {output_file}")